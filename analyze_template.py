@@ -2,93 +2,120 @@
 """
 Analyze the Hard Rock Digital PowerPoint template
 Extract layouts, colors, fonts, and design elements
+
+Usage: python analyze_template.py [--json | --stream | --layouts] [TEMPLATE]
 """
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
-import os
+import argparse
+import json
+from template_manifest import load_manifest
 
 template_path = "/home/user/test/HRD_PowerPoint-Template_v1.pptx"
 
-print("="*80)
-print("ANALYZING HARD ROCK DIGITAL POWERPOINT TEMPLATE")
-print("="*80)
 
-prs = Presentation(template_path)
+def describe_color(color):
+    """Return 'RGB(r, g, b) / #rrggbb' for explicit colors, or None for theme/unset colors"""
+    from pptx.enum.dml import MSO_COLOR_TYPE
+    if color.type != MSO_COLOR_TYPE.RGB:
+        return None
+    rgb = color.rgb
+    return f"RGB({rgb[0]}, {rgb[1]}, {rgb[2]}) / #{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
+
+
+def print_report(prs):
+    """Print the human-readable analysis"""
+    from pptx.enum.dml import MSO_FILL
+    print("="*80)
+    print("ANALYZING HARD ROCK DIGITAL POWERPOINT TEMPLATE")
+    print("="*80)
 
-print(f"\n📄 Presentation Properties:")
-print(f"   Slide Width: {prs.slide_width / 914400:.2f} inches")
-print(f"   Slide Height: {prs.slide_height / 914400:.2f} inches")
-print(f"   Number of slides: {len(prs.slides)}")
-print(f"   Number of slide layouts: {len(prs.slide_layouts)}")
+    print(f"\n📄 Presentation Properties:")
+    print(f"   Slide Width: {prs.slide_width / 914400:.2f} inches")
+    print(f"   Slide Height: {prs.slide_height / 914400:.2f} inches")
+    print(f"   Number of slides: {len(prs.slides)}")
+    print(f"   Number of slide layouts: {len(prs.slide_layouts)}")
 
-print(f"\n📐 Available Slide Layouts:")
-for idx, layout in enumerate(prs.slide_layouts):
-    print(f"   [{idx}] {layout.name}")
-    print(f"       Placeholders: {len(layout.placeholders)}")
-    for pidx, placeholder in enumerate(layout.placeholders):
-        try:
+    print(f"\n📐 Available Slide Layouts:")
+    for idx, layout in enumerate(prs.slide_layouts):
+        print(f"   [{idx}] {layout.name}")
+        print(f"       Placeholders: {len(layout.placeholders)}")
+        for placeholder in layout.placeholders:
             print(f"         - [{placeholder.placeholder_format.idx}] {placeholder.name} ({placeholder.placeholder_format.type})")
-        except:
-            print(f"         - Placeholder {pidx}")
-
-print(f"\n🎨 Analyzing Slides in Template:")
-for slide_idx, slide in enumerate(prs.slides):
-    print(f"\n   Slide {slide_idx + 1}:")
-
-    # Check background
-    try:
-        if slide.background.fill.type:
-            print(f"      Background: {slide.background.fill.type}")
-            if hasattr(slide.background.fill, 'fore_color'):
-                try:
-                    rgb = slide.background.fill.fore_color.rgb
-                    print(f"      Background Color: RGB({rgb[0]}, {rgb[1]}, {rgb[2]}) / #{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}")
-                except:
-                    print(f"      Background Color: (theme-based)")
-    except:
-        print(f"      Background: Standard")
-
-    # Analyze shapes
-    print(f"      Shapes: {len(slide.shapes)}")
-    for shape_idx, shape in enumerate(slide.shapes):
-        shape_type = type(shape).__name__
-        print(f"         [{shape_idx}] {shape_type}: {shape.name if hasattr(shape, 'name') else 'unnamed'}")
-
-        # Check if it has text
-        if hasattr(shape, 'text_frame') and shape.has_text_frame:
-            text = shape.text_frame.text[:50] if shape.text_frame.text else "(empty)"
-            print(f"             Text: {text}")
-
-            # Check font properties
-            for para in shape.text_frame.paragraphs:
-                for run in para.runs:
-                    if run.text.strip():
-                        print(f"             Font: {run.font.name if run.font.name else 'default'}")
-                        print(f"             Size: {run.font.size.pt if run.font.size else 'default'} pt")
-                        try:
-                            if run.font.color.type:
-                                rgb = run.font.color.rgb
-                                print(f"             Color: RGB({rgb[0]}, {rgb[1]}, {rgb[2]}) / #{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}")
-                        except:
-                            print(f"             Color: theme-based")
-                        break
-                break
-
-        # Check fill color
-        if hasattr(shape, 'fill'):
-            try:
-                if shape.fill.type:
-                    print(f"             Fill Type: {shape.fill.type}")
-                    if hasattr(shape.fill, 'fore_color'):
-                        try:
-                            rgb = shape.fill.fore_color.rgb
-                            print(f"             Fill Color: RGB({rgb[0]}, {rgb[1]}, {rgb[2]}) / #{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}")
-                        except:
-                            pass
-            except:
-                pass
-
-print("\n" + "="*80)
-print("ANALYSIS COMPLETE")
-print("="*80)
+
+    print(f"\n🎨 Analyzing Slides in Template:")
+    for slide_idx, slide in enumerate(prs.slides):
+        print(f"\n   Slide {slide_idx + 1}:")
+
+        # Check background
+        fill = slide.background.fill
+        if fill.type:
+            print(f"      Background: {fill.type}")
+            if fill.type == MSO_FILL.SOLID:
+                print(f"      Background Color: {describe_color(fill.fore_color) or '(theme-based)'}")
+        else:
+            print(f"      Background: Standard")
+
+        # Analyze shapes
+        print(f"      Shapes: {len(slide.shapes)}")
+        for shape_idx, shape in enumerate(slide.shapes):
+            shape_type = type(shape).__name__
+            print(f"         [{shape_idx}] {shape_type}: {shape.name if hasattr(shape, 'name') else 'unnamed'}")
+
+            # Check if it has text
+            if shape.has_text_frame:
+                text = shape.text_frame.text[:50] if shape.text_frame.text else "(empty)"
+                print(f"             Text: {text}")
+
+                # Check font properties of the first non-blank run
+                runs = [run for run in shape.text_frame.paragraphs[0].runs if run.text.strip()]
+                if runs:
+                    run = runs[0]
+                    print(f"             Font: {run.font.name if run.font.name else 'default'}")
+                    print(f"             Size: {run.font.size.pt if run.font.size else 'default'} pt")
+                    if run.font.color.type:
+                        print(f"             Color: {describe_color(run.font.color) or 'theme-based'}")
+
+            # Check fill color (pictures, groups and graphic frames have no fill)
+            shape_fill = getattr(shape, "fill", None)
+            if shape_fill is not None and shape_fill.type:
+                print(f"             Fill Type: {shape_fill.type}")
+                if shape_fill.type == MSO_FILL.SOLID:
+                    color = describe_color(shape_fill.fore_color)
+                    if color:
+                        print(f"             Fill Color: {color}")
+
+    print("\n" + "="*80)
+    print("ANALYSIS COMPLETE")
+    print("="*80)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze the HRD PowerPoint template")
+    parser.add_argument("template", nargs="?", default=template_path)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--json", action="store_true", help="emit the cached, versioned JSON manifest instead")
+    mode.add_argument("--stream", action="store_true", help="stream parts out of the zip without building the object model")
+    mode.add_argument("--layouts", action="store_true", help="list layout indices and names from the cached manifest")
+    args = parser.parse_args()
+
+    if args.stream:
+        from stream_analyzer import analyze_archive
+        print(json.dumps(analyze_archive(args.template), indent=2, ensure_ascii=False))
+        return
+
+    if args.json:
+        print(json.dumps(load_manifest(args.template), indent=2))
+        return
+
+    if args.layouts:
+        for layout in load_manifest(args.template)["layouts"]:
+            placeholders = ", ".join(str(ph["idx"]) for ph in layout["placeholders"]) or "none"
+            print(f"[{layout['index']}] {layout['name']} (placeholders: {placeholders})")
+        return
+
+    from template_cache import load_template
+    print_report(load_template(args.template))
+
+
+if __name__ == "__main__":
+    main()
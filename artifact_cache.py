@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of rendered decks
+Keyed on spec hash + template hash + library/renderer version, with size-based LRU eviction
+
+Usage: python artifact_cache.py [--stats | --evict | --clear]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from deck_spec import data_sources
+from reproducible import code_hash
+from template_cache import CACHE_DIR, TEMPLATE_PATH, template_hash, write_atomic
+
+ARTIFACT_DIR = os.path.join(CACHE_DIR, "artifacts")
+MAX_BYTES = int(os.environ.get("HRD_PPTX_ARTIFACT_CACHE_BYTES", 1 << 30))
+
+# Spec fields that do not change the rendered bytes
+IGNORED_SPEC_FIELDS = ("output", "name")
+
+
+def artifact_key(spec):
+    """Return the cache key for a spec: content, template, python-pptx version and renderer code"""
+    import pptx
+    content = {key: value for key, value in spec.items() if key not in IGNORED_SPEC_FIELDS}
+    template = None
+    if spec.get("renderer", "template") == "template":
+        template = template_hash(spec.get("template", TEMPLATE_PATH))
+    # Data-bound slides depend on their metrics files' contents, not just their names
+    data = {path: template_hash(path) for path in data_sources(spec)}
+    payload = json.dumps(
+        {"spec": content, "template": template, "data": data, "python-pptx": pptx.__version__, "code": code_hash()},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def artifact_path(key):
+    return os.path.join(ARTIFACT_DIR, f"{key}.pptx")
+
+
+def load(key):
+    """Return a cached deck's bytes, or None on a miss"""
+    cached = artifact_path(key)
+    try:
+        with open(cached, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    # Mark as recently used for LRU eviction
+    os.utime(cached)
+    return data
+
+
+def put(key, data, max_bytes=MAX_BYTES):
+    """Store deck bytes under key, then evict down to max_bytes"""
+    write_atomic(artifact_path(key), data)
+    evict(max_bytes)
+
+
+def _entries(directory=ARTIFACT_DIR, suffix=".pptx"):
+    """Return [(mtime, size, path)] for every cached file under a directory (suffix may be a tuple)"""
+    entries = []
+    for root, _, names in os.walk(directory):
+        for name in names:
+            if name.endswith(suffix):
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+    return entries
+
+
+def evict(max_bytes=MAX_BYTES, directory=ARTIFACT_DIR, suffix=".pptx"):
+    """Delete least-recently-used files until a cache directory fits in max_bytes; returns bytes freed
+
+    Readers mark entries as used by touching them (see load), so mtime orders them by last use.
+    """
+    entries = sorted(_entries(directory, suffix))
+    total = sum(size for _, size, _ in entries)
+    freed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        freed += size
+    return freed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the rendered-deck cache")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--stats", action="store_true", help="show entry count and size (default)")
+    action.add_argument("--evict", action="store_true", help=f"evict down to HRD_PPTX_ARTIFACT_CACHE_BYTES ({MAX_BYTES})")
+    action.add_argument("--clear", action="store_true", help="delete every cached deck")
+    args = parser.parse_args()
+
+    if args.clear:
+        freed = evict(0)
+        print(f"🧹 Cleared {freed / 1e6:.1f} MB")
+    elif args.evict:
+        freed = evict()
+        print(f"🧹 Evicted {freed / 1e6:.1f} MB")
+    entries = _entries()
+    print(f"📦 {len(entries)} decks, {sum(size for _, size, _ in entries) / 1e6:.1f} MB in {ARTIFACT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
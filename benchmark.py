@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Benchmark deck generation throughput and memory
+Drives the real generator helpers on synthetic decks and stores results as JSON per commit
+
+Usage: python benchmark.py [--sizes 10,100,1000] [--cases v1,v2,startup,...] [--template PATH]
+       python benchmark.py --compare OLD.json NEW.json
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from queue import Empty
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_results")
+DEFAULT_SIZES = (10, 100, 1000)
+# A result is flagged when it gets this much worse than the baseline
+REGRESSION_THRESHOLD = 0.10
+
+# Trivial commands whose interpreter-to-first-output time is tracked by the "startup" case
+STARTUP_COMMANDS = {
+    "validate_spec": ["deck_spec.py", "specs/state_of_security_2026_v2.json"],
+    "list_layouts": ["analyze_template.py", "--layouts", "{template}"],
+    "cache_stats": ["artifact_cache.py", "--stats"],
+    "batch_help": ["render_batch.py", "--help"],
+}
+STARTUP_RUNS = 7
+
+
+def synthetic_items(slide_number, count=12):
+    """Return bullet items with a mix of headings and level-1 sub-bullets"""
+    items = []
+    for i in range(count):
+        if i % 4 == 0:
+            items.append(f"📊 Section {slide_number}.{i}: synthetic heading")
+        else:
+            items.append(f"   • Synthetic bullet {i} with enough text to wrap on a narrow column")
+    return items
+
+
+def _peak_rss_mb():
+    """Return this process's peak resident set size in MiB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def case_template_load(slides, template):
+    """Load the template `slides` times through the snapshot cache"""
+    from template_cache import load_template
+    start = time.perf_counter()
+    for _ in range(slides):
+        load_template(template)
+    return {"build_s": time.perf_counter() - start}
+
+
+def case_slide_clearing(slides, template):
+    """Compare the old one-at-a-time clearing loop with the empty-deck mode, `slides` times"""
+    from template_cache import load_template
+    start = time.perf_counter()
+    for _ in range(slides):
+        prs = load_template(template)
+        while len(prs.slides) > 0:
+            rId = prs.slides._sldIdLst[0].rId
+            prs.part.drop_rel(rId)
+            del prs.slides._sldIdLst[0]
+    loop_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(slides):
+        load_template(template, empty=True)
+    return {"build_s": time.perf_counter() - start, "clearing_loop_s": loop_s}
+
+
+def case_v1(slides, template):
+    """Build a branded deck with add_title_slide/add_content_slide/add_two_column_slide"""
+    import create_security_townhall as v1
+    prs = v1.new_presentation()
+    start = time.perf_counter()
+    for n in range(slides):
+        kind = n % 3
+        if kind == 0:
+            v1.add_title_slide(prs, f"Synthetic title {n}", "Benchmark subtitle")
+        elif kind == 1:
+            v1.add_content_slide(prs, f"Synthetic content {n}", synthetic_items(n))
+        else:
+            v1.add_two_column_slide(prs, f"Synthetic columns {n}", synthetic_items(n, 8), synthetic_items(n, 8))
+    return {"build_s": time.perf_counter() - start, "prs": prs}
+
+
+def case_v2(slides, template):
+    """Build a template deck with set_placeholder_text/add_bullet_points"""
+    import create_security_townhall_v2 as v2
+    from template_cache import load_template
+    from placeholder_index import add_slide, placeholder
+    prs = load_template(template, empty=True)
+    start = time.perf_counter()
+    for n in range(slides):
+        if n % 3 == 2:
+            slide = add_slide(prs, 8)
+            v2.set_placeholder_text(slide, 0, f"Synthetic columns {n}", font_size=32, bold=True)
+            v2.add_bullet_points(placeholder(slide, 1).text_frame, synthetic_items(n, 8), font_size=14)
+            v2.add_bullet_points(placeholder(slide, 2).text_frame, synthetic_items(n, 8), font_size=14)
+        else:
+            slide = add_slide(prs, 1)
+            v2.set_placeholder_text(slide, 0, f"Synthetic content {n}", font_size=36, bold=True)
+            v2.add_bullet_points(placeholder(slide, 1).text_frame, synthetic_items(n), font_size=16)
+    return {"build_s": time.perf_counter() - start, "prs": prs}
+
+
+def _stream_case(slides, template, workers):
+    """Build the v2 deck shape through the streaming writer, straight to a file"""
+    from stream_build import build_streaming
+    spec = {"renderer": "template", "template": template, "slides": []}
+    for n in range(slides):
+        if n % 3 == 2:
+            spec["slides"].append({"type": "two_column", "layout": 8, "title": f"Synthetic columns {n}",
+                                   "left": synthetic_items(n, 8), "right": synthetic_items(n, 8), "font_size": 14})
+        else:
+            spec["slides"].append({"type": "content", "layout": 1, "title": f"Synthetic content {n}",
+                                   "items": synthetic_items(n), "font_size": 16})
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "stream.pptx")
+        start = time.perf_counter()
+        build_streaming(spec, output, workers)
+        return {"build_s": time.perf_counter() - start, "output_bytes": os.path.getsize(output)}
+
+
+def case_stream(slides, template):
+    """Streaming build, one process"""
+    return _stream_case(slides, template, 1)
+
+
+def case_stream_parallel(slides, template):
+    """Streaming build with slides built by one worker process per core"""
+    return _stream_case(slides, template, os.cpu_count())
+
+
+CASES = {
+    "template_load": case_template_load,
+    "slide_clearing": case_slide_clearing,
+    "v1": case_v1,
+    "v2": case_v2,
+    "stream": case_stream,
+    "stream_parallel": case_stream_parallel,
+}
+TEMPLATE_CASES = ("template_load", "slide_clearing", "v2", "stream", "stream_parallel")
+
+
+def _run_case(name, slides, template, queue):
+    """Run one case in a fresh process and report timings and peak RSS (or the error it raised)"""
+    try:
+        result = _measure_case(name, slides, template)
+    except BaseException:
+        queue.put({"error": traceback.format_exc()})
+        raise
+    queue.put(result)
+
+
+def _measure_case(name, slides, template):
+    result = CASES[name](slides, template)
+    prs = result.pop("prs", None)
+    if prs is not None:
+        out = io.BytesIO()
+        start = time.perf_counter()
+        prs.save(out)
+        result["save_s"] = time.perf_counter() - start
+        result["output_bytes"] = out.tell()
+    result["slides_per_s"] = slides / result["build_s"] if result["build_s"] else None
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+class CaseError(RuntimeError):
+    """Raised when a benchmark case fails or its process dies without reporting"""
+
+
+def run_case(name, slides, template):
+    """Run a case in a spawned process so peak RSS is not polluted by earlier cases"""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_run_case, args=(name, slides, template, queue))
+    process.start()
+    try:
+        while True:
+            try:
+                result = queue.get(timeout=1)
+                break
+            except Empty:
+                # A child killed outright (segfault, OOM) never puts anything on the queue
+                if not process.is_alive():
+                    raise CaseError(f"{name} ({slides} slides): process exited with code {process.exitcode}") from None
+    finally:
+        process.join()
+    if "error" in result:
+        raise CaseError(f"{name} ({slides} slides) failed:\n{result['error']}")
+    return {"case": name, "slides": slides, **result}
+
+
+def time_to_first_output(argv):
+    """Return seconds from launching `python argv...` until its first line of output"""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, *argv], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+    process.stdout.readline()
+    elapsed = time.perf_counter() - start
+    process.communicate()
+    return elapsed
+
+
+def run_startup(template):
+    """Time each startup command STARTUP_RUNS times and report the median"""
+    results = []
+    for name, argv in STARTUP_COMMANDS.items():
+        if "{template}" in argv and not os.path.exists(template):
+            continue
+        argv = [arg.format(template=template) for arg in argv]
+        times = sorted(time_to_first_output(argv) for _ in range(STARTUP_RUNS))
+        results.append({"case": f"startup:{name}", "slides": 0, "startup_s": times[len(times) // 2]})
+    return results
+
+
+def git_commit():
+    """Return the current commit hash, or 'unknown' outside a git checkout"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)), stderr=subprocess.DEVNULL, text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(old_path, new_path):
+    """Print per-case deltas between two result files; returns True if anything regressed"""
+    with open(old_path) as f:
+        old = {(r["case"], r["slides"]): r for r in json.load(f)["results"]}
+    with open(new_path) as f:
+        new = json.load(f)["results"]
+
+    regressed = False
+    for result in new:
+        baseline = old.get((result["case"], result["slides"]))
+        if baseline is None:
+            continue
+        for metric in ("build_s", "save_s", "peak_rss_mb", "startup_s"):
+            if result.get(metric) is None or not baseline.get(metric):
+                continue
+            change = (result[metric] - baseline[metric]) / baseline[metric]
+            flag = ""
+            if change > REGRESSION_THRESHOLD:
+                flag = "  ⚠️ regression"
+                regressed = True
+            print(f"{result['case']:>15} {result['slides']:>6} {metric:>12}: {baseline[metric]:10.4f} -> {result[metric]:10.4f} ({change:+.1%}){flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark deck generation")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="comma-separated slide counts (e.g. 10,100,1000,10000)")
+    parser.add_argument("--cases", default=",".join([*CASES, "startup"]),
+                        help=f"comma-separated cases ({', '.join(CASES)}, startup)")
+    parser.add_argument("--template", default="/home/user/test/HRD_PowerPoint-Template_v1.pptx")
+    parser.add_argument("--output", default=None, help="result file (default: bench_results/<commit>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare) else 0)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    cases = args.cases.split(",")
+    unknown = [case for case in cases if case not in CASES and case != "startup"]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)} (expected {', '.join(CASES)}, startup)")
+    if not os.path.exists(args.template):
+        skipped = [case for case in cases if case in TEMPLATE_CASES]
+        if skipped:
+            print(f"⚠️  Template not found, skipping: {', '.join(skipped)}")
+        cases = [case for case in cases if case not in TEMPLATE_CASES]
+
+    results, failed = [], False
+    for case in cases:
+        if case == "startup":
+            for result in run_startup(args.template):
+                results.append(result)
+                print(f"🚀 {result['case']:>28}: {result['startup_s'] * 1000:7.1f} ms to first output")
+            continue
+        for slides in sizes:
+            try:
+                result = run_case(case, slides, args.template)
+            except CaseError as e:
+                print(f"❌ {e}")
+                failed = True
+                continue
+            results.append(result)
+            save = f", save {result['save_s']:.3f}s" if "save_s" in result else ""
+            print(f"📊 {case:>15} {slides:>6} slides: {result['slides_per_s']:10.1f} slides/s{save}, peak RSS {result['peak_rss_mb']:.1f} MiB")
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Results written to {output}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Hard Rock Digital brand colors and text styles
+Styles are registered once per text body as list styles that paragraphs inherit
+"""
+
+from pptx.dml.color import RGBColor
+from collections import namedtuple
+
+# Brand Colors from guidelines
+VIOLET_1 = RGBColor(106, 70, 243)  # Primary brand color
+VIOLET_2 = RGBColor(195, 37, 180)   # Secondary brand color
+BLUE_1 = RGBColor(15, 197, 222)
+BLUE_2 = RGBColor(16, 4, 88)
+BLUE_3 = RGBColor(63, 133, 238)
+WHITE = RGBColor(248, 248, 250)
+BLACK = RGBColor(26, 24, 27)
+
+# Series and tile colors, in order of use
+PALETTE = (VIOLET_1, BLUE_1, VIOLET_2, BLUE_3, BLUE_2)
+# Light VIOLET_1 tint for alternate table rows
+VIOLET_TINT = RGBColor(236, 232, 254)
+
+# One list-style level; None means "inherit from the layout/master"
+TextStyle = namedtuple("TextStyle", "size bold color space_before align", defaults=(None, None, None, None, None))
+
+# Style name -> {level: TextStyle}
+STYLES = {
+    # v1 branded slides
+    "hero_title": {0: TextStyle(size=54, bold=True, color=WHITE, align="ctr")},
+    "hero_subtitle": {0: TextStyle(size=24, color=WHITE, align="ctr")},
+    "title_bar": {0: TextStyle(size=32, bold=True, color=WHITE, align="l")},
+    "body": {0: TextStyle(size=18, color=BLACK, space_before=12)},
+    "column": {0: TextStyle(size=16, color=BLACK, space_before=10)},
+    "qa_title": {0: TextStyle(size=60, bold=True, color=WHITE, align="ctr")},
+    "qa_contact": {0: TextStyle(size=20, color=WHITE, align="ctr")},
+    # KPI tiles: value, label, change
+    "kpi_tile": {
+        0: TextStyle(size=40, bold=True, color=WHITE, align="ctr"),
+        1: TextStyle(size=16, color=WHITE, align="ctr"),
+        2: TextStyle(size=12, color=WHITE, space_before=6, align="ctr"),
+    },
+}
+
+
+def heading_style(size, bold=False):
+    """Return a single-level style for template placeholder titles"""
+    return {0: TextStyle(size=size, bold=bold or None)}
+
+
+def bullet_style(size, space_before=6, sub_size=None):
+    """Return a two-level style for template bullet lists (sub-bullets default to 2pt smaller)"""
+    return {
+        0: TextStyle(size=size, space_before=space_before),
+        1: TextStyle(size=sub_size if sub_size is not None else size - 2, space_before=space_before),
+    }
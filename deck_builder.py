@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Reentrant deck builder
+Each DeckBuilder owns its presentation; template snapshots, manifests and chrome prototypes are
+shared read-only, so independent builds can run side by side in threads of one process
+
+Usage: python deck_builder.py SPEC [SPEC ...] [-j THREADS]
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import copy
+import threading
+import time
+import deck_spec
+from reproducible import deterministic_bytes, save_deterministic
+from template_cache import TEMPLATE_PATH
+
+
+class DeckBuilder:
+    """One deck under construction
+
+    Slides are added as deck-spec entries (or through the title/content/two_column/qa
+    shortcuts); layout names and font_size "auto" are resolved per call. A builder may be
+    shared between threads, but calls on it are serialized.
+    """
+
+    def __init__(self, renderer="template", template=TEMPLATE_PATH, **options):
+        self.spec = {"renderer": renderer, "template": template, "slides": [], **options}
+        self.renderer = deck_spec.renderer_for(self.spec)
+        self.prs = self.renderer.new_presentation(self.spec)
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_spec(cls, spec):
+        """Return a builder with every slide of a deck spec already added"""
+        options = {key: value for key, value in spec.items() if key not in ("renderer", "template", "slides")}
+        builder = cls(spec.get("renderer", "template"), spec.get("template", TEMPLATE_PATH), **options)
+        builder.extend(spec["slides"])
+        return builder
+
+    def extend(self, slide_specs):
+        """Add slides from deck-spec entries, returning the new slides"""
+        slide_specs = list(slide_specs)
+        if not slide_specs:
+            return []
+        # Work on copies so caller-owned specs never see resolved layouts or sizes
+        batch = dict(self.spec, slides=copy.deepcopy(slide_specs))
+        deck_spec.validate_spec(batch, "builder")
+        with self._lock:
+            deck_spec.resolve_spec(batch)
+            slides = [self.renderer.render_slide(self.prs, slide_spec) for slide_spec in batch["slides"]]
+            self.spec["slides"].extend(batch["slides"])
+        return slides
+
+    def add(self, slide_spec):
+        """Add one slide from a deck-spec entry"""
+        return self.extend([slide_spec])[0]
+
+    def title(self, title, subtitle="", **fields):
+        return self.add({"type": "title", "title": title, "subtitle": subtitle, **fields})
+
+    def content(self, title, items, **fields):
+        return self.add({"type": "content", "title": title, "items": list(items), **fields})
+
+    def two_column(self, title, left, right, **fields):
+        return self.add({"type": "two_column", "title": title, "left": list(left), "right": list(right), **fields})
+
+    def image(self, title, image, **fields):
+        return self.add({"type": "image", "title": title, "image": image, **fields})
+
+    def qa(self, text="Questions & Discussion", **fields):
+        return self.add({"type": "qa", "text": text, **fields})
+
+    def __len__(self):
+        return len(self.prs.slides)
+
+    def to_bytes(self):
+        """Return the deck as reproducible .pptx bytes"""
+        with self._lock:
+            return deterministic_bytes(self.prs)
+
+    def save(self, path):
+        """Save the deck reproducibly"""
+        with self._lock:
+            return save_deterministic(self.prs, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build deck specs concurrently on threads of one process")
+    parser.add_argument("specs", nargs="+")
+    parser.add_argument("-j", "--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    def build(path):
+        start = time.perf_counter()
+        spec = deck_spec.load_spec(path)
+        builder = DeckBuilder.from_spec(spec)
+        output = deck_spec.output_path(spec)
+        builder.save(output)
+        return output, len(builder), time.perf_counter() - start
+
+    with ThreadPoolExecutor(args.threads) as pool:
+        for output, slide_count, seconds in pool.map(build, args.specs):
+            print(f"✅ {output} ({slide_count} slides, {seconds:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
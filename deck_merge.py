@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Zip-to-zip deck merge
+Slides of several decks are copied part by part into one package without building the object model: masters
+and layouts come once from the first deck, media and other slide parts are written once per content hash
+
+Usage: python deck_merge.py DECK [DECK ...] -o OUTPUT [--no-sections]
+"""
+
+from lxml import etree
+import argparse
+import hashlib
+import io
+import os
+import posixpath
+import time
+import zipfile
+import opc_zip
+from slide_parts import SHARED_PART_DIRS, PackageWriter, SlideFragment, SlidePart, part_key
+from template_cache import temporary_path
+
+P = f"{{{opc_zip.NS_P}}}"
+R = f"{{{opc_zip.NS_R}}}"
+CT = f"{{{opc_zip.NS_CT}}}"
+
+# Relationships into the shared masters; a slide whose target has no counterpart in the first deck cannot be merged
+SHARED_RELTYPES = (opc_zip.RT_SLIDE_LAYOUT, opc_zip.RT_SLIDE_MASTER, opc_zip.RT_NOTES_MASTER)
+
+
+class MergeError(ValueError):
+    """Raised when a deck cannot be merged onto the first deck's masters"""
+
+
+class SourceDeck:
+    """One input deck, read from its zip one part at a time (only .rels and content types are held)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.zip = zipfile.ZipFile(path)
+        self.rels = {name: self.zip.read(name) for name in self.zip.namelist() if name.endswith(".rels")}
+        types = etree.fromstring(self.zip.read(opc_zip.CONTENT_TYPES))
+        self.overrides = {el.get("PartName").lstrip("/"): el.get("ContentType") for el in types.iter(f"{CT}Override")}
+        self.defaults = {el.get("Extension").lower(): el.get("ContentType") for el in types.iter(f"{CT}Default")}
+        self._digests = {}
+
+    def read(self, partname):
+        return self.zip.read(partname)
+
+    def content_type(self, partname):
+        extension = posixpath.splitext(partname)[1][1:].lower()
+        return self.overrides.get(partname) or self.defaults.get(extension, "application/octet-stream")
+
+    def targets(self, partname):
+        """Return a part's relationships as (rId, reltype, target part name or URL, external)"""
+        return [
+            (rId, reltype, target if external else opc_zip.resolve_target(partname, target), external)
+            for rId, reltype, target, external in opc_zip.part_rels(self.rels, partname)
+        ]
+
+    def related(self, partname, reltype):
+        """Return the parts a part points at with one relationship type"""
+        return [target for _, rel_type, target, external in self.targets(partname) if rel_type == reltype and not external]
+
+    def digest(self, partname):
+        """Return the sha1 of a part's bytes"""
+        digest = self._digests.get(partname)
+        if digest is None:
+            digest = self._digests[partname] = hashlib.sha1(self.read(partname)).hexdigest()
+        return digest
+
+    def _key(self, partname, skipped):
+        """Hash a part together with the parts it points at directly, except through one relationship type"""
+        digest = hashlib.sha1(self.digest(partname).encode())
+        for _, reltype, target, external in sorted(self.targets(partname)):
+            if reltype != skipped:
+                digest.update((target if external else self.digest(target)).encode())
+        return digest.hexdigest()
+
+    def slides(self):
+        """Return slide part names in presentation order"""
+        rels = {rId: target for rId, _, target, _ in self.targets(opc_zip.PRESENTATION)}
+        presentation = etree.fromstring(self.read(opc_zip.PRESENTATION))
+        return [rels[sld_id.get(f"{R}id")] for sld_id in presentation.iter(f"{P}sldId")]
+
+    def layouts(self):
+        """Return {layout part name: (content key, layout name)} for the layouts of every master
+
+        Layouts only get the same key in two decks if they, their images and their master
+        (with its theme) are byte-identical.
+        """
+        found = {}
+        for master in self.related(opc_zip.PRESENTATION, opc_zip.RT_SLIDE_MASTER):
+            master_key = self._key(master, opc_zip.RT_SLIDE_LAYOUT)
+            for layout in self.related(master, opc_zip.RT_SLIDE_LAYOUT):
+                key = hashlib.sha1((master_key + self._key(layout, opc_zip.RT_SLIDE_MASTER)).encode()).hexdigest()
+                name = etree.fromstring(self.read(layout)).find(f"{P}cSld").get("name")
+                found[layout] = (key, name)
+        return found
+
+    def notes_master(self):
+        return next(iter(self.related(opc_zip.PRESENTATION, opc_zip.RT_NOTES_MASTER)), None)
+
+    def close(self):
+        self.zip.close()
+
+
+def base_package(source):
+    """Return the deck without its slides (or anything only they used) as package bytes"""
+    files = dict.fromkeys(source.zip.namelist())
+    files.update(source.rels)
+    files[opc_zip.CONTENT_TYPES] = source.read(opc_zip.CONTENT_TYPES)
+    rels_name = opc_zip.rels_name(opc_zip.PRESENTATION)
+    rels = [rel for rel in opc_zip.parse_rels(files[rels_name]) if rel[1] != opc_zip.RT_SLIDE]
+    files[rels_name] = opc_zip.serialize_rels(rels)
+
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_STORED) as zf:
+        for name, blob in opc_zip.prune_unreachable(files).items():
+            zf.writestr(name, blob if blob is not None else source.read(name))
+    return out.getvalue()
+
+
+def _detach(source, owner, slide, shared, numbers, skipped, parts):
+    """Return a source part's relationships as fragment tuples, reading private parts into `parts`"""
+    detached = []
+    for rId, reltype, target, external in sorted(source.targets(owner)):
+        if reltype in skipped:
+            continue
+        if external:
+            detached.append((rId, reltype, target, "external"))
+        elif target == slide:
+            detached.append((rId, reltype, None, "owner"))
+        elif target in shared:
+            detached.append((rId, reltype, shared[target], "base"))
+        elif target in numbers:
+            # Links to other slides of the same deck follow them into the merged deck
+            detached.append((rId, reltype, numbers[target], "slide"))
+        elif reltype in SHARED_RELTYPES:
+            raise MergeError(f"{source.path}: {owner} points at {target}, which has no counterpart in the first deck")
+        else:
+            child_rels = _detach(source, target, slide, shared, numbers, skipped, parts)
+            blob, content_type = source.read(target), source.content_type(target)
+            key = part_key(content_type, blob, child_rels)
+            parts.setdefault(key, SlidePart(target, content_type, blob, child_rels))
+            detached.append((rId, reltype, key, "part"))
+    return detached
+
+
+def slide_fragment(source, slide, shared, numbers, skipped=()):
+    """Detach one slide of a source deck into a SlideFragment
+
+    shared maps the source's layouts (and notes master) to part names in the base package;
+    numbers maps the source's slides to their 1-based position in the merged deck;
+    relationships of the skipped types are dropped.
+    """
+    parts = {}
+    rels = _detach(source, slide, slide, shared, numbers, skipped, parts)
+    return SlideFragment(source.read(slide), rels, parts)
+
+
+def _shared_parts(source, layouts_by_key, layouts_by_name, notes_master):
+    """Map a deck's layouts and notes master to the base's; returns (mapping, layouts matched only by name)"""
+    shared, by_name = {}, []
+    for layout, (key, name) in source.layouts().items():
+        if key in layouts_by_key:
+            shared[layout] = layouts_by_key[key]
+        elif name in layouts_by_name:
+            shared[layout] = layouts_by_name[name]
+            by_name.append(name)
+    source_notes_master = source.notes_master()
+    if source_notes_master and notes_master:
+        shared[source_notes_master] = notes_master
+    return shared, by_name
+
+
+def merge_decks(paths, output, sections=True):
+    """Merge decks, in order, onto the masters and layouts of the first; returns merge stats
+
+    A layout that is not byte-identical to one of the first deck's is matched by name, as
+    PowerPoint's "use destination theme" paste does. Speaker notes are kept when the first
+    deck has a notes master. With sections, each input deck becomes a named section.
+    """
+    start = time.perf_counter()
+    sources = [SourceDeck(path) for path in paths]
+    tmp_output = temporary_path(output)
+    try:
+        first = sources[0]
+        base_layouts = first.layouts()
+        layouts_by_key = {key: layout for layout, (key, _) in base_layouts.items()}
+        layouts_by_name = {}
+        for layout, (_, name) in base_layouts.items():
+            layouts_by_name.setdefault(name, layout)
+        notes_master = first.notes_master()
+        # Notes slides need a notes master to hang off
+        skipped = () if notes_master else (opc_zip.RT_NOTES_SLIDE,)
+
+        # Map every deck up front, so a missing layout fails before anything is written
+        plans, offset, matched_by_name = [], 0, {}
+        for source in sources:
+            shared, by_name = _shared_parts(source, layouts_by_key, layouts_by_name, notes_master)
+            slides = source.slides()
+            for number, slide in enumerate(slides, 1):
+                for layout in source.related(slide, opc_zip.RT_SLIDE_LAYOUT):
+                    if layout not in shared:
+                        raise MergeError(f"{source.path}: slide {number} uses layout "
+                                         f"'{source.layouts()[layout][1]}', which {first.path} does not have")
+            numbers = {slide: offset + number for number, slide in enumerate(slides, 1)}
+            plans.append((source, slides, shared, numbers))
+            matched_by_name[source.path] = by_name
+            offset += len(slides)
+
+        references, distinct = 0, set()
+        with PackageWriter(base_package(first), tmp_output) as writer:
+            for source, slides, shared, numbers in plans:
+                if sections:
+                    writer.add_section(os.path.splitext(os.path.basename(source.path))[0].replace("_", " "))
+                for slide in slides:
+                    fragment = slide_fragment(source, slide, shared, numbers, skipped)
+                    media = [key for key, part in fragment.parts.items() if part.partname.startswith(SHARED_PART_DIRS)]
+                    references += len(media)
+                    distinct.update(media)
+                    writer.add_slide(fragment)
+        os.replace(tmp_output, output)
+    finally:
+        for source in sources:
+            source.close()
+        if os.path.exists(tmp_output):
+            os.remove(tmp_output)
+
+    return {
+        "output": output,
+        "decks": len(paths),
+        "slides": offset,
+        "media": len(distinct),
+        "shared": references - len(distinct),
+        "matched_by_name": matched_by_name,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge decks built on the same template into one")
+    parser.add_argument("decks", nargs="+")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("--no-sections", action="store_true", help="do not mark each input deck as a section")
+    args = parser.parse_args()
+
+    try:
+        stats = merge_decks(args.decks, args.output, sections=not args.no_sections)
+    except MergeError as e:
+        raise SystemExit(f"❌ {e}")
+    for path, names in stats["matched_by_name"].items():
+        if names:
+            print(f"⚠️  {path}: layouts matched by name only: {', '.join(sorted(set(names)))}")
+    print(f"✅ {stats['output']}: {stats['slides']} slides from {stats['decks']} decks, "
+          f"{stats['media']} media files ({stats['shared']} duplicates shared) in {stats['seconds']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Post-save deck optimizer
+Strips layouts no slide uses, prunes unreachable parts, dedupes identical media and re-deflates the package
+
+Usage: python deck_optimize.py DECK [DECK ...] [-o OUTPUT] [--level 9] [--keep-layouts] [--json]
+"""
+
+from lxml import etree
+import argparse
+import hashlib
+import io
+import json
+import os
+import posixpath
+import time
+import zipfile
+import opc_zip
+from reproducible import write_package
+from slide_parts import SHARED_PART_DIRS
+from template_cache import write_atomic
+
+P = f"{{{opc_zip.NS_P}}}"
+R = f"{{{opc_zip.NS_R}}}"
+
+DEFAULT_LEVEL = 9
+
+
+def _serialize(element):
+    return etree.tostring(element, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _targets(files, partname, reltype):
+    """Return {rId: target part name} of a part's internal relationships of one type"""
+    return {
+        rId: opc_zip.resolve_target(partname, target)
+        for rId, rel_type, target, external in opc_zip.part_rels(files, partname)
+        if rel_type == reltype and not external
+    }
+
+
+def _drop_rels(files, partname, rIds):
+    """Remove relationships from a part's .rels"""
+    name = opc_zip.rels_name(partname)
+    kept = [rel for rel in opc_zip.parse_rels(files.get(name)) if rel[0] not in rIds]
+    files[name] = opc_zip.serialize_rels(kept)
+
+
+def strip_unused_layouts(files):
+    """Unlink layouts no slide uses, and masters left with none; returns (layouts, masters) removed
+
+    The parts themselves go when unreachable parts are pruned. Decks without slides
+    (templates) are left alone, and one master always remains.
+    """
+    slides = _targets(files, opc_zip.PRESENTATION, opc_zip.RT_SLIDE).values()
+    if not slides:
+        return 0, 0
+    used = {layout for slide in slides for layout in _targets(files, slide, opc_zip.RT_SLIDE_LAYOUT).values()}
+
+    layouts_removed = 0
+    emptied = []
+    masters = _targets(files, opc_zip.PRESENTATION, opc_zip.RT_SLIDE_MASTER)
+    for master_rId, master in masters.items():
+        root = etree.fromstring(files[master])
+        layouts = _targets(files, master, opc_zip.RT_SLIDE_LAYOUT)
+        unused = {rId for rId, layout in layouts.items() if layout not in used}
+        if not unused:
+            continue
+        if len(unused) == len(layouts):
+            emptied.append(master_rId)
+            continue
+        for layout_id in list(root.iter(f"{P}sldLayoutId")):
+            if layout_id.get(f"{R}id") in unused:
+                layout_id.getparent().remove(layout_id)
+        files[master] = _serialize(root)
+        _drop_rels(files, master, unused)
+        layouts_removed += len(unused)
+
+    # Masters whose layouts are all unused go entirely, as long as another master stays
+    if len(emptied) == len(masters):
+        emptied = emptied[1:]
+    if emptied:
+        presentation = etree.fromstring(files[opc_zip.PRESENTATION])
+        for master_id in list(presentation.iter(f"{P}sldMasterId")):
+            if master_id.get(f"{R}id") in emptied:
+                master_id.getparent().remove(master_id)
+        files[opc_zip.PRESENTATION] = _serialize(presentation)
+        _drop_rels(files, opc_zip.PRESENTATION, set(emptied))
+        layouts_removed += sum(len(_targets(files, masters[rId], opc_zip.RT_SLIDE_LAYOUT)) for rId in emptied)
+    return layouts_removed, len(emptied)
+
+
+def dedupe_media(files):
+    """Point every reference to a duplicate media part at one copy; returns the number of copies dropped"""
+    canonical, duplicates = {}, {}
+    for name in sorted(files):
+        if name.startswith(SHARED_PART_DIRS) and not name.endswith(".rels"):
+            digest = hashlib.sha1(files[name]).hexdigest()
+            keep = canonical.setdefault((digest, posixpath.splitext(name)[1].lower()), name)
+            if keep != name:
+                duplicates[name] = keep
+    if not duplicates:
+        return 0
+
+    for rels_name in [name for name in files if name.endswith(".rels")]:
+        owner = posixpath.join(posixpath.dirname(posixpath.dirname(rels_name)), posixpath.basename(rels_name)[:-5])
+        rels = opc_zip.parse_rels(files[rels_name])
+        changed = False
+        for number, (rId, reltype, target, external) in enumerate(rels):
+            resolved = None if external else opc_zip.resolve_target(owner, target)
+            if resolved in duplicates:
+                rels[number] = (rId, reltype, opc_zip.relative_target(owner, duplicates[resolved]), False)
+                changed = True
+        if changed:
+            files[rels_name] = opc_zip.serialize_rels(rels)
+    return len(duplicates)
+
+
+def optimize_bytes(data, level=DEFAULT_LEVEL, strip_layouts=True):
+    """Return (optimized package bytes, report dict) for a saved deck"""
+    start = time.perf_counter()
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        files = {name: zf.read(name) for name in zf.namelist()}
+    parts_before = len(files)
+
+    layouts, masters = strip_unused_layouts(files) if strip_layouts else (0, 0)
+    duplicates = dedupe_media(files)
+    files = opc_zip.prune_unreachable(files)
+    optimized = write_package(files, level)
+
+    return optimized, {
+        "before": len(data),
+        "after": len(optimized),
+        "saved": len(data) - len(optimized),
+        "layouts_removed": layouts,
+        "masters_removed": masters,
+        "duplicates_merged": duplicates,
+        "entries_removed": parts_before - len(files),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def optimize_file(path, output=None, level=DEFAULT_LEVEL, strip_layouts=True):
+    """Optimize a deck in place (or into output); returns the report"""
+    with open(path, "rb") as f:
+        data = f.read()
+    optimized, report = optimize_bytes(data, level, strip_layouts)
+    # A deck that is already optimal is not rewritten; a larger result is never kept
+    if report["saved"] > 0 or (output and output != path):
+        write_atomic(output or path, optimized if report["saved"] > 0 else data)
+    report["deck"] = output or path
+    return report
+
+
+def _size(count):
+    return f"{count / 1024:,.1f} KiB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shrink saved decks: unused layouts, orphan parts, duplicate media, recompression")
+    parser.add_argument("decks", nargs="+")
+    parser.add_argument("-o", "--output", default=None, help="write here instead of in place (single deck only)")
+    parser.add_argument("--level", type=int, default=DEFAULT_LEVEL, choices=range(0, 10), metavar="0-9",
+                        help=f"deflate level (default: {DEFAULT_LEVEL})")
+    parser.add_argument("--keep-layouts", action="store_true", help="keep layouts no slide uses")
+    parser.add_argument("--json", action="store_true", help="print reports as JSON lines")
+    args = parser.parse_args()
+    if args.output and len(args.decks) > 1:
+        parser.error("-o/--output takes a single deck")
+
+    for path in args.decks:
+        report = optimize_file(path, args.output, args.level, not args.keep_layouts)
+        if args.json:
+            print(json.dumps(report))
+            continue
+        percent = 100 * report["saved"] / report["before"] if report["before"] else 0
+        print(f"✅ {report['deck']}: {_size(report['before'])} -> {_size(report['after'])} "
+              f"(saved {_size(max(report['saved'], 0))}, {percent:.1f}%)")
+        print(f"   🧹 {report['layouts_removed']} layouts, {report['masters_removed']} masters and "
+              f"{report['entries_removed']} entries removed; {report['duplicates_merged']} duplicate media merged")
+
+
+if __name__ == "__main__":
+    main()
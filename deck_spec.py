@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Declarative deck specs
+Loads and validates JSON/YAML deck descriptions and renders them with the generator helpers
+
+Usage: python deck_spec.py SPEC [SPEC ...]   (validate only)
+"""
+
+import importlib
+import json
+import os
+
+SPEC_VERSION = 1
+
+# Renderer name -> module providing render_deck(spec)
+RENDERERS = {
+    "template": "create_security_townhall_v2",  # HRD template layouts
+    "branded": "create_security_townhall",      # Blank layout + brand colors
+}
+
+# Slide type -> fields every slide of that type must provide
+REQUIRED_FIELDS = {
+    "title": ("title",),
+    "content": ("title", "items"),
+    "two_column": ("title", "left", "right"),
+    "qa": (),
+    "kpi": ("title", "tiles"),
+    "chart": ("title", "metrics"),
+    "table": ("title",),
+    "image": ("title", "image"),
+}
+
+LIST_FIELDS = ("items", "left", "right", "metrics")
+
+# Chart names a "chart" slide may ask for (see metric_slides.CHART_TYPES)
+CHART_KINDS = ("line", "column", "bar", "area")
+TILE_CHANGES = ("pct", "abs", "none")
+# Slide types that may read a 'source' file
+SOURCE_TYPES = ("kpi", "chart", "table")
+
+# font_size value asking for the largest size at which the slide's bullets fit
+AUTO_SIZE = "auto"
+
+
+class SpecError(ValueError):
+    """Raised when a deck spec is malformed"""
+
+
+def load_spec(path):
+    """Load a deck spec from a .json, .yaml or .yml file"""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+    if not isinstance(spec, dict):
+        raise SpecError(f"{path}: top level must be a mapping")
+    spec.setdefault("name", os.path.splitext(os.path.basename(path))[0])
+    validate_spec(spec, source=path)
+    # Metrics files are found relative to the spec that names them
+    base = os.path.dirname(os.path.abspath(path))
+    if "data" in spec:
+        spec["data"] = os.path.join(base, spec["data"])
+    for slide in spec["slides"]:
+        if slide["type"] in SOURCE_TYPES and "source" in slide:
+            slide["source"] = os.path.join(base, slide["source"])
+        if slide["type"] == "image":
+            slide["image"] = os.path.join(base, slide["image"])
+    return spec
+
+
+def validate_spec(spec, source="spec"):
+    """Check a deck spec's structure, raising SpecError with the offending location"""
+    if not isinstance(spec, dict):
+        raise SpecError(f"{source}: top level must be a mapping")
+    if spec.get("version", SPEC_VERSION) != SPEC_VERSION:
+        raise SpecError(f"{source}: unsupported spec version {spec.get('version')!r}")
+    if spec.get("renderer", "template") not in RENDERERS:
+        raise SpecError(f"{source}: unknown renderer {spec.get('renderer')!r} (expected one of {', '.join(RENDERERS)})")
+
+    if not isinstance(spec.get("data", ""), str):
+        raise SpecError(f"{source}: 'data' must be the path of a metrics file")
+
+    slides = spec.get("slides")
+    if not isinstance(slides, list) or not slides:
+        raise SpecError(f"{source}: 'slides' must be a non-empty list")
+
+    for number, slide in enumerate(slides, start=1):
+        where = f"{source}: slide {number}"
+        if not isinstance(slide, dict):
+            raise SpecError(f"{where}: must be a mapping")
+        kind = slide.get("type")
+        if kind not in REQUIRED_FIELDS:
+            raise SpecError(f"{where}: unknown slide type {kind!r} (expected one of {', '.join(REQUIRED_FIELDS)})")
+        for field in REQUIRED_FIELDS[kind]:
+            if field not in slide:
+                raise SpecError(f"{where}: '{kind}' slide is missing '{field}'")
+        for field in LIST_FIELDS:
+            if field in slide and (not isinstance(slide[field], list) or not all(isinstance(item, str) for item in slide[field])):
+                raise SpecError(f"{where}: '{field}' must be a list of strings")
+        if "layout" in slide and not isinstance(slide["layout"], (int, str)):
+            raise SpecError(f"{where}: 'layout' must be a layout index or layout name")
+        font_size = slide.get("font_size")
+        if font_size is not None and font_size != AUTO_SIZE and not isinstance(font_size, (int, float)):
+            raise SpecError(f"{where}: 'font_size' must be a number or {AUTO_SIZE!r}")
+        if kind in ("kpi", "chart"):
+            _validate_metric_slide(spec, slide, where)
+        elif kind == "table":
+            _validate_table_slide(slide, where)
+        elif kind == "image":
+            _validate_image_slide(slide, where)
+
+
+def _validate_image_slide(slide, where):
+    """Check an image slide's file and rendering options"""
+    if not isinstance(slide["image"], str):
+        raise SpecError(f"{where}: 'image' must be the path of an image file")
+    dpi = slide.get("dpi")
+    if dpi is not None and (not isinstance(dpi, (int, float)) or dpi <= 0):
+        raise SpecError(f"{where}: 'dpi' must be a positive number")
+    if not isinstance(slide.get("description", ""), str):
+        raise SpecError(f"{where}: 'description' must be a string")
+
+
+def _validate_table_slide(slide, where):
+    """Check that a table slide has rows inline (with columns) or a source file"""
+    if not isinstance(slide.get("source", ""), str):
+        raise SpecError(f"{where}: 'source' must be the path of a CSV or Parquet file")
+    columns = slide.get("columns")
+    if columns is not None and (not isinstance(columns, list) or not all(isinstance(c, str) for c in columns) or not columns):
+        raise SpecError(f"{where}: 'columns' must be a non-empty list of strings")
+    weights = slide.get("column_weights")
+    if weights is not None and (not isinstance(weights, list) or not all(isinstance(w, (int, float)) for w in weights)):
+        raise SpecError(f"{where}: 'column_weights' must be a list of numbers")
+    if weights is not None and columns is not None and len(weights) != len(columns):
+        raise SpecError(f"{where}: 'column_weights' must give one number per column")
+    # A source file's columns are only known once it is loaded (see table_slides.paginate)
+    if "source" in slide:
+        return
+    rows = slide.get("rows")
+    if columns is None or not isinstance(rows, list):
+        raise SpecError(f"{where}: 'table' slide needs 'columns' and 'rows', or a 'source' file")
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row, list) or len(row) != len(columns):
+            raise SpecError(f"{where}: row {number} must be a list of {len(columns)} cells")
+        if not all(isinstance(cell, (str, int, float)) for cell in row):
+            raise SpecError(f"{where}: row {number} cells must be strings or numbers")
+
+
+def _validate_metric_slide(spec, slide, where):
+    """Check the data binding of a kpi or chart slide"""
+    from metrics import AGGREGATIONS, PERIODS
+    if not isinstance(slide.get("source", ""), str):
+        raise SpecError(f"{where}: 'source' must be the path of a metrics file")
+    entries = slide["tiles"] if slide["type"] == "kpi" else [slide]
+    if slide["type"] == "kpi" and (not isinstance(entries, list) or not entries):
+        raise SpecError(f"{where}: 'tiles' must be a non-empty list")
+    if slide["type"] == "chart":
+        if not slide["metrics"]:
+            raise SpecError(f"{where}: 'metrics' must name at least one metric")
+        if slide.get("chart", "line") not in CHART_KINDS:
+            raise SpecError(f"{where}: unknown chart {slide['chart']!r} (expected one of {', '.join(CHART_KINDS)})")
+        if "series" in slide:
+            _validate_inline_series(slide, where)
+    bound = slide["type"] == "chart" and "series" not in slide
+    for number, entry in enumerate(entries, start=1):
+        at = f"{where}: tile {number}" if slide["type"] == "kpi" else where
+        if not isinstance(entry, dict):
+            raise SpecError(f"{at}: must be a mapping")
+        if slide["type"] == "kpi":
+            if "label" not in entry or ("metric" not in entry and "value" not in entry):
+                raise SpecError(f"{at}: needs a 'label' and a 'metric' or 'value'")
+            if entry.get("change", "pct") not in TILE_CHANGES:
+                raise SpecError(f"{at}: 'change' must be one of {', '.join(TILE_CHANGES)}")
+            bound = bound or ("metric" in entry and "value" not in entry)
+        for field, allowed in (("period", PERIODS), ("agg", AGGREGATIONS)):
+            value = entry.get(field, slide.get(field))
+            if value is not None and value not in allowed:
+                raise SpecError(f"{at}: '{field}' must be one of {', '.join(allowed)}")
+    if bound and data_source(spec, slide) is None:
+        raise SpecError(f"{where}: metrics need a 'source' on the slide or 'data' on the deck")
+
+
+def _validate_inline_series(slide, where):
+    """Check that a chart typed into the spec has categories and one value per category in every series"""
+    categories = slide.get("categories")
+    if not isinstance(categories, list) or not categories:
+        raise SpecError(f"{where}: inline 'series' need a non-empty 'categories' list")
+    series = slide["series"]
+    if not isinstance(series, list) or not series:
+        raise SpecError(f"{where}: 'series' must be a non-empty list")
+    for number, entry in enumerate(series, start=1):
+        if not isinstance(entry, dict) or not isinstance(entry.get("name"), str) or not isinstance(entry.get("values"), list):
+            raise SpecError(f"{where}: series {number} must be a mapping with a 'name' and a 'values' list")
+        if len(entry["values"]) != len(categories):
+            raise SpecError(f"{where}: series {number} has {len(entry['values'])} values "
+                            f"for {len(categories)} categories")
+        if not all(value is None or isinstance(value, (int, float)) for value in entry["values"]):
+            raise SpecError(f"{where}: series {number} values must be numbers or null")
+
+
+def resolve_layouts(spec, template_path):
+    """Replace layout names with indices from the template manifest, without opening the template"""
+    from template_manifest import layout_index
+    for slide in spec["slides"]:
+        if isinstance(slide.get("layout"), str):
+            slide["layout"] = layout_index(slide["layout"], template_path)
+    return spec
+
+
+def resolve_font_sizes(spec):
+    """Replace font_size "auto" with the largest size at which each slide's bullets fit"""
+    auto = [slide for slide in spec["slides"] if slide.get("font_size") == AUTO_SIZE]
+    if auto:
+        from text_fit import fit_slides
+        renderer = renderer_for(spec)
+        fit_slides(auto, lambda slide: renderer.body_frames(spec, slide), renderer.body_font(spec))
+    return spec
+
+
+def data_source(spec, slide):
+    """Return the metrics file a kpi or chart slide reads: its own 'source', else the deck's 'data'"""
+    return slide.get("source", spec.get("data"))
+
+
+def data_sources(spec):
+    """Return the metrics, table and image files a spec's slides still read from"""
+    from metrics import needs_data
+    sources = {data_source(spec, slide) for slide in spec["slides"] if needs_data(slide)}
+    sources.update(slide["source"] for slide in spec["slides"] if slide["type"] == "table" and "source" in slide)
+    sources.update(slide["image"] for slide in spec["slides"] if slide["type"] == "image")
+    return sorted(sources)
+
+
+def resolve_metrics(spec):
+    """Fill data-bound kpi and chart slides with values aggregated from their metrics files"""
+    bound = [slide for slide in spec["slides"] if slide["type"] in ("kpi", "chart")]
+    if bound:
+        from metrics import bind_slide, needs_data
+        for slide in bound:
+            if needs_data(slide):
+                bind_slide(slide, data_source(spec, slide))
+    return spec
+
+
+def resolve_tables(spec):
+    """Split table slides into as many slides as their rows need, with column widths and row heights computed"""
+    if not any(slide["type"] == "table" and "row_heights" not in slide for slide in spec["slides"]):
+        return spec
+    from table_slides import paginate
+    renderer = renderer_for(spec)
+    slides = []
+    for slide in spec["slides"]:
+        if slide["type"] == "table" and "row_heights" not in slide:
+            slides.extend(paginate(slide, renderer.body_area(spec, slide), renderer.body_font(spec)))
+        else:
+            slides.append(slide)
+    spec["slides"] = slides
+    return spec
+
+
+def resolve_images(spec):
+    """Scale every image slide's picture to the size it is drawn at, all at once on a thread pool
+
+    Each slide gets "prepared_image", the name of its rendition in the image cache.
+    """
+    pending = [slide for slide in spec["slides"] if slide["type"] == "image" and "prepared_image" not in slide]
+    if not pending:
+        return spec
+    from slide_images import TARGET_DPI, ImageRequest, prepare_images
+    renderer = renderer_for(spec)
+    requests = [ImageRequest(slide["image"], *renderer.body_area(spec, slide)[2:], slide.get("dpi", TARGET_DPI))
+                for slide in pending]
+    for slide, name in zip(pending, prepare_images(requests)):
+        slide["prepared_image"] = name
+    return spec
+
+
+def resolve_spec(spec):
+    """Resolve what a spec leaves to build time: layout names, auto font sizes, metric values, table pages and images"""
+    if spec.get("renderer", "template") == "template":
+        from template_cache import TEMPLATE_PATH
+        resolve_layouts(spec, spec.get("template", TEMPLATE_PATH))
+    resolve_font_sizes(spec)
+    resolve_metrics(spec)
+    resolve_tables(spec)
+    resolve_images(spec)
+    return spec
+
+
+def renderer_for(spec):
+    """Return the renderer module for a spec"""
+    return importlib.import_module(RENDERERS[spec.get("renderer", "template")])
+
+
+def render_bytes(spec, use_cache=True):
+    """Render a spec to reproducible .pptx bytes, returning (bytes, slide count, cache hit)
+
+    Identical specs against the same template and renderer code are served from the
+    artifact cache instead of being rendered again.
+    """
+    import artifact_cache
+    from reproducible import deterministic_bytes
+
+    key = artifact_cache.artifact_key(spec) if use_cache else None
+    if key:
+        data = artifact_cache.load(key)
+        if data is not None:
+            return data, _slide_count(data), True
+
+    prs = renderer_for(spec).render_deck(spec)
+    data = deterministic_bytes(prs)
+    if key:
+        artifact_cache.put(key, data)
+    return data, len(prs.slides), False
+
+
+def _slide_count(data):
+    """Count the slides of a saved deck (table slides may have become several)"""
+    import io
+    import re
+    import zipfile
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return sum(1 for name in zf.namelist() if re.fullmatch(r"ppt/slides/slide\d+\.xml", name))
+
+
+def output_path(spec, output=None):
+    """Return where a spec's deck is saved: output if given, else the spec's 'output'"""
+    output = output or spec.get("output")
+    if not isinstance(output, str) or not output:
+        raise SpecError(f"{spec.get('name', 'spec')}: no 'output' path in the spec and none given")
+    return output
+
+
+def render_spec(spec, output=None, use_cache=True):
+    """Render a spec and save it reproducibly, returning (output path, slide count)"""
+    from template_cache import write_atomic
+    output = output_path(spec, output)
+    data, slide_count, _ = render_bytes(spec, use_cache)
+    write_atomic(output, data)
+    return output, slide_count
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Validate deck specs without rendering them")
+    parser.add_argument("specs", nargs="+")
+    args = parser.parse_args()
+
+    failed = False
+    for path in args.specs:
+        try:
+            spec = load_spec(path)
+        except (OSError, ValueError) as e:
+            print(f"❌ {path}: {e}")
+            failed = True
+            continue
+        print(f"✅ {path}: {len(spec['slides'])} slides, renderer '{spec.get('renderer', 'template')}'")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Incremental deck rebuilds
+Each slide's spec is hashed together with the template and renderer code; slides whose hash is
+unchanged reuse their previously serialized parts and only changed slides are rendered again
+
+Usage: python incremental_build.py SPEC [-o OUTPUT]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import time
+import deck_spec
+from reproducible import code_hash
+from slide_parts import PackageWriter, base_partnames, extract_fragment, fragment_bytes, parse_fragment
+from template_cache import CACHE_DIR, TEMPLATE_PATH, template_hash, temporary_path, write_atomic
+
+SLIDE_CACHE_DIR = os.path.join(CACHE_DIR, "slides")
+SLIDE_CACHE_MAX_BYTES = int(os.environ.get("HRD_PPTX_SLIDE_CACHE_BYTES", 256 << 20))
+FRAGMENT_SUFFIX = ".frag"
+
+# template key -> base package bytes
+_base_memo = {}
+
+
+def template_key(spec):
+    """Return what the rendered slides depend on besides their own spec"""
+    renderer = spec.get("renderer", "template")
+    if renderer == "template":
+        return f"template:{template_hash(spec.get('template', TEMPLATE_PATH))}"
+    return renderer
+
+
+def slide_key(spec, slide_spec):
+    """Return the content hash of one slide: its spec, the template and the renderer code"""
+    payload = json.dumps(
+        {"template": template_key(spec), "code": code_hash(), "slide": slide_spec},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def base_package(spec):
+    """Return the bytes of an empty deck for the spec's renderer (template with no slides)"""
+    key = template_key(spec)
+    data = _base_memo.get(key)
+    if data is None:
+        out = io.BytesIO()
+        deck_spec.renderer_for(spec).new_presentation(spec).save(out)
+        data = _base_memo[key] = out.getvalue()
+    return data
+
+
+def _fragment_path(key):
+    return os.path.join(SLIDE_CACHE_DIR, key[:2], f"{key}{FRAGMENT_SUFFIX}")
+
+
+def load_fragment(key):
+    """Return a cached fragment, or None when it is missing or cannot be read"""
+    path = _fragment_path(key)
+    try:
+        with open(path, "rb") as f:
+            fragment = parse_fragment(f.read())
+        # Mark as recently used for LRU eviction
+        os.utime(path)
+        return fragment
+    except Exception:
+        # Truncated, stale or foreign: rendered again and overwritten
+        return None
+
+
+def store_fragment(key, fragment):
+    write_atomic(_fragment_path(key), fragment_bytes(fragment))
+
+
+def evict_fragments(max_bytes=SLIDE_CACHE_MAX_BYTES):
+    """Delete least-recently-used fragments until the slide cache fits in max_bytes; returns bytes freed"""
+    from artifact_cache import evict
+    return evict(max_bytes, SLIDE_CACHE_DIR, FRAGMENT_SUFFIX)
+
+
+def _drop_slides(prs):
+    """Remove every slide from a presentation so its parts and trees can be freed"""
+    sld_id_lst = prs.slides._sldIdLst
+    for sld_id in list(sld_id_lst):
+        sld_id_lst.remove(sld_id)
+        prs.part.drop_rel(sld_id.rId)
+
+
+def iter_fragments(spec, slide_specs, base=None):
+    """Render slide specs one at a time on a scratch deck, yielding each as a fragment
+
+    Each slide is dropped from the scratch deck once detached, so only one slide tree
+    is alive at a time however many slides are rendered.
+    """
+    renderer = deck_spec.renderer_for(spec)
+    names = base_partnames(base if base is not None else base_package(spec))
+    scratch = renderer.new_presentation(spec)
+    for slide_spec in slide_specs:
+        fragment = extract_fragment(renderer.render_slide(scratch, slide_spec), names)
+        _drop_slides(scratch)
+        yield fragment
+
+
+def render_fragments(spec, slide_specs, base=None):
+    """Render slide specs on one scratch deck and detach each into a fragment"""
+    return list(iter_fragments(spec, slide_specs, base))
+
+
+def build_incremental(spec, output=None):
+    """Rebuild a deck, rendering only slides whose content hash changed; returns build stats"""
+    start = time.perf_counter()
+    output = deck_spec.output_path(spec, output)
+    deck_spec.resolve_spec(spec)
+
+    keys = [slide_key(spec, slide_spec) for slide_spec in spec["slides"]]
+    fragments = {key: load_fragment(key) for key in set(keys)}
+    missing = [key for key in dict.fromkeys(keys) if fragments[key] is None]
+
+    if missing:
+        by_key = dict(zip(keys, spec["slides"]))
+        for key, fragment in zip(missing, render_fragments(spec, [by_key[key] for key in missing])):
+            fragments[key] = fragment
+            store_fragment(key, fragment)
+        evict_fragments()
+
+    tmp_output = temporary_path(output)
+    try:
+        with PackageWriter(base_package(spec), tmp_output) as writer:
+            for key in keys:
+                writer.add_slide(fragments[key])
+        os.replace(tmp_output, output)
+    finally:
+        if os.path.exists(tmp_output):
+            os.remove(tmp_output)
+
+    return {
+        "output": output,
+        "slides": len(keys),
+        "rendered": len(missing),
+        "reused": len(keys) - sum(keys.count(key) for key in missing),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally rebuild a deck from its spec")
+    parser.add_argument("spec")
+    parser.add_argument("-o", "--output", default=None, help="output .pptx (default: the spec's 'output')")
+    args = parser.parse_args()
+
+    stats = build_incremental(deck_spec.load_spec(args.spec), args.output)
+    print(f"✅ {stats['output']}: {stats['slides']} slides "
+          f"({stats['rendered']} rendered, {stats['reused']} reused) in {stats['seconds']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
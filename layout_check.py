@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Layout checker for overlapping, off-slide and colliding shapes
+Bounding boxes go into a per-slide uniform grid so only shapes sharing a cell are compared
+
+Usage: python layout_check.py DECK [DECK ...] [--json]
+"""
+
+from collections import namedtuple
+import argparse
+import json
+import sys
+
+EMU_PER_INCH = 914400
+# Overlaps and overhangs thinner than this (0.05in) are treated as touching edges
+TOLERANCE = 45720
+# Shapes covering at least this fraction of the slide are backdrops, not content
+BACKDROP_FRACTION = 0.9
+# Grid cells per slide side
+GRID_DIVISIONS = 16
+
+Box = namedtuple("Box", "shape_id name placeholder left top right bottom")
+
+# kind: "off_canvas", "overlap" or "placeholder_collision"; shapes: names involved; detail: text
+LayoutIssue = namedtuple("LayoutIssue", "slide kind shapes detail")
+
+
+def shape_boxes(slide):
+    """Return the bounding box of every top-level shape that has geometry"""
+    boxes = []
+    for shape in slide.shapes:
+        left, top, width, height = shape.left, shape.top, shape.width, shape.height
+        if None in (left, top, width, height):
+            continue
+        boxes.append(Box(shape.shape_id, shape.name, shape.is_placeholder,
+                         left, top, left + width, top + height))
+    return boxes
+
+
+class GridIndex:
+    """Uniform-grid spatial hash of boxes"""
+
+    def __init__(self, width, height, divisions=GRID_DIVISIONS):
+        self.cell_w = max(width // divisions, 1)
+        self.cell_h = max(height // divisions, 1)
+        self.last = divisions
+        self.cells = {}
+
+    def _span(self, low, high, cell):
+        # Clamped to the slide so a far off-canvas shape cannot blow up the cell count
+        return range(min(max(low // cell, 0), self.last), min(max(high // cell, 0), self.last) + 1)
+
+    def _cells(self, box):
+        for cx in self._span(box.left, box.right, self.cell_w):
+            for cy in self._span(box.top, box.bottom, self.cell_h):
+                yield cx, cy
+
+    def insert(self, number, box):
+        for cell in self._cells(box):
+            self.cells.setdefault(cell, []).append(number)
+
+    def candidate_pairs(self):
+        """Return every (i, j), i < j, of boxes sharing at least one cell"""
+        pairs = set()
+        for members in self.cells.values():
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    pairs.add((members[a], members[b]) if members[a] < members[b] else (members[b], members[a]))
+        return pairs
+
+
+def _overlap(a, b):
+    """Return the (width, height) of the intersection of two boxes, or None"""
+    width = min(a.right, b.right) - max(a.left, b.left)
+    height = min(a.bottom, b.bottom) - max(a.top, b.top)
+    if width > TOLERANCE and height > TOLERANCE:
+        return width, height
+    return None
+
+
+def _inches(emu):
+    return f"{emu / EMU_PER_INCH:.2f}in"
+
+
+def check_boxes(boxes, slide_width, slide_height, slide_number=None):
+    """Return the LayoutIssues for one slide's boxes"""
+    issues = []
+    backdrop_area = BACKDROP_FRACTION * slide_width * slide_height
+    content = []
+    for box in boxes:
+        overhang = max(-box.left, -box.top, box.right - slide_width, box.bottom - slide_height)
+        if overhang > TOLERANCE:
+            issues.append(LayoutIssue(slide_number, "off_canvas", (box.name,),
+                                      f"extends {_inches(overhang)} past the slide edge"))
+        if (box.right - box.left) * (box.bottom - box.top) < backdrop_area:
+            content.append(box)
+
+    index = GridIndex(slide_width, slide_height)
+    for number, box in enumerate(content):
+        index.insert(number, box)
+    for i, j in sorted(index.candidate_pairs()):
+        a, b = content[i], content[j]
+        overlap = _overlap(a, b)
+        if overlap is None:
+            continue
+        kind = "placeholder_collision" if a.placeholder or b.placeholder else "overlap"
+        issues.append(LayoutIssue(slide_number, kind, (a.name, b.name),
+                                  f"overlap {_inches(overlap[0])} x {_inches(overlap[1])}"))
+    return issues
+
+
+def check_presentation(prs):
+    """Return the LayoutIssues of every slide in a presentation"""
+    issues = []
+    for number, slide in enumerate(prs.slides, 1):
+        issues.extend(check_boxes(shape_boxes(slide), prs.slide_width, prs.slide_height, number))
+    return issues
+
+
+def check_file(path):
+    """Open a deck and return its LayoutIssues"""
+    from pptx import Presentation
+    return check_presentation(Presentation(path))
+
+
+def format_issue(issue):
+    return f"⚠️  slide {issue.slide}: {issue.kind} {' / '.join(issue.shapes)}: {issue.detail}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report overlapping, off-slide and colliding shapes")
+    parser.add_argument("decks", nargs="+")
+    parser.add_argument("--json", action="store_true", help="print issues as JSON lines")
+    args = parser.parse_args()
+
+    found = 0
+    for path in args.decks:
+        issues = check_file(path)
+        found += len(issues)
+        for issue in issues:
+            if args.json:
+                print(json.dumps({"deck": path, **issue._asdict()}, ensure_ascii=False))
+            else:
+                print(f"{path}: {format_issue(issue)}")
+        if not args.json and not issues:
+            print(f"✅ {path}: no layout issues")
+    sys.exit(1 if found else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+KPI tiles and native charts for data-bound slides
+Both renderers draw kpi and chart slides through these helpers into a body area they choose
+"""
+
+from itertools import cycle
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import MSO_ANCHOR
+from pptx.util import Inches, Pt
+from brand import PALETTE, STYLES
+from text_body import fill_paragraphs
+from text_fit import TextFrame, fit_font_sizes
+
+# Chart name in a spec -> python-pptx chart type
+CHART_TYPES = {
+    "line": XL_CHART_TYPE.LINE_MARKERS,
+    "column": XL_CHART_TYPE.COLUMN_CLUSTERED,
+    "bar": XL_CHART_TYPE.BAR_CLUSTERED,
+    "area": XL_CHART_TYPE.AREA,
+}
+CHART_FONT_SIZE = 12
+
+MAX_TILES_PER_ROW = 4
+MAX_TILE_HEIGHT = Inches(2.5)
+TILE_GAP = Inches(0.25)
+# Tile values shrink from the style's size down to this to stay on one line
+MIN_VALUE_SIZE = 16
+
+ARROWS = {1: "▲", -1: "▼", 0: "■"}
+
+
+def format_value(value, fmt=None):
+    """Format a tile value with a str.format pattern (default: thousands separators, one decimal if needed)"""
+    if not isinstance(value, (int, float)):
+        return str(value)
+    if fmt is None:
+        fmt = "{:,.0f}" if float(value).is_integer() else "{:,.1f}"
+    return fmt.format(value)
+
+
+def change_text(tile):
+    """Return a tile's change line, e.g. "▲ 4.2% vs Sep 2025", or "" without a previous value"""
+    value, previous, change = tile.get("value"), tile.get("previous"), tile.get("change", "pct")
+    if change == "none" or not isinstance(value, (int, float)) or not isinstance(previous, (int, float)):
+        return ""
+    difference = value - previous
+    arrow = ARROWS[(difference > 0) - (difference < 0)]
+    if change == "abs":
+        amount = format_value(abs(difference), tile.get("format"))
+    elif previous:
+        amount = f"{abs(difference) / abs(previous):.1%}"
+    else:
+        return ""
+    since = tile.get("previous_period")
+    return f"{arrow} {amount} vs {since}" if since else f"{arrow} {amount}"
+
+
+def _tile_grid(count, left, top, width, height):
+    """Return (left, top, width, height) for each of count tiles laid out in rows, centered in the area"""
+    cols = min(count, MAX_TILES_PER_ROW)
+    rows = -(-count // cols)
+    tile_w = (width - TILE_GAP * (cols - 1)) // cols
+    tile_h = min((height - TILE_GAP * (rows - 1)) // rows, MAX_TILE_HEIGHT)
+    top += (height - tile_h * rows - TILE_GAP * (rows - 1)) // 2
+    boxes = []
+    for number in range(count):
+        row, col = divmod(number, cols)
+        # The last row is centered when it is short
+        in_row = min(cols, count - row * cols)
+        offset = (width - tile_w * in_row - TILE_GAP * (in_row - 1)) // 2
+        boxes.append((left + offset + col * (tile_w + TILE_GAP), top + row * (tile_h + TILE_GAP), tile_w, tile_h))
+    return boxes
+
+
+def add_kpi_tiles(slide, tiles, left, top, width, height, family=None):
+    """Draw one brand-colored tile per resolved tile spec (value, label, change) into an area"""
+    style = STYLES["kpi_tile"]
+    boxes = _tile_grid(len(tiles), left, top, width, height)
+    values = [format_value(tile["value"], tile.get("format")) for tile in tiles]
+    # Every value gets the size of the tightest one, so the row reads evenly
+    sizes = fit_font_sizes([TextFrame([value], w, h // 2) for value, (_, _, w, h) in zip(values, boxes)],
+                           family, max_size=style[0].size, min_size=MIN_VALUE_SIZE)
+    tile_style = {**style, 0: style[0]._replace(size=int(sizes.min()))}
+
+    shapes = []
+    for tile, value, color, (x, y, w, h) in zip(tiles, values, cycle(PALETTE), boxes):
+        shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, x, y, w, h)
+        shape.name = f"KPI {tile['label']}"
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = color
+        shape.line.fill.background()
+        paragraphs = [(0, value), (1, tile["label"])]
+        change = change_text(tile)
+        if change:
+            paragraphs.append((2, change))
+        text_frame = fill_paragraphs(shape.text_frame, paragraphs, tile_style)
+        text_frame.word_wrap = True
+        text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
+        shapes.append(shape)
+    return shapes
+
+
+def add_metric_chart(slide, chart_spec, left, top, width, height):
+    """Add a native chart of a resolved chart spec's series, colored from the brand palette"""
+    kind = chart_spec.get("chart", "line")
+    data = CategoryChartData(number_format=chart_spec.get("number_format", "General"))
+    data.categories = chart_spec["categories"]
+    for entry in chart_spec["series"]:
+        data.add_series(entry["name"], entry["values"])
+
+    frame = slide.shapes.add_chart(CHART_TYPES[kind], left, top, width, height, data)
+    frame.name = f"Chart {chart_spec['title']}"
+    chart = frame.chart
+    chart.has_title = False
+    chart.font.size = Pt(CHART_FONT_SIZE)
+    chart.has_legend = len(chart_spec["series"]) > 1
+    if chart.has_legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+
+    for color, plot_series in zip(cycle(PALETTE), chart.plots[0].series):
+        if kind == "line":
+            plot_series.smooth = False
+            plot_series.format.line.color.rgb = color
+            plot_series.format.line.width = Pt(2.5)
+            plot_series.marker.format.fill.solid()
+            plot_series.marker.format.fill.fore_color.rgb = color
+            plot_series.marker.format.line.color.rgb = color
+        else:
+            plot_series.format.fill.solid()
+            plot_series.format.fill.fore_color.rgb = color
+
+    value_axis = chart.value_axis
+    value_axis.has_major_gridlines = True
+    value_axis.tick_labels.number_format = chart_spec.get("number_format", "General")
+    value_axis.tick_labels.number_format_is_linked = False
+    return frame
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Metric time series for data-bound slides
+Loads long-format metric files (date, metric, value) from CSV or Parquet and aggregates them per period in one grouped pass
+
+Usage: python metrics.py DATA [--period M] [--agg last] [--metrics NAME ...]
+"""
+
+from functools import lru_cache
+import argparse
+import os
+
+DATE_COLUMN = "date"
+METRIC_COLUMN = "metric"
+VALUE_COLUMN = "value"
+
+# pandas period aliases accepted for "period"; "M" is calendar months
+PERIODS = ("D", "W", "M", "Q", "Y")
+AGGREGATIONS = ("sum", "mean", "last", "first", "min", "max", "count")
+DEFAULT_PERIOD = "M"
+# Metrics are mostly levels (rule counts, rates), so a period's value is its last reading
+DEFAULT_AGG = "last"
+DEFAULT_PERIODS_SHOWN = 12
+
+# How period labels are written on chart axes
+PERIOD_LABELS = {"D": "%Y-%m-%d", "W": "%Y-%m-%d", "M": "%b %Y", "Q": "%Y Q%q", "Y": "%Y"}
+
+
+def _signature(path):
+    """Return what a loaded file is memoized on: its path, mtime and size"""
+    st = os.stat(path)
+    return os.path.abspath(path), st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=8)
+def _load(signature):
+    import pandas as pd
+    path = signature[0]
+    columns = [DATE_COLUMN, METRIC_COLUMN, VALUE_COLUMN]
+    if path.endswith((".parquet", ".pq")):
+        frame = pd.read_parquet(path, columns=columns)
+    else:
+        frame = pd.read_csv(path, usecols=columns, dtype={METRIC_COLUMN: "category", VALUE_COLUMN: "float64"})
+    frame[DATE_COLUMN] = pd.to_datetime(frame[DATE_COLUMN])
+    frame[METRIC_COLUMN] = frame[METRIC_COLUMN].astype("category")
+    # Sorted by date so "first"/"last" mean earliest/latest reading in a period
+    return frame.sort_values(DATE_COLUMN, kind="stable", ignore_index=True)
+
+
+def load_metrics(path):
+    """Return a metrics file as a DataFrame of date, metric (categorical) and value
+
+    The parsed frame is kept per process until the file changes on disk.
+    """
+    return _load(_signature(path))
+
+
+@lru_cache(maxsize=64)
+def _period_table(signature, period, agg):
+    frame = _load(signature)
+    periods = frame[DATE_COLUMN].dt.to_period(period)
+    grouped = frame.groupby([periods, frame[METRIC_COLUMN]], observed=True, sort=True)[VALUE_COLUMN]
+    return grouped.agg(agg).unstack(METRIC_COLUMN)
+
+
+def period_table(path, period=DEFAULT_PERIOD, agg=DEFAULT_AGG):
+    """Return a periods x metrics DataFrame aggregating every metric of a file at once"""
+    if period not in PERIODS:
+        raise ValueError(f"unknown period {period!r} (expected one of {', '.join(PERIODS)})")
+    if agg not in AGGREGATIONS:
+        raise ValueError(f"unknown aggregation {agg!r} (expected one of {', '.join(AGGREGATIONS)})")
+    return _period_table(_signature(path), period, agg)
+
+
+def _column(table, metric, path):
+    if metric not in table.columns:
+        raise KeyError(f"{path}: no metric {metric!r}")
+    return table[metric].dropna()
+
+
+def series(path, metrics, period=DEFAULT_PERIOD, agg=DEFAULT_AGG, periods=DEFAULT_PERIODS_SHOWN):
+    """Return (period labels, {metric: values}) for the last `periods` periods of some metrics
+
+    Periods where a metric has no readings are None.
+    """
+    table = period_table(path, period, agg)
+    for metric in metrics:
+        _column(table, metric, path)
+    table = table[list(metrics)].dropna(how="all").tail(periods)
+    labels = [p.strftime(PERIOD_LABELS[period]) for p in table.index]
+    values = {metric: [None if v != v else float(v) for v in table[metric].tolist()] for metric in metrics}
+    return labels, values
+
+
+def latest(path, metric, period=DEFAULT_PERIOD, agg=DEFAULT_AGG):
+    """Return (latest period's value, previous period's value, previous period's label) of a metric
+
+    The previous value and label are None when the metric has a single period.
+    """
+    column = _column(period_table(path, period, agg), metric, path)
+    if column.empty:
+        raise KeyError(f"{path}: metric {metric!r} has no values")
+    if len(column) == 1:
+        return float(column.iloc[-1]), None, None
+    return float(column.iloc[-1]), float(column.iloc[-2]), column.index[-2].strftime(PERIOD_LABELS[period])
+
+
+def needs_data(slide):
+    """Return whether a kpi or chart slide spec still has values to fill from its metric file"""
+    if slide.get("type") == "chart":
+        return "series" not in slide
+    if slide.get("type") == "kpi":
+        return any("metric" in tile and "value" not in tile for tile in slide["tiles"])
+    return False
+
+
+def bind_slide(slide, path):
+    """Fill a kpi or chart slide spec in place with values aggregated from a metrics file
+
+    Charts get "categories" and "series"; tiles get "value", "previous" and "previous_period".
+    Values already present (typed into the spec) are left alone.
+    """
+    period, agg = slide.get("period", DEFAULT_PERIOD), slide.get("agg", DEFAULT_AGG)
+    if slide["type"] == "chart":
+        labels, values = series(path, slide["metrics"], period, agg,
+                                slide.get("periods", DEFAULT_PERIODS_SHOWN))
+        names = slide.get("labels", {})
+        slide["categories"] = labels
+        slide["series"] = [{"name": names.get(metric, metric), "values": values[metric]} for metric in slide["metrics"]]
+        return slide
+    for tile in slide["tiles"]:
+        if "metric" in tile and "value" not in tile:
+            tile["value"], tile["previous"], tile["previous_period"] = latest(
+                path, tile["metric"], tile.get("period", period), tile.get("agg", agg))
+    return slide
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show a metrics file aggregated per period")
+    parser.add_argument("data", help="CSV or Parquet file with date, metric and value columns")
+    parser.add_argument("--period", default=DEFAULT_PERIOD, choices=PERIODS)
+    parser.add_argument("--agg", default=DEFAULT_AGG, choices=AGGREGATIONS)
+    parser.add_argument("--metrics", nargs="+", default=None, help="metrics to show (default: all)")
+    args = parser.parse_args()
+
+    import time
+    start = time.perf_counter()
+    frame = load_metrics(args.data)
+    table = period_table(args.data, args.period, args.agg)
+    seconds = time.perf_counter() - start
+    if args.metrics:
+        table = table[args.metrics]
+    print(table.tail(DEFAULT_PERIODS_SHOWN).to_string())
+    print(f"📊 {len(frame):,} rows, {table.shape[1]} metrics, {table.shape[0]} periods in {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Zip-level helpers for Open Packaging Convention (.pptx) archives
+Works on raw part bytes without building the python-pptx object model
+"""
+
+import posixpath
+
+NS_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+NS_CT = "http://schemas.openxmlformats.org/package/2006/content-types"
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+RT_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+RT_SLIDE_LAYOUT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+RT_NOTES_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide"
+RT_NOTES_MASTER = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesMaster"
+RT_SLIDE_MASTER = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideMaster"
+
+CT_SLIDE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+
+# presentation.xml extension holding PowerPoint 2010+ sections
+SECTIONS_EXT_URI = "{521415D9-36F7-43E2-AB2F-B90AF26B5E84}"
+
+CONTENT_TYPES = "[Content_Types].xml"
+PRESENTATION = "ppt/presentation.xml"
+
+
+def rels_name(partname):
+    """Return the zip entry name of a part's .rels file"""
+    directory, name = posixpath.split(partname)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+def resolve_target(partname, target):
+    """Resolve a relationship target relative to the part that owns it"""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    base = posixpath.dirname(partname)
+    return posixpath.normpath(posixpath.join(base, target))
+
+
+def relative_target(partname, target_partname):
+    """Return target_partname expressed relative to the part that references it"""
+    return posixpath.relpath(target_partname, posixpath.dirname(partname) or ".")
+
+
+def parse_rels(blob):
+    """Parse a .rels blob into a list of (rId, reltype, target, external) tuples"""
+    if not blob:
+        return []
+    from lxml import etree
+    root = etree.fromstring(blob)
+    return [
+        (rel.get("Id"), rel.get("Type"), rel.get("Target"), rel.get("TargetMode") == "External")
+        for rel in root.iter(f"{{{NS_REL}}}Relationship")
+    ]
+
+
+def serialize_rels(rels):
+    """Serialize (rId, reltype, target, external) tuples back into a .rels blob"""
+    from lxml import etree
+    root = etree.Element(f"{{{NS_REL}}}Relationships", nsmap={None: NS_REL})
+    for rId, reltype, target, external in rels:
+        rel = etree.SubElement(root, f"{{{NS_REL}}}Relationship")
+        rel.set("Id", rId)
+        rel.set("Type", reltype)
+        rel.set("Target", target)
+        if external:
+            rel.set("TargetMode", "External")
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def remove_slide_lists(presentation):
+    """Remove a presentation element's slide list and what refers to its slide ids: custom shows and sections"""
+    p = f"{{{NS_P}}}"
+    for stale in (presentation.find(f"{p}sldIdLst"), presentation.find(f"{p}custShowLst"),
+                  presentation.find(f"{p}extLst/{p}ext[@uri='{SECTIONS_EXT_URI}']")):
+        if stale is not None:
+            stale.getparent().remove(stale)
+    return presentation
+
+
+def part_rels(files, partname):
+    """Return the parsed relationships of a part ("" is the package itself)"""
+    return parse_rels(files.get(rels_name(partname)))
+
+
+def reachable_parts(files):
+    """Return the set of part names reachable from the package relationships"""
+    seen = set()
+    pending = [""]
+    while pending:
+        partname = pending.pop()
+        for _, _, target, external in part_rels(files, partname):
+            if external:
+                continue
+            child = resolve_target(partname, target)
+            if child in files and child not in seen:
+                seen.add(child)
+                pending.append(child)
+    return seen
+
+
+def prune_unreachable(files):
+    """Drop parts (and their .rels) no longer reachable, fixing up content-type overrides"""
+    from lxml import etree
+    keep = reachable_parts(files)
+    kept_rels = {rels_name(name) for name in keep} | {rels_name("")}
+    pruned = {
+        name: blob
+        for name, blob in files.items()
+        if name == CONTENT_TYPES or name in keep or name in kept_rels
+    }
+
+    types = etree.fromstring(pruned[CONTENT_TYPES])
+    for override in list(types.iter(f"{{{NS_CT}}}Override")):
+        if override.get("PartName").lstrip("/") not in keep:
+            types.remove(override)
+    pruned[CONTENT_TYPES] = etree.tostring(types, xml_declaration=True, encoding="UTF-8", standalone=True)
+    return pruned
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Constant-time placeholder lookup by idx
+Maps are built once per layout and once per slide instead of scanning on every lookup
+"""
+
+import threading
+import weakref
+from profiling import profiled
+
+# layout part -> {idx: (name, type)}
+_layout_maps = weakref.WeakKeyDictionary()
+# Slide maps live on the slide part itself: a WeakKeyDictionary would never release them,
+# since the placeholder shapes hold references back to their slide's part
+_SLIDE_MAP_ATTR = "_placeholder_index"
+# WeakKeyDictionary is not safe to mutate from several threads at once
+_maps_lock = threading.Lock()
+
+
+class PlaceholderNotFoundError(KeyError):
+    """Raised when a slide or layout has no placeholder with the requested idx"""
+
+    def __init__(self, owner, idx, available):
+        self.owner = owner
+        self.idx = idx
+        self.available = sorted(available)
+        super().__init__(idx)
+
+    def __reduce__(self):
+        # Pickled with every argument, so it can be raised across a process pool
+        return type(self), (self.owner, self.idx, self.available)
+
+    def __str__(self):
+        available = ", ".join(str(i) for i in self.available) or "none"
+        return f"{self.owner} has no placeholder idx {self.idx} (available: {available})"
+
+
+def layout_placeholders(layout):
+    """Return the idx -> (name, type) map for a slide layout, building it once"""
+    index = _layout_maps.get(layout.part)
+    if index is None:
+        index = {
+            ph.placeholder_format.idx: (ph.name, ph.placeholder_format.type)
+            for ph in layout.placeholders
+        }
+        with _maps_lock:
+            _layout_maps[layout.part] = index
+    return index
+
+
+def slide_placeholders(slide):
+    """Return the idx -> placeholder map for a slide, building it once"""
+    part = slide.part
+    index = part.__dict__.get(_SLIDE_MAP_ATTR)
+    if index is None:
+        index = {ph.placeholder_format.idx: ph for ph in slide.placeholders}
+        setattr(part, _SLIDE_MAP_ATTR, index)
+    return index
+
+
+@profiled("add_slide")
+def add_slide(prs, layout_idx):
+    """Add a slide from a layout index and index its placeholders up front"""
+    layout = prs.slide_layouts[layout_idx]
+    layout_placeholders(layout)
+    slide = prs.slides.add_slide(layout)
+    slide_placeholders(slide)
+    return slide
+
+
+def placeholder(slide, idx):
+    """Return the placeholder with the given idx, raising PlaceholderNotFoundError if absent"""
+    index = slide_placeholders(slide)
+    try:
+        return index[idx]
+    except KeyError:
+        owner = f"slide using layout '{slide.slide_layout.name}'"
+        raise PlaceholderNotFoundError(owner, idx, index) from None
+
+
+def layout_placeholder(layout, idx):
+    """Return (name, type) for a layout placeholder idx, raising PlaceholderNotFoundError if absent"""
+    index = layout_placeholders(layout)
+    try:
+        return index[idx]
+    except KeyError:
+        raise PlaceholderNotFoundError(f"layout '{layout.name}'", idx, index) from None
+
+
+def remove_placeholder(slide, idx):
+    """Delete a placeholder from a slide (the layout keeps it), returning the removed shape"""
+    shape = placeholder(slide, idx)
+    shape._element.getparent().remove(shape._element)
+    del slide_placeholders(slide)[idx]
+    return shape
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Phase-level profiling for deck generation
+Records wall time, net change in allocated memory blocks and peak traced memory per phase and per slide
+
+Enable with HRD_PPTX_PROFILE=1 (collect only) or HRD_PPTX_PROFILE=report.json / report.prom
+(also written at exit; "{pid}" in the path is replaced per process). Disabled, `phase()`
+returns a shared no-op context and `@profiled` returns the function untouched.
+
+Block counts and the traced-memory peak are process-wide: tracemalloc has one peak, which
+every phase resets on entry. With phases running on several threads at once (a
+ThreadPoolExecutor, deck_builder threads), a phase's blocks and peak include the other
+threads' allocations and a peak may be cut short by another phase's reset. Profile on
+one thread (or one process per worker) when the memory figures matter; wall times are
+per thread and unaffected.
+
+Usage: python profiling.py SPEC [-o report.json|report.prom]
+"""
+
+from contextlib import nullcontext
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+PROFILE_ENV = "HRD_PPTX_PROFILE"
+ENABLED = bool(os.environ.get(PROFILE_ENV))
+METRIC_PREFIX = "hrd_pptx_phase"
+
+_NULL = nullcontext()
+_records = []
+_records_lock = threading.Lock()
+_local = threading.local()
+
+
+def enable():
+    """Start collecting; `@profiled` functions only report if enabled before they were imported"""
+    global ENABLED
+    ENABLED = True
+    _start_tracing()
+
+
+def reset():
+    """Drop everything collected so far"""
+    with _records_lock:
+        _records.clear()
+
+
+def records():
+    """Return a copy of the collected phase records"""
+    with _records_lock:
+        return list(_records)
+
+
+def _start_tracing():
+    import tracemalloc
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+class _Phase:
+    """One timed phase; nested phases propagate their peak to the enclosing one (see the module notes on threads)"""
+
+    __slots__ = ("name", "slide", "peak", "_start", "_blocks", "_current")
+
+    def __init__(self, name, slide):
+        self.name = name
+        self.slide = slide
+        self.peak = 0
+
+    def __enter__(self):
+        import tracemalloc
+        stack = _local.__dict__.setdefault("stack", [])
+        if stack:
+            # Resetting the peak below would lose the parent's high-water mark so far
+            stack[-1].peak = max(stack[-1].peak, tracemalloc.get_traced_memory()[1])
+        stack.append(self)
+        tracemalloc.reset_peak()
+        self._current = tracemalloc.get_traced_memory()[0]
+        self._blocks = sys.getallocatedblocks()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        import tracemalloc
+        wall = time.perf_counter() - self._start
+        blocks = sys.getallocatedblocks() - self._blocks
+        self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+        stack = _local.stack
+        stack.pop()
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, self.peak)
+        record = {
+            "phase": self.name,
+            "slide": self.slide,
+            "wall_s": wall,
+            "net_blocks": blocks,
+            "peak_bytes": max(self.peak - self._current, 0),
+        }
+        with _records_lock:
+            _records.append(record)
+        return False
+
+
+def phase(name, slide=None):
+    """Context manager timing one phase (optionally one slide); a no-op when disabled"""
+    if not ENABLED:
+        return _NULL
+    return _Phase(name, slide)
+
+
+def profiled(name):
+    """Decorator recording every call as a phase; returns the function unchanged when disabled"""
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _Phase(name, None):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def summary(items=None):
+    """Aggregate records per phase: calls, total/max wall time, net blocks, max peak"""
+    phases = {}
+    for record in records() if items is None else items:
+        entry = phases.setdefault(record["phase"], {
+            "calls": 0, "wall_s": 0.0, "max_wall_s": 0.0, "net_blocks": 0, "peak_bytes": 0,
+        })
+        entry["calls"] += 1
+        entry["wall_s"] += record["wall_s"]
+        entry["max_wall_s"] = max(entry["max_wall_s"], record["wall_s"])
+        entry["net_blocks"] += record["net_blocks"]
+        entry["peak_bytes"] = max(entry["peak_bytes"], record["peak_bytes"])
+    return phases
+
+
+def to_json():
+    """Return the per-phase summary and the per-slide records as a JSON string"""
+    items = records()
+    slides = [record for record in items if record["slide"] is not None]
+    return json.dumps({"pid": os.getpid(), "phases": summary(items), "slides": slides}, indent=2)
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_prometheus():
+    """Return the per-phase summary in Prometheus text exposition format"""
+    metrics = (
+        ("calls_total", "counter", "Phase executions", "calls"),
+        ("seconds_total", "counter", "Wall time spent in the phase", "wall_s"),
+        ("max_seconds", "gauge", "Slowest single execution of the phase", "max_wall_s"),
+        # Blocks still allocated at the end of the phase minus those at its start; negative when it freed more
+        ("net_blocks", "gauge", "Net change in allocated Python memory blocks over the phase", "net_blocks"),
+        ("peak_bytes", "gauge", "Largest traced-memory peak above the phase's starting usage", "peak_bytes"),
+    )
+    phases = summary()
+    lines = []
+    for suffix, kind, help_text, field in metrics:
+        name = f"{METRIC_PREFIX}_{suffix}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for phase_name, entry in sorted(phases.items()):
+            lines.append(f'{name}{{phase="{_label(phase_name)}"}} {entry[field]}')
+    return "\n".join(lines) + "\n"
+
+
+def write_report(path):
+    """Write the report as Prometheus text for *.prom, JSON otherwise"""
+    path = path.replace("{pid}", str(os.getpid()))
+    with open(path, "w") as f:
+        f.write(to_prometheus() if path.endswith(".prom") else to_json())
+    return path
+
+
+def flush():
+    """Write the report to the path in HRD_PPTX_PROFILE, if it names one
+
+    Runs at exit; pool workers leave via os._exit, so long-lived workers call it themselves.
+    """
+    target = os.environ.get(PROFILE_ENV, "")
+    if target.endswith((".json", ".prom")) and records():
+        write_report(target)
+
+
+if ENABLED:
+    _start_tracing()
+    atexit.register(flush)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Render a spec with phase profiling enabled")
+    parser.add_argument("spec")
+    parser.add_argument("-o", "--output", default=None, help="write the report here (.json or .prom)")
+    args = parser.parse_args()
+
+    # Set before the renderers are imported so their @profiled hooks are installed; the hooks
+    # live in the imported `profiling` module, not in this __main__ copy
+    os.environ.setdefault(PROFILE_ENV, "1")
+    import profiling as hooks
+    import deck_spec
+    with hooks.phase("load_spec"):
+        spec = deck_spec.load_spec(args.spec)
+    with hooks.phase("total"):
+        output, slide_count = deck_spec.render_spec(spec, use_cache=False)
+
+    for name, entry in sorted(hooks.summary().items(), key=lambda item: -item[1]["wall_s"]):
+        print(f"⏱️  {name:>16}: {entry['wall_s'] * 1000:9.1f} ms over {entry['calls']:>4} calls, "
+              f"{entry['net_blocks']:>+8} net blocks, peak {entry['peak_bytes'] / 1e6:.2f} MB")
+    print(f"✅ {output}: {slide_count} slides")
+    if args.output:
+        print(f"📄 Report written to {hooks.write_report(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
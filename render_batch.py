@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Render many deck specs in parallel
+Each worker process keeps the template snapshot and renderer modules warm between decks
+
+Usage: python render_batch.py SPEC [SPEC ...] [-j WORKERS] [-o OUTPUT_DIR] [--check]
+"""
+
+import argparse
+import os
+import time
+import deck_spec
+import profiling
+
+
+def warm_worker(templates, renderers):
+    """Process-pool initializer: load snapshots and renderer modules once per worker"""
+    from template_cache import warm_template
+    for name in renderers:
+        deck_spec.renderer_for({"renderer": name})
+    for path in templates:
+        warm_template(path)
+
+
+def _render_one(spec_path, output_dir, use_cache, check):
+    """Render a single spec file inside a worker"""
+    start = time.perf_counter()
+    spec = deck_spec.load_spec(spec_path)
+    output = None
+    if output_dir:
+        output = os.path.join(output_dir, f"{spec['name']}.pptx")
+    output, slide_count = deck_spec.render_spec(spec, output, use_cache)
+    issues = []
+    if check:
+        from layout_check import check_file
+        issues = check_file(output)
+    profiling.flush()
+    return spec_path, output, slide_count, time.perf_counter() - start, issues
+
+
+def render_batch(spec_paths, workers=None, output_dir=None, use_cache=True, check=False):
+    """Render spec files across a process pool, yielding (spec, output, slides, seconds, layout issues) as each finishes"""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    specs = [deck_spec.load_spec(path) for path in spec_paths]
+    templates = sorted({spec["template"] for spec in specs if spec.get("renderer", "template") == "template" and "template" in spec})
+    renderers = sorted({spec.get("renderer", "template") for spec in specs})
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_worker, initargs=(templates, renderers)) as pool:
+        futures = [pool.submit(_render_one, path, output_dir, use_cache, check) for path in spec_paths]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render deck specs in parallel")
+    parser.add_argument("specs", nargs="+", help="deck spec files (.json, .yaml, .yml)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("-o", "--output-dir", default=None, help="write decks here instead of each spec's 'output'")
+    parser.add_argument("--no-cache", action="store_true", help="always render, bypassing the artifact cache")
+    parser.add_argument("--check", action="store_true", help="run the layout checker on every deck")
+    args = parser.parse_args()
+
+    from layout_check import format_issue
+    start = time.perf_counter()
+    count = 0
+    for spec_path, output, slide_count, seconds, issues in render_batch(
+            args.specs, args.workers, args.output_dir, not args.no_cache, args.check):
+        count += 1
+        print(f"✅ {output} ({slide_count} slides, {seconds:.2f}s) <- {spec_path}")
+        for issue in issues:
+            print(f"   {format_issue(issue)}")
+    elapsed = time.perf_counter() - start
+    print(f"📊 Rendered {count} decks in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
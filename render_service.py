@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Local deck rendering service
+Keeps the template and renderers warm in a worker pool and renders POSTed specs over HTTP
+
+Usage: python render_service.py [--host 127.0.0.1] [--port 8765] [-j WORKERS] [--queue N] [--root DIR]
+       python render_service.py --bench SPEC [-n REQUESTS] [--port 8765]
+
+  POST /render[?cache=0]  deck spec JSON -> .pptx bytes (400 bad spec, 413 too large, 503 busy)
+                          files the spec names must be under --root (default: HRD_PPTX_SERVICE_ROOT or the cwd)
+  GET  /health            pool size and in-flight renders
+  GET  /metrics           request counters in Prometheus text format
+"""
+
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import argparse
+import json
+import os
+import re
+import threading
+import time
+import zipfile
+import deck_spec
+from render_batch import warm_worker
+from template_cache import TEMPLATE_PATH
+
+PPTX_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+MAX_SPEC_BYTES = 10 * 1024 * 1024
+RENDER_TIMEOUT = 120
+# Seconds clients are told to wait when every worker and queue slot is taken
+RETRY_AFTER = 1
+MAX_NAME_LENGTH = 100
+# Directory the templates, data, table sources and images of requested specs must be under
+SERVICE_ROOT = os.environ.get("HRD_PPTX_SERVICE_ROOT", os.getcwd())
+
+# What a render raises because of the spec it was given (a layout, metric or file that is not
+# there, a category list that does not match, a template that is not a .pptx): answered with 400
+CLIENT_ERRORS = (deck_spec.SpecError, KeyError, IndexError, FileNotFoundError, zipfile.BadZipFile)
+
+
+class RenderError(Exception):
+    """Raised by a worker when a render failed on what the spec asked for"""
+
+
+def _render(spec, use_cache):
+    """Worker: render one spec to bytes"""
+    start = time.perf_counter()
+    try:
+        data, slide_count, cached = deck_spec.render_bytes(spec, use_cache)
+    except CLIENT_ERRORS as e:
+        # Sent back as a message: not every exception type survives the trip out of the worker
+        raise RenderError(f"{type(e).__name__}: {e}") from None
+    return data, slide_count, cached, time.perf_counter() - start
+
+
+def _spec_paths(spec):
+    """Yield (mapping, key) for every file a spec names"""
+    for key in ("template", "data"):
+        if key in spec:
+            yield spec, key
+    for slide in spec["slides"]:
+        if slide["type"] in deck_spec.SOURCE_TYPES and "source" in slide:
+            yield slide, "source"
+        if slide["type"] == "image":
+            yield slide, "image"
+
+
+def confine_paths(spec, root, allowed=()):
+    """Resolve the files a spec names against root in place, raising SpecError for any outside it
+
+    allowed lists files outside root a spec may still name (the templates the workers keep warm).
+    Symlinks are resolved first, so a link under root cannot point a render elsewhere.
+    """
+    root = os.path.realpath(root)
+    allowed = {os.path.realpath(path) for path in allowed}
+    for owner, key in _spec_paths(spec):
+        if not isinstance(owner[key], str) or not owner[key]:
+            raise deck_spec.SpecError(f"request: '{key}' must be a file path")
+        path = os.path.realpath(os.path.join(root, owner[key]))
+        if path not in allowed and os.path.commonpath((root, path)) != root:
+            raise deck_spec.SpecError(f"request: '{owner[key]}' is outside the service root")
+        owner[key] = path
+    return spec
+
+
+def download_name(name):
+    """Return a spec name as a .pptx file name safe to put in a Content-Disposition header"""
+    name = re.sub(r"[^A-Za-z0-9._ -]+", "_", str(name)).strip(" .")[:MAX_NAME_LENGTH]
+    return f"{name or 'deck'}.pptx"
+
+
+class RenderService:
+    """Worker pool plus admission control: at most workers + queue renders are accepted at once"""
+
+    def __init__(self, workers=None, queue=None, templates=(TEMPLATE_PATH,), root=SERVICE_ROOT):
+        self.workers = workers or os.cpu_count()
+        self.root = root
+        self.capacity = self.workers + (self.workers if queue is None else queue)
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.counters = {}
+        self.render_seconds = 0.0
+        self.templates = templates = [path for path in templates if os.path.exists(path)]
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=warm_worker,
+                                        initargs=(templates, sorted(deck_spec.RENDERERS)))
+        # Start every worker now so the first requests do not pay the warm-up
+        for future in [self.pool.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def count(self, status):
+        with self._lock:
+            self.counters[status] = self.counters.get(status, 0) + 1
+
+    def try_acquire(self):
+        """Take a render slot without waiting; False means the service is saturated"""
+        if not self._slots.acquire(blocking=False):
+            return False
+        with self._lock:
+            self.in_flight += 1
+        return True
+
+    def release(self):
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def render(self, spec, use_cache=True):
+        """Render in the pool; the caller must hold a slot, which is handed back once the render finishes
+
+        A caller that times out stops waiting, but its render keeps a worker busy until it is done,
+        so the slot stays taken until then too.
+        """
+        try:
+            future = self.pool.submit(_render, spec, use_cache)
+        except BaseException:
+            self.release()
+            raise
+        future.add_done_callback(lambda _: self.release())
+        result = future.result(timeout=RENDER_TIMEOUT)
+        with self._lock:
+            self.render_seconds += result[3]
+        return result
+
+    def metrics(self):
+        """Return counters in Prometheus text format"""
+        with self._lock:
+            counters = dict(self.counters)
+            in_flight, seconds = self.in_flight, self.render_seconds
+        lines = [
+            "# HELP hrd_pptx_service_requests_total Render requests by HTTP status",
+            "# TYPE hrd_pptx_service_requests_total counter",
+            *(f'hrd_pptx_service_requests_total{{status="{status}"}} {value}' for status, value in sorted(counters.items())),
+            "# HELP hrd_pptx_service_render_seconds_total Worker time spent rendering",
+            "# TYPE hrd_pptx_service_render_seconds_total counter",
+            f"hrd_pptx_service_render_seconds_total {seconds}",
+            "# HELP hrd_pptx_service_in_flight Renders accepted and not yet answered",
+            "# TYPE hrd_pptx_service_in_flight gauge",
+            f"hrd_pptx_service_in_flight {in_flight}",
+            "# HELP hrd_pptx_service_capacity Renders accepted at once before answering 503",
+            "# TYPE hrd_pptx_service_capacity gauge",
+            f"hrd_pptx_service_capacity {self.capacity}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    service = None
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, body, content_type="application/json", headers=()):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode("utf-8")
+        elif isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        if self.path.startswith("/render"):
+            self.service.count(status)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/health":
+            self._send(200, {"workers": self.service.workers, "capacity": self.service.capacity,
+                             "in_flight": self.service.in_flight})
+        elif path == "/metrics":
+            self._send(200, self.service.metrics(), "text/plain; version=0.0.4")
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/render":
+            self._send(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            self._send(400, {"error": "Content-Length must be a non-negative integer"})
+            return
+        if length > MAX_SPEC_BYTES:
+            self.close_connection = True
+            self._send(413, {"error": f"spec larger than {MAX_SPEC_BYTES} bytes"})
+            return
+        body = self.rfile.read(length)
+
+        try:
+            spec = json.loads(body)
+            deck_spec.validate_spec(spec, "request")
+            confine_paths(spec, self.service.root, self.service.templates)
+        except Exception as e:
+            # Whatever a malformed spec trips over, it is the client's error
+            message = str(e) if isinstance(e, ValueError) else f"request: malformed spec ({type(e).__name__}: {e})"
+            self._send(400, {"error": message})
+            return
+        spec.setdefault("name", "deck")
+        use_cache = parse_qs(url.query).get("cache", ["1"])[0] != "0"
+
+        if not self.service.try_acquire():
+            self._send(503, {"error": "render capacity exhausted"}, headers=[("Retry-After", str(RETRY_AFTER))])
+            return
+        try:
+            data, slide_count, cached, seconds = self.service.render(spec, use_cache)
+        except RenderError as e:
+            self._send(400, {"error": f"request: {e}"})
+            return
+        except FutureTimeout:
+            self._send(504, {"error": f"render took longer than {RENDER_TIMEOUT}s"})
+            return
+        except Exception as e:
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+
+        self._send(200, data, PPTX_TYPE, headers=[
+            ("Content-Disposition", f'attachment; filename="{download_name(spec["name"])}"'),
+            ("X-Slide-Count", str(slide_count)),
+            ("X-Render-Seconds", f"{seconds:.4f}"),
+            ("X-Cache", "hit" if cached else "miss"),
+        ])
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host="127.0.0.1", port=8765, workers=None, queue=None, root=SERVICE_ROOT):
+    """Run the service until interrupted"""
+    service = RenderService(workers, queue, root=root)
+    RenderHandler.service = service
+    server = ThreadingHTTPServer((host, port), RenderHandler)
+    server.daemon_threads = True
+    print(f"🚀 Rendering on http://{host}:{port} with {service.workers} warm workers (capacity {service.capacity})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+def bench(spec_path, requests=20, host="127.0.0.1", port=8765):
+    """POST a spec repeatedly (cache bypassed) and print latency percentiles"""
+    from urllib.request import Request, urlopen
+    body = json.dumps(deck_spec.load_spec(spec_path)).encode("utf-8")
+    latencies = []
+    for _ in range(requests):
+        request = Request(f"http://{host}:{port}/render?cache=0", data=body,
+                          headers={"Content-Type": "application/json"})
+        start = time.perf_counter()
+        with urlopen(request) as response:
+            response.read()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p95 = latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)]
+    print(f"📊 {requests} renders: p50 {p50 * 1000:.1f} ms, p95 {p95 * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve deck rendering over HTTP from warm workers")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--queue", type=int, default=None, help="renders allowed to wait for a worker (default: one per worker)")
+    parser.add_argument("--root", default=SERVICE_ROOT, help="directory spec files must be under (default: %(default)s)")
+    parser.add_argument("--bench", metavar="SPEC", help="measure latency against a running service instead")
+    parser.add_argument("-n", "--requests", type=int, default=20, help="requests sent by --bench")
+    args = parser.parse_args()
+
+    if args.bench:
+        bench(args.bench, args.requests, args.host, args.port)
+    else:
+        serve(args.host, args.port, args.workers, args.queue, args.root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Byte-for-byte reproducible .pptx packaging
+Stable zip entry order, fixed timestamps and attributes, and normalized embedded workbooks
+"""
+
+import hashlib
+import io
+import os
+import time
+import zipfile
+from profiling import phase
+from template_cache import file_sha256, write_atomic
+
+# Honour SOURCE_DATE_EPOCH (reproducible-builds.org), else the earliest date zip can store
+if os.environ.get("SOURCE_DATE_EPOCH"):
+    FIXED_DATE_TIME = time.gmtime(max(int(os.environ["SOURCE_DATE_EPOCH"]), 315532800))[:6]
+else:
+    FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+FIXED_W3CDTF = "%04d-%02d-%02dT%02d:%02d:%02dZ" % FIXED_DATE_TIME
+COMPRESS_LEVEL = 6
+
+# Source files whose changes alter rendered output; used to key caches on the renderer code.
+# Spec resolution, the emptied template and package pruning feed the bytes as much as the renderers do
+RENDER_SOURCES = (
+    "create_security_townhall.py",
+    "create_security_townhall_v2.py",
+    "deck_spec.py",
+    "template_cache.py",
+    "template_manifest.py",
+    "opc_zip.py",
+    "text_body.py",
+    "text_fit.py",
+    "metrics.py",
+    "metric_slides.py",
+    "table_slides.py",
+    "slide_images.py",
+    "brand.py",
+    "placeholder_index.py",
+    "slide_parts.py",
+    "reproducible.py",
+)
+
+NS_DCTERMS = "http://purl.org/dc/terms/"
+# Entries OPC consumers like to see first
+LEADING_ENTRIES = ("[Content_Types].xml", "_rels/.rels")
+# Embedded OOXML packages (chart data workbooks) carry their own timestamps
+NESTED_PACKAGE_EXTENSIONS = (".xlsx", ".docx", ".pptx")
+
+_code_hash = None
+
+
+def code_hash():
+    """Return a hash of the renderer source files, computed once per process"""
+    global _code_hash
+    if _code_hash is None:
+        here = os.path.dirname(os.path.abspath(__file__))
+        digest = hashlib.sha256()
+        for name in RENDER_SOURCES:
+            digest.update(file_sha256(os.path.join(here, name)).encode())
+        _code_hash = digest.hexdigest()
+    return _code_hash
+
+
+def zip_info(name, compress_type=zipfile.ZIP_DEFLATED):
+    """Return a ZipInfo with fixed timestamp and attributes"""
+    info = zipfile.ZipInfo(name, date_time=FIXED_DATE_TIME)
+    info.compress_type = compress_type
+    info.create_system = 0
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def _entry_order(names):
+    leading = [name for name in LEADING_ENTRIES if name in names]
+    return leading + sorted(name for name in names if name not in LEADING_ENTRIES)
+
+
+def _fix_core_dates(blob):
+    """Pin dcterms:created/modified in a core-properties part"""
+    from lxml import etree
+    root = etree.fromstring(blob)
+    for tag in ("created", "modified"):
+        element = root.find(f"{{{NS_DCTERMS}}}{tag}")
+        if element is not None:
+            element.text = FIXED_W3CDTF
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def write_package(files, compresslevel=COMPRESS_LEVEL, nested=False):
+    """Zip {entry name: bytes} deterministically: fixed order, timestamps and attributes
+
+    Embedded packages are normalized recursively, including their core-property dates
+    (XlsxWriter stamps chart workbooks with the current time). The outer package's
+    own core properties come from the template and are left alone.
+    """
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zout:
+        for name in _entry_order(files):
+            blob = files[name]
+            if name.endswith(NESTED_PACKAGE_EXTENSIONS):
+                blob = normalize_package(blob, compresslevel, nested=True)
+            elif nested and name == "docProps/core.xml":
+                blob = _fix_core_dates(blob)
+            zout.writestr(zip_info(name), blob, compresslevel=compresslevel)
+    return out.getvalue()
+
+
+def normalize_package(data, compresslevel=COMPRESS_LEVEL, nested=False):
+    """Re-zip an OOXML package deterministically"""
+    with zipfile.ZipFile(io.BytesIO(data)) as zin:
+        files = {name: zin.read(name) for name in zin.namelist()}
+    return write_package(files, compresslevel, nested)
+
+
+def deterministic_bytes(prs, compresslevel=COMPRESS_LEVEL):
+    """Serialize a presentation to reproducible bytes"""
+    out = io.BytesIO()
+    with phase("save"):
+        prs.save(out)
+    with phase("normalize"):
+        return normalize_package(out.getvalue(), compresslevel)
+
+
+def save_deterministic(prs, path, compresslevel=COMPRESS_LEVEL):
+    """Save a presentation so identical content always produces identical bytes"""
+    data = deterministic_bytes(prs, compresslevel)
+    write_atomic(path, data)
+    return data
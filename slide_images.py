@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Screenshots and diagrams on slides
+Images are downscaled to the size they are shown at (at a target DPI) on a thread pool, cached by source hash
+and target size (least recently used evicted first), and each source is embedded once per deck
+
+Usage: python slide_images.py IMAGE [IMAGE ...] [--width 9] [--height 5.5] [--dpi 150] [--workers N]
+"""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import hashlib
+import io
+import json
+import os
+from template_cache import CACHE_DIR, file_sha256, write_atomic
+
+IMAGE_DIR = os.path.join(CACHE_DIR, "images")
+IMAGE_CACHE_MAX_BYTES = int(os.environ.get("HRD_PPTX_IMAGE_CACHE_BYTES", 256 << 20))
+IMAGE_SUFFIXES = (".jpg", ".png")
+# Bump when the processing below changes, so cached renditions are not reused
+IMAGE_VERSION = 2
+
+EMU_PER_INCH = 914400
+# Sharp on a projector and on a laptop screen at 1x-1.5x zoom
+TARGET_DPI = 150
+JPEG_QUALITY = 85
+# Pillow releases the GIL while decoding, resizing and encoding
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# EXIF orientations that swap width and height
+_TRANSPOSED = (5, 6, 7, 8)
+
+# One image to show in a box of width x height EMU; cover fills the box (and is cropped), else it fits inside
+ImageRequest = namedtuple("ImageRequest", "source width height dpi cover", defaults=(TARGET_DPI, False))
+
+
+def _source_info(path):
+    """Return (pixel size as displayed, Pillow format) of an image, reading only its header"""
+    from PIL import Image
+    with Image.open(path) as image:
+        width, height = image.size
+        if image.getexif().get(0x0112) in _TRANSPOSED:
+            width, height = height, width
+        return (width, height), image.format
+
+
+def target_pixels(size, request):
+    """Return the pixel size an image of `size` pixels needs to fill its box at the request's DPI (never larger)"""
+    box_w = request.width / EMU_PER_INCH * request.dpi
+    box_h = request.height / EMU_PER_INCH * request.dpi
+    ratios = (box_w / size[0], box_h / size[1])
+    scale = min(max(ratios) if request.cover else min(ratios), 1.0)
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def image_key(digest, pixels, fmt):
+    """Return the cache key of one rendition: source hash, target size and output format"""
+    payload = json.dumps({"source": digest, "pixels": pixels, "format": fmt, "quality": JPEG_QUALITY,
+                          "version": IMAGE_VERSION}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def image_path(name):
+    """Return the cache file of a prepared image name"""
+    return os.path.join(IMAGE_DIR, name[:2], name)
+
+
+def _output_format(source_format):
+    # Photos stay JPEG; screenshots and diagrams (flat colors, sharp text) stay lossless
+    return "JPEG" if source_format in ("JPEG", "MPO") else "PNG"
+
+
+def _render(path, pixels, fmt):
+    """Return the encoded bytes of an image scaled to pixels, or the source bytes when they are smaller"""
+    from PIL import Image, ImageOps
+    with open(path, "rb") as f:
+        original = f.read()
+    with Image.open(io.BytesIO(original)) as image:
+        transposed = image.getexif().get(0x0112, 1) != 1
+        if fmt == "JPEG":
+            # Lets the decoder skip detail the target size throws away
+            image.draft("RGB", pixels[::-1] if image.getexif().get(0x0112) in _TRANSPOSED else pixels)
+        icc_profile = image.info.get("icc_profile")
+        image = ImageOps.exif_transpose(image)
+        if fmt == "JPEG" and image.mode != "RGB":
+            image = image.convert("RGB")
+        elif fmt == "PNG" and image.mode not in ("1", "L", "LA", "P", "RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        resized = image.size != pixels
+        if resized:
+            # Pillow resizes palette and 1-bit images with NEAREST whatever filter is asked for
+            palette = image.mode == "P"
+            if palette:
+                image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+            elif image.mode == "1":
+                image = image.convert("L")
+            image = image.resize(pixels, Image.LANCZOS, reducing_gap=3.0)
+            if palette:
+                # Back to 256 colors, so a palette screenshot stays as small as it was
+                image = image.quantize(256, Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+        out = io.BytesIO()
+        options = {"quality": JPEG_QUALITY, "optimize": True} if fmt == "JPEG" else {"optimize": True}
+        image.save(out, fmt, icc_profile=icc_profile, **options)
+    data = out.getvalue()
+    # A source already at size wins if it is smaller (PowerPoint ignores EXIF orientation, so not if rotated)
+    if not resized and not transposed and len(original) <= len(data) and _source_info(path)[1] == fmt:
+        return original
+    return data
+
+
+def evict_images(max_bytes=IMAGE_CACHE_MAX_BYTES):
+    """Delete least-recently-used renditions until the image cache fits in max_bytes; returns bytes freed"""
+    from artifact_cache import evict
+    return evict(max_bytes, IMAGE_DIR, IMAGE_SUFFIXES)
+
+
+def prepare_images(requests, workers=MAX_WORKERS):
+    """Return the prepared image name (see image_path) for each ImageRequest, rendering misses in parallel
+
+    Requests for the same source file contents share one rendition, large enough in both
+    dimensions for every box it is shown in, so a deck embeds each picture once however
+    many slides show it. The cache is evicted first, so this call's images stay on disk.
+    """
+    requests = [ImageRequest(*request) for request in requests]
+    evict_images()
+    with ThreadPoolExecutor(workers) as pool:
+        paths = sorted({request.source for request in requests})
+        digests = dict(zip(paths, pool.map(file_sha256, paths)))
+        infos = dict(zip(paths, pool.map(_source_info, paths)))
+
+        # Per source contents: the largest width and height any request needs
+        targets = {}
+        for request in requests:
+            size, source_format = infos[request.source]
+            pixels = target_pixels(size, request)
+            digest = digests[request.source]
+            if digest in targets:
+                pixels = tuple(map(max, pixels, targets[digest][1]))
+            targets[digest] = (request.source, pixels, _output_format(source_format))
+
+        names, jobs = {}, {}
+        for digest, (source, pixels, fmt) in targets.items():
+            name = f"{image_key(digest, pixels, fmt)}.{'jpg' if fmt == 'JPEG' else 'png'}"
+            names[digest] = name
+            try:
+                # Mark as recently used for LRU eviction
+                os.utime(image_path(name))
+            except FileNotFoundError:
+                jobs[name] = pool.submit(_render, source, pixels, fmt)
+        for name, job in jobs.items():
+            write_atomic(image_path(name), job.result())
+    return [names[digests[request.source]] for request in requests]
+
+
+def picture_box(name, left, top, width, height):
+    """Return (left, top, width, height) of a prepared image fitted and centered in an area"""
+    from PIL import Image
+    with Image.open(image_path(name)) as image:
+        pixel_w, pixel_h = image.size
+    scale = min(width / pixel_w, height / pixel_h)
+    fitted_w, fitted_h = round(pixel_w * scale), round(pixel_h * scale)
+    return left + (width - fitted_w) // 2, top + (height - fitted_h) // 2, fitted_w, fitted_h
+
+
+def _describe(picture, description):
+    """Set a picture's alt text (read out by screen readers) instead of the cache file name python-pptx puts there"""
+    picture._element.nvPicPr.cNvPr.set("descr", description or "")
+    return picture
+
+
+def add_image(slide, name, left, top, width, height, description=None):
+    """Add a prepared image to a slide, fitted and centered in an area, with alt text"""
+    picture = slide.shapes.add_picture(image_path(name), *picture_box(name, left, top, width, height))
+    picture.name = f"Picture {description or os.path.splitext(name)[0][:8]}"
+    return _describe(picture, description)
+
+
+def insert_image(slide, idx, source, dpi=TARGET_DPI, description=None):
+    """Show an image file in a slide's placeholder, scaled to the placeholder's size
+
+    Picture placeholders are filled (and cropped) the way PowerPoint does; any other
+    placeholder is replaced by the picture fitted into its area.
+    """
+    from pptx.enum.shapes import PP_PLACEHOLDER
+    from placeholder_index import placeholder, remove_placeholder, slide_placeholders
+    shape = placeholder(slide, idx)
+    cover = shape.placeholder_format.type == PP_PLACEHOLDER.PICTURE
+    name, = prepare_images([ImageRequest(source, shape.width, shape.height, dpi, cover)])
+    if cover:
+        picture = shape.insert_picture(image_path(name))
+        # insert_picture swaps in a new p:pic element and leaves the old proxy without one
+        slide_placeholders(slide)[idx] = picture
+        return _describe(picture, description)
+    area = (shape.left, shape.top, shape.width, shape.height)
+    remove_placeholder(slide, idx)
+    return add_image(slide, name, *area, description=description)
+
+
+def main():
+    import time
+    parser = argparse.ArgumentParser(description="Prepare images for slides and show the bytes saved")
+    parser.add_argument("images", nargs="+")
+    parser.add_argument("--width", type=float, default=9, help="box width in inches (default: 9)")
+    parser.add_argument("--height", type=float, default=5.5, help="box height in inches (default: 5.5)")
+    parser.add_argument("--dpi", type=int, default=TARGET_DPI)
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    box = (round(args.width * EMU_PER_INCH), round(args.height * EMU_PER_INCH))
+    names = prepare_images([ImageRequest(path, *box, args.dpi) for path in args.images], args.workers)
+    seconds = time.perf_counter() - start
+    before = after = 0
+    for path, name in zip(args.images, names):
+        size, prepared = os.path.getsize(path), os.path.getsize(image_path(name))
+        before, after = before + size, after + prepared
+        print(f"🖼️  {path}: {size / 1024:,.1f} KiB -> {prepared / 1024:,.1f} KiB ({name[:12]})")
+    print(f"✅ {len(names)} images ({len(set(names))} unique): {before / 1024:,.1f} KiB -> "
+          f"{after / 1024:,.1f} KiB in {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
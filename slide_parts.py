@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Serialized slide fragments and a single-writer package assembler
+A fragment is one slide's XML plus its relationships and private parts (images, charts, ...),
+detached from any Presentation so it can be cached, pickled or built in another process
+"""
+
+from collections import namedtuple
+from lxml import etree
+import hashlib
+import io
+import json
+import posixpath
+import re
+import uuid
+import zipfile
+import opc_zip
+from reproducible import NESTED_PACKAGE_EXTENSIONS, normalize_package, zip_info
+
+# xml: slide part bytes
+# rels: [(rId, reltype, target, kind)] where kind is "base" (target is a part name in the
+#       base package), "part" (target is a key into parts), "external" (target is a URL),
+#       "slide" (target is a 1-based slide number in the assembled deck) or "owner" (the
+#       slide that the part belongs to, as a notes slide points back at its slide)
+# parts: {key: SlidePart} for parts only this slide uses
+SlideFragment = namedtuple("SlideFragment", "xml rels parts")
+SlidePart = namedtuple("SlidePart", "partname content_type blob rels")
+
+# Relationships never carried over: notes point back at their slide and are not generated
+SKIPPED_RELTYPES = (opc_zip.RT_NOTES_SLIDE,)
+
+# Parts under these directories are written once per content hash and shared between slides;
+# everything else (charts, notes, ...) is private to the slide that uses it, as PowerPoint expects
+SHARED_PART_DIRS = ("ppt/media/",)
+
+# Bumped whenever the stored fragment layout changes so stale fragments read as misses
+FRAGMENT_VERSION = 1
+
+P = f"{{{opc_zip.NS_P}}}"
+NS_P14 = "http://schemas.microsoft.com/office/powerpoint/2010/main"
+P14 = f"{{{NS_P14}}}"
+
+
+def part_key(content_type, blob, rels):
+    """Content hash of a part including what it points at, so identical parts dedupe"""
+    digest = hashlib.sha1(content_type.encode())
+    digest.update(blob)
+    for rel in rels:
+        digest.update(repr(rel).encode())
+    return digest.hexdigest()
+
+
+def _detach_rels(part, base_partnames, parts):
+    """Return a part's relationships as fragment tuples, detaching private parts into `parts`"""
+    detached = []
+    for rId, rel in sorted(part.rels.items()):
+        if rel.reltype in SKIPPED_RELTYPES:
+            continue
+        if rel.is_external:
+            detached.append((rId, rel.reltype, rel.target_ref, "external"))
+            continue
+        target = rel.target_part
+        partname = target.partname.lstrip("/")
+        if partname in base_partnames:
+            detached.append((rId, rel.reltype, partname, "base"))
+            continue
+        child_rels = _detach_rels(target, base_partnames, parts)
+        blob = target.blob
+        if partname.endswith(NESTED_PACKAGE_EXTENSIONS):
+            # Chart workbooks carry their creation time; normalized, identical data dedupes
+            blob = normalize_package(blob, nested=True)
+        key = part_key(target.content_type, blob, child_rels)
+        parts.setdefault(key, SlidePart(partname, target.content_type, blob, child_rels))
+        detached.append((rId, rel.reltype, key, "part"))
+    return detached
+
+
+def extract_fragment(slide, base_partnames):
+    """Detach a rendered slide into a SlideFragment"""
+    parts = {}
+    rels = _detach_rels(slide.part, base_partnames, parts)
+    return SlideFragment(slide.part.blob, rels, parts)
+
+
+def _rel_tuples(rels):
+    return [tuple(rel) for rel in rels]
+
+
+def fragment_bytes(fragment):
+    """Serialize a fragment as a zip: slide.xml, one entry per part blob and fragment.json for the rest"""
+    index = {
+        "version": FRAGMENT_VERSION,
+        "rels": fragment.rels,
+        "parts": {key: {"partname": part.partname, "content_type": part.content_type, "rels": part.rels}
+                  for key, part in fragment.parts.items()},
+    }
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("fragment.json", json.dumps(index))
+        zf.writestr("slide.xml", fragment.xml)
+        for key, part in fragment.parts.items():
+            zf.writestr(f"parts/{key}", part.blob)
+    return out.getvalue()
+
+
+def parse_fragment(data):
+    """Read a fragment written by fragment_bytes; raises ValueError for another version"""
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        index = json.loads(zf.read("fragment.json"))
+        if index.get("version") != FRAGMENT_VERSION:
+            raise ValueError(f"fragment version {index.get('version')!r}, expected {FRAGMENT_VERSION}")
+        parts = {
+            key: SlidePart(part["partname"], part["content_type"], zf.read(f"parts/{key}"), _rel_tuples(part["rels"]))
+            for key, part in index["parts"].items()
+        }
+        return SlideFragment(zf.read("slide.xml"), _rel_tuples(index["rels"]), parts)
+
+
+def base_partnames(base_bytes):
+    """Return the set of part names in a base package"""
+    with zipfile.ZipFile(io.BytesIO(base_bytes)) as zf:
+        return {name for name in zf.namelist() if not name.endswith(".rels") and name != opc_zip.CONTENT_TYPES}
+
+
+def _serialize(element):
+    return etree.tostring(element, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+class PackageWriter:
+    """Assemble a .pptx from a base package (template, no slides) plus slide fragments
+
+    Slides are written to the output zip as soon as they are added; media parts are
+    written once per content hash. presentation.xml, its rels and [Content_Types].xml
+    are written on close(). The base has no slides, so slide N is always ppt/slides/slideN.xml.
+    """
+
+    def __init__(self, base_bytes, output, compression=zipfile.ZIP_DEFLATED):
+        with zipfile.ZipFile(io.BytesIO(base_bytes)) as zf:
+            self._base = {info.filename: zf.read(info.filename) for info in zf.infolist()}
+        self._zip = zipfile.ZipFile(output, "w", compression)
+        self._compression = compression
+        self._overrides = {}
+        self._written = {}       # part key (or (slide, part key) for unshared parts) -> part name
+        self._counters = {}      # (directory, stem, ext) -> last number used
+        self._slides = []        # slide part names, in order
+        self._sections = []      # (name, index of the section's first slide)
+        self._taken = {name for name in self._base}
+
+        for name, blob in self._base.items():
+            if name in (opc_zip.PRESENTATION, opc_zip.rels_name(opc_zip.PRESENTATION), opc_zip.CONTENT_TYPES):
+                continue
+            self._write(name, blob)
+
+    def _write(self, name, blob):
+        """Write one entry with a fixed timestamp so identical input gives identical bytes"""
+        self._zip.writestr(zip_info(name, self._compression), blob)
+
+    def _new_partname(self, template):
+        """Return an unused part name shaped like `template` (e.g. ppt/media/image7.png)"""
+        directory, name = posixpath.split(template)
+        stem, ext = posixpath.splitext(name)
+        stem = re.sub(r"\d+$", "", stem)
+        key = (directory, stem, ext)
+        number = self._counters.get(key, 0)
+        while True:
+            number += 1
+            candidate = posixpath.join(directory, f"{stem}{number}{ext}")
+            if candidate not in self._taken:
+                self._counters[key] = number
+                self._taken.add(candidate)
+                return candidate
+
+    def _write_rels(self, owner, rels, parts, slide):
+        """Write owner's .rels, writing any private parts it points at first"""
+        if not rels:
+            return
+        resolved = []
+        for rId, reltype, target, kind in rels:
+            if kind == "external":
+                resolved.append((rId, reltype, target, True))
+                continue
+            if kind == "part":
+                target = self._write_part(target, parts, slide)
+            elif kind == "slide":
+                target = f"ppt/slides/slide{target}.xml"
+            elif kind == "owner":
+                target = slide
+            resolved.append((rId, reltype, opc_zip.relative_target(owner, target), False))
+        self._write(opc_zip.rels_name(owner), opc_zip.serialize_rels(resolved))
+
+    def _write_part(self, key, parts, slide):
+        """Write a part once per content key (per slide, unless it is media), returning its part name"""
+        part = parts[key]
+        written_key = key if part.partname.startswith(SHARED_PART_DIRS) else (slide, key)
+        partname = self._written.get(written_key)
+        if partname is not None:
+            return partname
+        partname = self._new_partname(part.partname)
+        self._written[written_key] = partname
+        self._write(partname, part.blob)
+        self._overrides[partname] = part.content_type
+        self._write_rels(partname, part.rels, parts, slide)
+        return partname
+
+    def add_slide(self, fragment):
+        """Append a slide to the deck, writing its parts immediately"""
+        partname = self._new_partname("ppt/slides/slide1.xml")
+        self._write(partname, fragment.xml)
+        self._overrides[partname] = opc_zip.CT_SLIDE
+        self._write_rels(partname, fragment.rels, fragment.parts, partname)
+        self._slides.append(partname)
+        return partname
+
+    def add_section(self, name):
+        """Start a named section (as shown in PowerPoint's slide sorter) at the next slide added"""
+        self._sections.append((name, len(self._slides)))
+
+    def _sections_ext(self):
+        """Return the presentation extension listing the sections, by slide ID"""
+        ext = etree.Element(f"{P}ext", uri=opc_zip.SECTIONS_EXT_URI)
+        section_lst = etree.SubElement(ext, f"{P14}sectionLst", nsmap={"p14": NS_P14})
+        sections = self._sections
+        if sections[0][1] > 0:
+            # Every slide must be in a section
+            sections = [("Default Section", 0), *sections]
+        bounds = [start for _, start in sections[1:]] + [len(self._slides)]
+        for (name, start), end in zip(sections, bounds):
+            # Section IDs are GUIDs; derived from the section so identical merges give identical bytes
+            guid = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{start}/{name}")).upper()
+            section = etree.SubElement(section_lst, f"{P14}section", name=name, id=f"{{{guid}}}")
+            ids = etree.SubElement(section, f"{P14}sldIdLst")
+            for number in range(start, end):
+                etree.SubElement(ids, f"{P14}sldId", id=str(256 + number))
+        return ext
+
+    def close(self):
+        """Write presentation.xml, its rels and content types, then close the zip"""
+        rels_name = opc_zip.rels_name(opc_zip.PRESENTATION)
+        rels = opc_zip.parse_rels(self._base.get(rels_name))
+        used = {rId for rId, _, _, _ in rels}
+        presentation = etree.fromstring(self._base[opc_zip.PRESENTATION])
+
+        # Slide lists, custom shows and sections of the base refer to slides that are not carried over
+        opc_zip.remove_slide_lists(presentation)
+        sld_id_lst = etree.Element(f"{P}sldIdLst")
+        next_rid = 1
+        for number, slide in enumerate(self._slides):
+            while f"rId{next_rid}" in used:
+                next_rid += 1
+            rId = f"rId{next_rid}"
+            used.add(rId)
+            rels.append((rId, opc_zip.RT_SLIDE, opc_zip.relative_target(opc_zip.PRESENTATION, slide), False))
+            sld_id = etree.SubElement(sld_id_lst, f"{P}sldId")
+            sld_id.set("id", str(256 + number))
+            sld_id.set(f"{{{opc_zip.NS_R}}}id", rId)
+        if self._slides:
+            # sldIdLst follows the master/notes/handout lists and precedes sldSz
+            anchor = None
+            for tag in ("handoutMasterIdLst", "notesMasterIdLst", "sldMasterIdLst"):
+                anchor = presentation.find(f"{P}{tag}")
+                if anchor is not None:
+                    break
+            if anchor is not None:
+                anchor.addnext(sld_id_lst)
+            else:
+                presentation.insert(0, sld_id_lst)
+        if self._sections:
+            ext_lst = presentation.find(f"{P}extLst")
+            if ext_lst is None:
+                ext_lst = etree.SubElement(presentation, f"{P}extLst")
+            ext_lst.append(self._sections_ext())
+
+        types = etree.fromstring(self._base[opc_zip.CONTENT_TYPES])
+        for partname, content_type in self._overrides.items():
+            override = etree.SubElement(types, f"{{{opc_zip.NS_CT}}}Override")
+            override.set("PartName", f"/{partname}")
+            override.set("ContentType", content_type)
+
+        self._write(opc_zip.PRESENTATION, _serialize(presentation))
+        self._write(rels_name, opc_zip.serialize_rels(rels))
+        self._write(opc_zip.CONTENT_TYPES, _serialize(types))
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._zip.close()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Streaming analyzer for template and deck archives
+Reads slide parts straight out of the zip with iterparse, one shape at a time, so memory stays
+bounded no matter how big the deck is; many archives are analyzed in parallel
+
+Usage: python stream_analyzer.py DECK [DECK ...] [-j WORKERS]
+"""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from lxml import etree
+import argparse
+import json
+import os
+import zipfile
+import opc_zip
+
+P = f"{{{opc_zip.NS_P}}}"
+A = f"{{{opc_zip.NS_A}}}"
+R = f"{{{opc_zip.NS_R}}}"
+
+SHAPE_TAGS = (f"{P}sp", f"{P}pic", f"{P}graphicFrame", f"{P}cxnSp")
+STREAM_TAGS = (f"{P}cSld", f"{P}bg") + SHAPE_TAGS
+
+
+def _fill_color(fill_parent):
+    """Return the color of a solid fill under fill_parent, or None"""
+    if fill_parent is None:
+        return None
+    solid = fill_parent.find(f"{A}solidFill")
+    if solid is None or not len(solid):
+        return None
+    color = solid[0]
+    return color.get("val") or color.get("lastClr")
+
+
+def _shape_facts(shape):
+    """Extract name, placeholder, geometry, fonts, sizes, colors and fill from one shape element"""
+    c_nv_pr = shape.find(f".//{P}cNvPr")
+    facts = {"kind": etree.QName(shape).localname, "name": c_nv_pr.get("name") if c_nv_pr is not None else None}
+
+    ph = shape.find(f".//{P}nvPr/{P}ph")
+    if ph is not None:
+        facts["placeholder"] = {"idx": int(ph.get("idx", 0)), "type": ph.get("type", "obj")}
+
+    xfrm = shape.find(f"{P}spPr/{A}xfrm")
+    if xfrm is None:
+        xfrm = shape.find(f"{P}xfrm")
+    if xfrm is not None:
+        off, ext = xfrm.find(f"{A}off"), xfrm.find(f"{A}ext")
+        if off is not None and ext is not None:
+            facts["geometry"] = [int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy"))]
+
+    fill = _fill_color(shape.find(f"{P}spPr"))
+    if fill:
+        facts["fill"] = fill
+
+    fonts, sizes, colors = Counter(), Counter(), Counter()
+    for tag in ("rPr", "defRPr", "endParaRPr"):
+        for run_props in shape.iter(f"{A}{tag}"):
+            if run_props.get("sz"):
+                sizes[int(run_props.get("sz")) / 100] += 1
+            latin = run_props.find(f"{A}latin")
+            if latin is not None:
+                fonts[latin.get("typeface")] += 1
+            color = _fill_color(run_props)
+            if color:
+                colors[color] += 1
+    text = "".join(t.text or "" for t in shape.iter(f"{A}t"))
+    if text:
+        facts["text"] = text[:50]
+    return facts, fonts, sizes, colors
+
+
+def stream_part(zf, partname):
+    """Stream one slide/layout/master part, returning its facts with bounded memory"""
+    facts = {"part": partname, "name": None, "background": None, "shapes": []}
+    fonts, sizes, colors = Counter(), Counter(), Counter()
+
+    with zf.open(partname) as f:
+        for event, elem in etree.iterparse(f, events=("start", "end"), tag=STREAM_TAGS):
+            if elem.tag == f"{P}cSld":
+                if event == "start":
+                    facts["name"] = elem.get("name")
+                continue
+            if event != "end":
+                continue
+            if elem.tag == f"{P}bg":
+                facts["background"] = _fill_color(elem.find(f"{P}bgPr"))
+            else:
+                shape, shape_fonts, shape_sizes, shape_colors = _shape_facts(elem)
+                facts["shapes"].append(shape)
+                fonts.update(shape_fonts)
+                sizes.update(shape_sizes)
+                colors.update(shape_colors)
+
+            # Release the element and everything parsed before it
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    facts["fonts"] = dict(fonts)
+    facts["sizes"] = {str(size): count for size, count in sorted(sizes.items())}
+    facts["colors"] = dict(colors)
+    return facts
+
+
+def _ordered_targets(zf, files, partname, id_tag):
+    """Return the part names listed (in order) by an id list such as sldIdLst or sldLayoutIdLst"""
+    rels = {rId: opc_zip.resolve_target(partname, target) for rId, _, target, external in opc_zip.part_rels(files, partname) if not external}
+    ordered = []
+    with zf.open(partname) as f:
+        for _, elem in etree.iterparse(f, tag=f"{P}{id_tag}"):
+            ordered.append(rels[elem.get(f"{R}id")])
+            elem.clear()
+    return ordered
+
+
+def analyze_archive(path):
+    """Analyze one .pptx, streaming each part; returns a JSON-serializable dict"""
+    with zipfile.ZipFile(path) as zf:
+        # Only .rels entries are read whole; they are tiny
+        files = {name: zf.read(name) for name in zf.namelist() if name.endswith(".rels")}
+
+        slide_size = None
+        with zf.open(opc_zip.PRESENTATION) as f:
+            for _, elem in etree.iterparse(f, tag=f"{P}sldSz"):
+                slide_size = [int(elem.get("cx")), int(elem.get("cy"))]
+
+        layouts = []
+        for master in _ordered_targets(zf, files, opc_zip.PRESENTATION, "sldMasterId"):
+            for layout_part in _ordered_targets(zf, files, master, "sldLayoutId"):
+                layout = stream_part(zf, layout_part)
+                layout["index"] = len(layouts)
+                layouts.append(layout)
+        layout_by_part = {layout["part"]: layout for layout in layouts}
+
+        slides = []
+        for slide_part in _ordered_targets(zf, files, opc_zip.PRESENTATION, "sldId"):
+            slide = stream_part(zf, slide_part)
+            for _, reltype, target, _ in opc_zip.part_rels(files, slide_part):
+                if reltype == opc_zip.RT_SLIDE_LAYOUT:
+                    layout = layout_by_part.get(opc_zip.resolve_target(slide_part, target))
+                    slide["layout"] = {"index": layout["index"], "name": layout["name"]} if layout else None
+            slides.append(slide)
+
+    return {
+        "path": os.path.abspath(path),
+        "size": os.path.getsize(path),
+        "slide_size": slide_size,
+        "layouts": layouts,
+        "slides": slides,
+    }
+
+
+def analyze_archives(paths, workers=None):
+    """Analyze many archives across a process pool, yielding results in input order"""
+    if len(paths) == 1:
+        yield analyze_archive(paths[0])
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(analyze_archive, paths, chunksize=4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream-analyze .pptx archives (one JSON line per archive)")
+    parser.add_argument("decks", nargs="+")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    for facts in analyze_archives(args.decks, args.workers):
+        print(json.dumps(facts, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
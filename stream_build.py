@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Memory-bounded and parallel builds of very large decks
+Slides are rendered (optionally by worker processes, in chunks) and a single writer streams them into the output zip
+
+Usage: python stream_build.py SPEC [-o OUTPUT] [-j WORKERS]
+"""
+
+import argparse
+import os
+import time
+import deck_spec
+from incremental_build import base_package, iter_fragments
+from profiling import phase
+from slide_parts import PackageWriter
+from template_cache import temporary_path
+
+# Slides per worker task: enough to amortize pickling, small enough to keep every worker busy
+MAX_CHUNK = 200
+CHUNKS_PER_WORKER = 4
+# Finished chunks waiting for the writer are bounded to this many per worker
+CHUNKS_IN_FLIGHT = 2
+
+
+def _render_chunk(deck, slide_specs):
+    """Worker: render a run of slides into fragments"""
+    return list(iter_fragments(deck, slide_specs))
+
+
+def _parallel_fragments(spec, workers):
+    """Yield fragments in deck order, rendered in chunks across a process pool"""
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    from render_batch import warm_worker
+    slides = spec["slides"]
+    size = max(1, min(MAX_CHUNK, -(-len(slides) // (workers * CHUNKS_PER_WORKER))))
+    # Layout names and auto sizes are already resolved, so workers only render; the deck
+    # settings go with every task but the slide list does not
+    deck = {key: value for key, value in spec.items() if key != "slides"}
+    templates = [deck["template"]] if deck.get("renderer", "template") == "template" and "template" in deck else []
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_worker,
+                             initargs=(templates, [deck.get("renderer", "template")])) as pool:
+        pending = deque()
+        for start in range(0, len(slides), size):
+            pending.append(pool.submit(_render_chunk, deck, slides[start:start + size]))
+            if len(pending) >= workers * CHUNKS_IN_FLIGHT:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def build_streaming(spec, output=None, workers=1):
+    """Render a deck into its output file, slide by slide or across worker processes; returns build stats
+
+    Serially, peak memory is the template plus one slide tree, independent of slide count.
+    With workers > 1, slide XML is built in parallel and this process only assigns part
+    names and relationship IDs and writes the package.
+    """
+    start = time.perf_counter()
+    output = deck_spec.output_path(spec, output)
+    deck_spec.resolve_spec(spec)
+
+    base = base_package(spec)
+    if workers > 1:
+        fragments = _parallel_fragments(spec, workers)
+    else:
+        fragments = iter_fragments(spec, spec["slides"], base)
+    tmp_output = temporary_path(output)
+    try:
+        with PackageWriter(base, tmp_output) as writer:
+            for number, fragment in enumerate(fragments, 1):
+                with phase("slide_write", slide=number):
+                    writer.add_slide(fragment)
+        os.replace(tmp_output, output)
+    finally:
+        if os.path.exists(tmp_output):
+            os.remove(tmp_output)
+
+    return {"output": output, "slides": len(spec["slides"]), "workers": workers, "seconds": time.perf_counter() - start}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a large deck with bounded memory")
+    parser.add_argument("spec")
+    parser.add_argument("-o", "--output", default=None, help="output .pptx (default: the spec's 'output')")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="worker processes building slides (default: 1, serial)")
+    args = parser.parse_args()
+
+    stats = build_streaming(deck_spec.load_spec(args.spec), args.output, args.workers)
+    print(f"✅ {stats['output']}: {stats['slides']} slides in {stats['seconds']:.2f}s ({stats['workers']} workers)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Paginated table slides
+Row heights for a whole table are computed in one pass from cached glyph metrics, rows are split across
+as many slides as needed with the header repeated, and each page's table XML is built in one parse
+
+Usage: python table_slides.py DATA [--columns NAME ...] [--font-size 12]
+"""
+
+from itertools import chain
+import argparse
+import numpy as np
+from brand import BLACK, VIOLET_1, VIOLET_TINT, WHITE
+from text_body import escape_text
+from text_fit import EMU_PER_PT, LINE_SPACING, glyph_advances, text_widths, wrapped_lines
+
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+TABLE_FONT_SIZE = 12
+# PowerPoint's default cell margins: 0.1in left/right, 0.05in top/bottom
+CELL_MARGIN_X = 91440
+CELL_MARGIN_Y = 45720
+# No automatically sized column gets less than this share of the table width
+MIN_COLUMN_FRACTION = 0.08
+# Columns are sized for their 90th-percentile cell, so a few long cells wrap instead of widening them
+COLUMN_PERCENTILE = 90
+
+# Fields of a table slide that only matter before it is split into pages
+SOURCE_FIELDS = ("rows", "source", "column_weights")
+
+
+def load_rows(path, columns=None):
+    """Return (column names, rows of strings) from a CSV or Parquet file"""
+    import pandas as pd
+    if path.endswith((".parquet", ".pq")):
+        frame = pd.read_parquet(path, columns=columns).fillna("")
+    else:
+        frame = pd.read_csv(path, usecols=columns, dtype=str, keep_default_na=False)
+    if columns:
+        frame = frame[columns]
+    return [str(name) for name in frame.columns], frame.astype(str).values.tolist()
+
+
+def column_widths(columns, rows, width, size, family=None, weights=None):
+    """Split a table's width (EMU) across its columns, by weights or by measured text widths"""
+    if weights is None:
+        cells = list(chain(columns, *rows))
+        ems = text_widths(cells, glyph_advances(family)).reshape(-1, len(columns))
+        weights = ems[0] if len(rows) == 0 else np.maximum(ems[0], np.percentile(ems[1:], COLUMN_PERCENTILE, axis=0))
+    fractions = np.asarray(weights, dtype=np.float64)
+    fractions = np.maximum(fractions / max(fractions.sum(), 1e-9), MIN_COLUMN_FRACTION)
+    widths = np.floor(fractions / fractions.sum() * width).astype(np.int64)
+    widths[-1] += width - widths.sum()
+    return widths
+
+
+def row_heights(rows, widths, size, family=None):
+    """Return the height (EMU) of every row: its tallest wrapped cell plus cell margins"""
+    if not rows:
+        return np.zeros(0, dtype=np.int64)
+    inner = np.asarray(widths, dtype=np.int64) - 2 * CELL_MARGIN_X
+    lines = wrapped_lines(list(chain.from_iterable(rows)), np.tile(inner, len(rows)), size, family)
+    lines = lines.reshape(len(rows), len(widths)).max(axis=1)
+    return np.ceil(lines * size * LINE_SPACING * EMU_PER_PT + 2 * CELL_MARGIN_Y).astype(np.int64)
+
+
+def page_breaks(heights, available):
+    """Return the end row of each page when rows of these heights fill pages of `available` height"""
+    bottoms = np.cumsum(heights)
+    ends, start, offset = [], 0, 0
+    while start < len(heights):
+        end = int(np.searchsorted(bottoms, offset + available, side="right"))
+        # A row taller than a page still gets a page of its own
+        end = max(end, start + 1)
+        ends.append(end)
+        offset, start = bottoms[end - 1], end
+    return ends or [0]
+
+
+def paginate(table_spec, area, family=None):
+    """Split a table slide spec into one slide spec per page, each with its rows and geometry resolved
+
+    area is the (left, top, width, height) the renderer draws tables in. Pages of a multi-page
+    table get "(n/N)" after their title.
+    """
+    if "source" in table_spec:
+        columns, rows = load_rows(table_spec["source"], table_spec.get("columns"))
+    else:
+        columns = table_spec["columns"]
+        rows = [[str(cell) for cell in row] for row in table_spec["rows"]]
+    weights = table_spec.get("column_weights")
+    if weights is not None and len(weights) != len(columns):
+        from deck_spec import SpecError
+        raise SpecError(f"table '{table_spec['title']}': 'column_weights' gives {len(weights)} numbers "
+                        f"for {len(columns)} columns")
+    size = table_spec.get("font_size", TABLE_FONT_SIZE)
+    widths = column_widths(columns, rows, area[2], size, family, weights)
+    heights = row_heights([columns, *rows], widths, size, family)
+    header, body = int(heights[0]), heights[1:]
+
+    ends = page_breaks(body, area[3] - header)
+    pages, start = [], 0
+    for number, end in enumerate(ends, 1):
+        page = {key: value for key, value in table_spec.items() if key not in SOURCE_FIELDS}
+        if len(ends) > 1:
+            page["title"] = f"{table_spec['title']} ({number}/{len(ends)})"
+        page.update(columns=columns, rows=rows[start:end], font_size=size,
+                    column_widths=widths.tolist(), row_heights=[header, *body[start:end].tolist()])
+        pages.append(page)
+        start = end
+    return pages
+
+
+def _cell_xml(text, size, color, fill, bold=False):
+    bold = ' b="1"' if bold else ""
+    paragraphs = "".join(
+        f'<a:p><a:r><a:rPr lang="en-US" sz="{size}"{bold} dirty="0"><a:solidFill><a:srgbClr val="{color}"/>'
+        f"</a:solidFill></a:rPr><a:t>{escape_text(line)}</a:t></a:r></a:p>" if line else "<a:p/>"
+        for line in text.split("\n")
+    )
+    return (f"<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{paragraphs}</a:txBody>"
+            f'<a:tcPr anchor="ctr"><a:solidFill><a:srgbClr val="{fill}"/></a:solidFill></a:tcPr></a:tc>')
+
+
+def table_xml(page):
+    """Return the <a:tbl> markup for one page: a VIOLET_1 header row and banded body rows"""
+    size = int(page["font_size"] * 100)
+    heights = page["row_heights"]
+    grid = "".join(f'<a:gridCol w="{width}"/>' for width in page["column_widths"])
+    header = "".join(_cell_xml(name, size, WHITE, VIOLET_1, bold=True) for name in page["columns"])
+    rows = [f'<a:tr h="{heights[0]}">{header}</a:tr>']
+    for number, (row, height) in enumerate(zip(page["rows"], heights[1:])):
+        fill = VIOLET_TINT if number % 2 else WHITE
+        rows.append(f'<a:tr h="{height}">{"".join(_cell_xml(cell, size, BLACK, fill) for cell in row)}</a:tr>')
+    return (f'<a:tbl xmlns:a="{NS_A}"><a:tblPr firstRow="1" bandRow="1"/>'
+            f'<a:tblGrid>{grid}</a:tblGrid>{"".join(rows)}</a:tbl>')
+
+
+def add_table(slide, page, left, top):
+    """Add one resolved table page to a slide at (left, top)"""
+    from pptx.oxml import parse_xml
+    widths, heights = page["column_widths"], page["row_heights"]
+    frame = slide.shapes.add_table(1, len(widths), left, top, sum(widths), sum(heights))
+    frame.name = f"Table {page['title']}"
+    graphic_data = frame._element.graphic.graphicData
+    graphic_data.replace(graphic_data.tbl, parse_xml(table_xml(page)))
+    return frame
+
+
+def main():
+    from pptx.util import Inches
+    parser = argparse.ArgumentParser(description="Show how a CSV/Parquet table would be split across slides")
+    parser.add_argument("data")
+    parser.add_argument("--columns", nargs="+", default=None)
+    parser.add_argument("--font-size", type=float, default=TABLE_FONT_SIZE)
+    parser.add_argument("--height", type=float, default=5.5, help="table area height in inches (default: 5.5)")
+    parser.add_argument("--width", type=float, default=9, help="table area width in inches (default: 9)")
+    args = parser.parse_args()
+
+    import time
+    start = time.perf_counter()
+    spec = {"type": "table", "title": "Table", "source": args.data, "font_size": args.font_size}
+    if args.columns:
+        spec["columns"] = args.columns
+    pages = paginate(spec, (0, 0, Inches(args.width), Inches(args.height)))
+    seconds = time.perf_counter() - start
+    widths = ", ".join(f"{width / 914400:.2f}in" for width in pages[0]["column_widths"])
+    print(f"📐 columns: {widths}")
+    print(f"📊 {sum(len(page['rows']) for page in pages):,} rows -> {len(pages)} slides in {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
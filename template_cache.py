@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Snapshot cache for the Hard Rock Digital PowerPoint template
+Keeps a content-hash-keyed, pre-unpacked copy of the template on disk and the parsed package in memory
+"""
+
+import copy
+import hashlib
+import io
+import os
+import threading
+import zipfile
+import opc_zip
+from profiling import phase, profiled
+
+TEMPLATE_PATH = "/home/user/test/HRD_PowerPoint-Template_v1.pptx"
+CACHE_DIR = os.environ.get("HRD_PPTX_CACHE", os.path.expanduser("~/.cache/hrd_pptx"))
+
+# Bumped whenever the snapshot format changes so stale snapshots are ignored
+SNAPSHOT_VERSION = 2
+
+# (path, mtime_ns, size) -> sha256, so unchanged files are hashed once per process
+_hash_memo = {}
+# (path, variant) -> (sha256, snapshot bytes), so repeated loads never touch the disk
+_snapshot_memo = {}
+# (path, variant) -> (sha256, parsed Presentation), never handed out: each load gets a deep copy
+# Both keep only the latest revision of each template, so editing one does not grow the process
+_parsed_memo = {}
+_parsed_lock = threading.Lock()
+
+
+def file_sha256(path):
+    """Return the sha256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def template_hash(path=TEMPLATE_PATH):
+    """Return the content hash of the template, re-hashing only when it changes on disk"""
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    sha = _hash_memo.get(key)
+    if sha is None:
+        sha = file_sha256(path)
+        _hash_memo[key] = sha
+    return sha
+
+
+def snapshot_path(sha, variant="full"):
+    """Return the on-disk location of a snapshot"""
+    return os.path.join(CACHE_DIR, f"{sha}.v{SNAPSHOT_VERSION}.{variant}.pptx")
+
+
+def temporary_path(path):
+    """Return a scratch file name next to path, unique to this process and thread, to os.replace over it"""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def write_atomic(path, data):
+    """Write bytes to path without ever exposing a partial file"""
+    # A bare file name lives in the working directory, which exists
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = temporary_path(path)
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _repack(src_path):
+    """Repack a .pptx with stored (uncompressed) entries so loading skips inflate"""
+    out = io.BytesIO()
+    with zipfile.ZipFile(src_path) as zin, zipfile.ZipFile(out, "w", zipfile.ZIP_STORED) as zout:
+        for info in zin.infolist():
+            zout.writestr(info.filename, zin.read(info.filename))
+    return out.getvalue()
+
+
+@profiled("slide_clearing")
+def _strip_slides(src_path):
+    """Repack a .pptx with no slides, dropping slide parts and anything only they used"""
+    from lxml import etree
+    with zipfile.ZipFile(src_path) as zin:
+        files = {info.filename: zin.read(info.filename) for info in zin.infolist()}
+
+    # Empty the slide list (with the sections and custom shows naming its slides)
+    # and forget the presentation's slide relationships
+    presentation = opc_zip.remove_slide_lists(etree.fromstring(files[opc_zip.PRESENTATION]))
+    files[opc_zip.PRESENTATION] = etree.tostring(
+        presentation, xml_declaration=True, encoding="UTF-8", standalone=True
+    )
+    rels = [rel for rel in opc_zip.part_rels(files, opc_zip.PRESENTATION) if rel[1] != opc_zip.RT_SLIDE]
+    files[opc_zip.rels_name(opc_zip.PRESENTATION)] = opc_zip.serialize_rels(rels)
+
+    # Slides, their notes and slide-only media are now unreachable
+    files = opc_zip.prune_unreachable(files)
+
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_STORED) as zout:
+        for name, blob in files.items():
+            zout.writestr(name, blob)
+    return out.getvalue()
+
+
+def snapshot_bytes(path=TEMPLATE_PATH, variant="full", build=_repack):
+    """Return the snapshot bytes for a template, building it on first use"""
+    sha = template_hash(path)
+    key = (os.path.abspath(path), variant)
+    entry = _snapshot_memo.get(key)
+    if entry is not None and entry[0] == sha:
+        return entry[1]
+
+    cached = snapshot_path(sha, variant)
+    if os.path.exists(cached):
+        with open(cached, "rb") as f:
+            data = f.read()
+    else:
+        data = build(path)
+        write_atomic(cached, data)
+
+    _snapshot_memo[key] = (sha, data)
+    return data
+
+
+def _parsed(path, variant, build):
+    """Return the memoized parsed template for a snapshot variant, parsing it on first use"""
+    from pptx import Presentation
+    sha = template_hash(path)
+    key = (os.path.abspath(path), variant)
+    entry = _parsed_memo.get(key)
+    if entry is None or entry[0] != sha:
+        with _parsed_lock:
+            entry = _parsed_memo.get(key)
+            if entry is None or entry[0] != sha:
+                prs = Presentation(io.BytesIO(snapshot_bytes(path, variant, build)))
+                entry = _parsed_memo[key] = (sha, prs)
+    return entry[1]
+
+
+def load_template(path=TEMPLATE_PATH, empty=False):
+    """Open the template as a copy of its parsed snapshot instead of re-reading the original package
+
+    The first load in a process parses the snapshot; later loads deep-copy the parsed
+    package (2-2.5x faster than parsing it again, with identical saved bytes).
+    With empty=True the sample slides are never parsed and never written back out.
+    """
+    with phase("template_load"):
+        if empty:
+            return copy.deepcopy(_parsed(path, "empty", _strip_slides))
+        return copy.deepcopy(_parsed(path, "full", _repack))
+
+
+def warm_template(path=TEMPLATE_PATH):
+    """Parse both snapshot variants of a template into this process's memo"""
+    _parsed(path, "full", _repack)
+    _parsed(path, "empty", _strip_slides)
+
+
+def clear_cache():
+    """Drop in-process memos and delete every on-disk snapshot"""
+    _hash_memo.clear()
+    _snapshot_memo.clear()
+    _parsed_memo.clear()
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith(".pptx"):
+            os.remove(os.path.join(CACHE_DIR, name))
+
+
+if __name__ == "__main__":
+    sha = template_hash()
+    warm_template()
+    print(f"✅ Template snapshot ready: {snapshot_path(sha)}")
+    print(f"✅ Empty-deck snapshot ready: {snapshot_path(sha, 'empty')}")
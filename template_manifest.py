@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Machine-readable template manifest
+Layouts, placeholder geometry, theme colors and fonts, cached on disk by template hash
+"""
+
+import json
+import os
+from template_cache import CACHE_DIR, TEMPLATE_PATH, load_template, template_hash, write_atomic
+
+MANIFEST_VERSION = 1
+
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+RT_THEME = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme"
+
+# sha256 -> manifest, so repeated lookups in one process never re-read the JSON
+_manifest_memo = {}
+
+
+class LayoutNotFoundError(KeyError):
+    """Raised when a template has no layout with the requested name"""
+
+    def __init__(self, name, available):
+        self.name = name
+        self.available = available
+        super().__init__(name)
+
+    def __reduce__(self):
+        # Pickled with both arguments, so it can be raised across a process pool
+        return type(self), (self.name, self.available)
+
+    def __str__(self):
+        return f"template has no layout named {self.name!r} (available: {', '.join(self.available)})"
+
+
+def manifest_path(sha):
+    """Return the on-disk location of a cached manifest"""
+    return os.path.join(CACHE_DIR, f"{sha}.manifest.v{MANIFEST_VERSION}.json")
+
+
+def _theme_facts(theme_blob):
+    """Extract the color scheme and major/minor fonts from a theme part"""
+    from lxml import etree
+    theme = etree.fromstring(theme_blob)
+    colors = {}
+    scheme = theme.find(f".//{{{NS_A}}}clrScheme")
+    if scheme is not None:
+        for slot in scheme:
+            value = slot[0]
+            colors[etree.QName(slot).localname] = value.get("val") if value.get("lastClr") is None else value.get("lastClr")
+
+    fonts = {}
+    for role in ("major", "minor"):
+        latin = theme.find(f".//{{{NS_A}}}{role}Font/{{{NS_A}}}latin")
+        if latin is not None:
+            fonts[role] = latin.get("typeface")
+    return {"colors": colors, "fonts": fonts}
+
+
+def _placeholder_facts(placeholder):
+    """Return idx/type/name/geometry for one layout placeholder"""
+    ph_format = placeholder.placeholder_format
+    return {
+        "idx": ph_format.idx,
+        "type": ph_format.type.name if ph_format.type is not None else None,
+        "name": placeholder.name,
+        "left": placeholder.left,
+        "top": placeholder.top,
+        "width": placeholder.width,
+        "height": placeholder.height,
+    }
+
+
+def build_manifest(prs, sha, template_path=TEMPLATE_PATH):
+    """Build a manifest dict from an opened template"""
+    masters = list(prs.slide_masters)
+    layouts = []
+    for index, layout in enumerate(prs.slide_layouts):
+        layouts.append({
+            "index": index,
+            "name": layout.name,
+            "master": masters.index(layout.slide_master),
+            "placeholders": [_placeholder_facts(ph) for ph in layout.placeholders],
+        })
+
+    theme_part = prs.slide_master.part.part_related_by(RT_THEME)
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "template": os.path.abspath(template_path),
+        "sha256": sha,
+        "slide_width": prs.slide_width,
+        "slide_height": prs.slide_height,
+        "slide_count": len(prs.slides),
+        "layouts": layouts,
+        "theme": _theme_facts(theme_part.blob),
+    }
+
+
+def load_manifest(template_path=TEMPLATE_PATH):
+    """Return the template's manifest, building and caching it only when the template changes"""
+    sha = template_hash(template_path)
+    manifest = _manifest_memo.get(sha)
+    if manifest is not None:
+        return manifest
+
+    cached = manifest_path(sha)
+    if os.path.exists(cached):
+        with open(cached, encoding="utf-8") as f:
+            manifest = json.load(f)
+    else:
+        manifest = build_manifest(load_template(template_path), sha, template_path)
+        write_atomic(cached, json.dumps(manifest, indent=2).encode("utf-8"))
+
+    _manifest_memo[sha] = manifest
+    return manifest
+
+
+def layout_index(name, template_path=TEMPLATE_PATH):
+    """Resolve a layout name (case-insensitive) to the index of the first layout with that name"""
+    layouts = load_manifest(template_path)["layouts"]
+    wanted = name.strip().lower()
+    for layout in layouts:
+        if layout["name"].strip().lower() == wanted:
+            return layout["index"]
+    raise LayoutNotFoundError(name, [layout["name"] for layout in layouts])
@@ -0,0 +1,45 @@
+"""
+Shared pytest setup: the repo's flat modules on sys.path and a throwaway cache directory
+Set before any module under test is imported, since CACHE_DIR is read at import time
+"""
+
+import copy
+import os
+import sys
+import tempfile
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["HRD_PPTX_CACHE"] = tempfile.mkdtemp(prefix="hrd_pptx_test_")
+
+# A branded deck touching every slide type that needs no template or data file
+BRANDED_SPEC = {
+    "name": "test_deck",
+    "renderer": "branded",
+    "slides": [
+        {"type": "title", "title": "State of Security", "subtitle": "Test"},
+        {"type": "content", "title": "Highlights", "items": ["One", "   • Sub", "Two"]},
+        {"type": "two_column", "title": "Compare", "left": ["Left"], "right": ["Right"]},
+        {"type": "kpi", "title": "KPIs", "tiles": [{"label": "Rules", "value": 120, "previous": 100}]},
+        {"type": "chart", "title": "Trend", "metrics": ["alerts"], "categories": ["Jan", "Feb"],
+         "series": [{"name": "alerts", "values": [3.0, 5.0]}]},
+        {"type": "table", "title": "Table", "columns": ["Name", "Count"], "rows": [["a", 1], ["b", 2]]},
+        {"type": "qa"},
+    ],
+}
+
+
+@pytest.fixture
+def branded_spec():
+    """Return a fresh copy of the branded test spec"""
+    return copy.deepcopy(BRANDED_SPEC)
+
+
+@pytest.fixture
+def render_deck(tmp_path):
+    """Return a function rendering a spec to a .pptx file under tmp_path"""
+    from deck_spec import render_spec
+
+    def render(spec, name):
+        return render_spec(copy.deepcopy(spec), str(tmp_path / f"{name}.pptx"), use_cache=False)[0]
+    return render
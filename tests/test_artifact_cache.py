@@ -0,0 +1,42 @@
+import os
+import artifact_cache
+
+
+def _age(key, seconds_ago):
+    """Backdate a cached deck, as if it was last used seconds_ago"""
+    path = artifact_cache.artifact_path(key)
+    stamp = os.stat(path).st_mtime - seconds_ago
+    os.utime(path, (stamp, stamp))
+
+
+def test_key_changes_with_content(branded_spec):
+    key = artifact_cache.artifact_key(branded_spec)
+    assert key == artifact_cache.artifact_key(dict(branded_spec, output="elsewhere.pptx"))
+    branded_spec["slides"][0]["title"] = "Changed"
+    assert key != artifact_cache.artifact_key(branded_spec)
+
+
+def test_evicts_least_recently_used():
+    artifact_cache.evict(0)
+    for key in ("a", "b", "c"):
+        artifact_cache.put(key, b"x" * 100)
+    _age("a", 30)
+    _age("b", 20)
+    _age("c", 10)
+    # Reading "a" makes it the most recently used
+    assert artifact_cache.load("a") == b"x" * 100
+
+    assert artifact_cache.evict(250) == 100
+    assert artifact_cache.load("b") is None
+    assert artifact_cache.load("a") is not None and artifact_cache.load("c") is not None
+
+
+def test_evicts_nested_directories_by_suffix(tmp_path):
+    for number, name in enumerate(("ab/old.frag", "cd/new.frag", "cd/other.txt")):
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b"x" * 10)
+        os.utime(path, (1000 + number, 1000 + number))
+    assert artifact_cache.evict(10, str(tmp_path), ".frag") == 10
+    assert not (tmp_path / "ab/old.frag").exists()
+    assert (tmp_path / "cd/new.frag").exists() and (tmp_path / "cd/other.txt").exists()
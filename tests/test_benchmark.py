@@ -0,0 +1,41 @@
+import json
+import pytest
+import benchmark
+
+
+def _results(path, **metrics):
+    path.write_text(json.dumps({"results": [{"case": "v1", "slides": 10, **metrics}]}))
+    return str(path)
+
+
+def test_synthetic_items_mix_levels():
+    items = benchmark.synthetic_items(3, count=8)
+    assert len(items) == 8
+    assert [item.startswith("   •") for item in items] == [False, True, True, True] * 2
+
+
+def test_measure_case_reports_save_and_throughput():
+    result = benchmark._measure_case("v1", 3, template=None)
+    assert set(result) == {"build_s", "save_s", "output_bytes", "slides_per_s", "peak_rss_mb"}
+    assert result["output_bytes"] > 0 and result["slides_per_s"] > 0
+
+
+def test_run_case_in_a_fresh_process():
+    result = benchmark.run_case("v1", 2, None)
+    assert (result["case"], result["slides"]) == ("v1", 2)
+    assert result["peak_rss_mb"] > 0
+
+
+def test_failing_case_reports_the_child_traceback():
+    # The spawned child looks the case up by name; one that does not exist raises there
+    with pytest.raises(benchmark.CaseError, match="KeyError: 'nope'"):
+        benchmark.run_case("nope", 1, None)
+
+
+def test_compare_flags_regressions(tmp_path, capsys):
+    old = _results(tmp_path / "old.json", build_s=1.0, peak_rss_mb=100.0)
+    assert not benchmark.compare(old, _results(tmp_path / "same.json", build_s=1.05, peak_rss_mb=100.0))
+    assert benchmark.compare(old, _results(tmp_path / "slow.json", build_s=1.2, peak_rss_mb=90.0))
+    lines = capsys.readouterr().out.splitlines()
+    assert "regression" in lines[-2] and "build_s" in lines[-2]
+    assert "regression" not in lines[-1]
@@ -0,0 +1,24 @@
+from pptx import Presentation
+from create_security_townhall import add_chrome, add_content_slide
+
+
+def test_chrome_is_cloned_per_slide():
+    prs = Presentation()
+    first = add_content_slide(prs, "First", ["a"])
+    second = add_content_slide(prs, "Second", ["b"])
+    assert first.shapes[0].text_frame.text == "First"
+    assert second.shapes[0].text_frame.text == "Second"
+    assert first.shapes[0]._element is not second.shapes[0]._element
+
+
+def test_multi_line_title_becomes_paragraphs():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    title_bar = add_chrome(slide, "State of Security\n2026")
+    frame = slide.shapes[0].text_frame
+    assert slide.shapes[0]._element is title_bar
+    assert [p.text for p in frame.paragraphs] == ["State of Security", "2026"]
+    assert "\n" not in "".join(t.text for t in title_bar.iter("{*}t"))
+    # Styling still comes from the prototype's list style, not per-run attributes
+    assert title_bar.find(".//{*}lstStyle/{*}lvl1pPr/{*}defRPr").get("sz") == "3200"
+    assert title_bar.find(".//{*}r/{*}rPr") is None
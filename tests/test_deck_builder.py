@@ -0,0 +1,48 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from deck_builder import DeckBuilder
+from deck_spec import SpecError, render_bytes
+
+
+def test_from_spec_matches_the_renderer(branded_spec):
+    builder = DeckBuilder.from_spec(copy.deepcopy(branded_spec))
+    assert len(builder) == len(branded_spec["slides"])
+    assert builder.to_bytes() == render_bytes(copy.deepcopy(branded_spec), use_cache=False)[0]
+
+
+def test_shortcuts_leave_caller_specs_alone(branded_spec):
+    builder = DeckBuilder("branded")
+    builder.title("Hello", "World")
+    items = ["One", "Two"]
+    builder.content("Auto", items, font_size="auto")
+    slides = copy.deepcopy(branded_spec["slides"])
+    builder.extend(slides)
+    assert slides == branded_spec["slides"]
+    assert isinstance(builder.spec["slides"][1]["font_size"], int)
+    assert builder.extend([]) == []
+    assert len(builder) == 2 + len(slides)
+
+
+def test_invalid_slide_adds_nothing():
+    builder = DeckBuilder("branded")
+    builder.qa()
+    with pytest.raises(SpecError, match="missing 'items'"):
+        builder.extend([{"type": "title", "title": "Fine"}, {"type": "content", "title": "Broken"}])
+    assert len(builder) == 1
+
+
+def test_builders_run_side_by_side_in_threads(branded_spec):
+    expected = DeckBuilder.from_spec(copy.deepcopy(branded_spec)).to_bytes()
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda _: DeckBuilder.from_spec(copy.deepcopy(branded_spec)).to_bytes(), range(8)))
+    assert results == [expected] * 8
+
+
+def test_shared_builder_serializes_calls():
+    builder = DeckBuilder("branded")
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda n: builder.content(f"Slide {n}", [f"Item {n}"]), range(20)))
+    assert len(builder) == 20
+    titles = sorted(slide.shapes[0].text_frame.text for slide in builder.prs.slides)
+    assert titles == sorted(f"Slide {n}" for n in range(20))
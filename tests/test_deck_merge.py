@@ -0,0 +1,60 @@
+import zipfile
+import pytest
+from pptx import Presentation
+from deck_merge import MergeError, merge_decks
+
+
+def test_merge_keeps_slides_in_order_with_sections(branded_spec, render_deck, tmp_path):
+    first = render_deck(branded_spec, "first")
+    branded_spec["slides"] = branded_spec["slides"][:2]
+    second = render_deck(branded_spec, "second")
+    output = str(tmp_path / "merged.pptx")
+
+    stats = merge_decks([first, second], output)
+    assert stats["slides"] == len(Presentation(first).slides) + 2
+    merged = Presentation(output)
+    assert len(merged.slides) == stats["slides"]
+    assert [shape.name for shape in merged.slides[-1].shapes] == [shape.name for shape in Presentation(second).slides[-1].shapes]
+    with zipfile.ZipFile(output) as zf:
+        presentation = zf.read("ppt/presentation.xml")
+    assert presentation.count(b"<p14:section ") == 2
+
+
+def test_merge_rejects_decks_without_matching_layouts(branded_spec, render_deck, tmp_path):
+    first = render_deck(branded_spec, "first")
+    # A layout that differs from every layout of the first deck, by content and by name
+    other = Presentation()
+    layout = other.slide_layouts[0]
+    layout.name = "Renamed"
+    layout.placeholders[0].text = "changed"
+    other.slides.add_slide(layout)
+    other_path = str(tmp_path / "other.pptx")
+    other.save(other_path)
+    with pytest.raises(MergeError, match="Renamed"):
+        merge_decks([first, other_path], str(tmp_path / "merged.pptx"))
+
+
+def test_merge_shares_identical_media_and_layouts(tmp_path):
+    from PIL import Image
+    image = tmp_path / "logo.png"
+    Image.new("RGB", (40, 30), "red").save(image)
+    paths = []
+    for name in ("a", "b"):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = f"Deck {name}"
+        slide.shapes.add_picture(str(image), 0, 0)
+        paths.append(str(tmp_path / f"{name}.pptx"))
+        prs.save(paths[-1])
+
+    output = str(tmp_path / "merged.pptx")
+    merge_decks(paths, output, sections=False)
+    with zipfile.ZipFile(output) as zf:
+        names = zf.namelist()
+        presentation = zf.read("ppt/presentation.xml")
+    assert [name for name in names if name.startswith("ppt/media/")] == ["ppt/media/image1.png"]
+    assert len([name for name in names if name.startswith("ppt/slideLayouts/slideLayout")]) == 11
+    assert b"sectionLst" not in presentation
+    merged = Presentation(output)
+    assert [slide.shapes.title.text for slide in merged.slides] == ["Deck a", "Deck b"]
+    assert merged.slides[0].slide_layout == merged.slides[1].slide_layout
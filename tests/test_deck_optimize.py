@@ -0,0 +1,76 @@
+import io
+import os
+import zipfile
+from pptx import Presentation
+from deck_optimize import optimize_bytes, optimize_file
+
+
+def test_optimize_strips_unused_layouts_and_keeps_slides(branded_spec, render_deck):
+    path = render_deck(branded_spec, "deck")
+    with open(path, "rb") as f:
+        data = f.read()
+    optimized, report = optimize_bytes(data)
+    assert report["layouts_removed"] > 0
+    assert report["after"] == len(optimized) < len(data)
+    before, after = Presentation(io.BytesIO(data)), Presentation(io.BytesIO(optimized))
+    assert len(after.slide_layouts) < len(before.slide_layouts)
+    assert [[s.name for s in slide.shapes] for slide in after.slides] == \
+        [[s.name for s in slide.shapes] for slide in before.slides]
+    # Nothing left to do the second time
+    assert optimize_bytes(optimized)[1]["layouts_removed"] == 0
+
+
+def test_optimize_merges_duplicate_media(tmp_path):
+    from PIL import Image
+    image = tmp_path / "red.png"
+    Image.new("RGB", (40, 30), "red").save(image)
+    prs = Presentation()
+    for _ in range(2):
+        prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_picture(str(image), 0, 0)
+    out = io.BytesIO()
+    prs.save(out)
+
+    # python-pptx shares one image part; give the second slide its own copy under another name
+    source = zipfile.ZipFile(io.BytesIO(out.getvalue()))
+    duplicated = io.BytesIO()
+    with zipfile.ZipFile(duplicated, "w") as zf:
+        for name in source.namelist():
+            blob = source.read(name)
+            if name == "ppt/slides/_rels/slide2.xml.rels":
+                blob = blob.replace(b"image1.png", b"image2.png")
+            zf.writestr(name, blob)
+        zf.writestr("ppt/media/image2.png", source.read("ppt/media/image1.png"))
+    deck = tmp_path / "dup.pptx"
+    deck.write_bytes(duplicated.getvalue())
+
+    report = optimize_file(str(deck))
+    assert report["duplicates_merged"] == 1
+    with zipfile.ZipFile(deck) as zf:
+        assert [name for name in zf.namelist() if name.startswith("ppt/media/")] == ["ppt/media/image1.png"]
+    pictures = [shape for slide in Presentation(str(deck)).slides for shape in slide.shapes]
+    assert len(pictures) == 2 and all(picture.image.blob for picture in pictures)
+
+
+def test_optimize_file_output_and_already_optimal(branded_spec, render_deck, tmp_path):
+    path = render_deck(branded_spec, "deck")
+    output = str(tmp_path / "small.pptx")
+    with open(path, "rb") as f:
+        original = f.read()
+    report = optimize_file(path, output)
+    assert report["deck"] == output and report["saved"] > 0
+    with open(path, "rb") as f:
+        assert f.read() == original
+    assert os.path.getsize(output) == report["after"]
+
+    # An optimal deck is left as it is
+    os.utime(output, (1000, 1000))
+    assert optimize_file(output)["saved"] <= 0
+    assert os.stat(output).st_mtime == 1000
+
+
+def test_keep_layouts(branded_spec, render_deck):
+    with open(render_deck(branded_spec, "deck"), "rb") as f:
+        data = f.read()
+    optimized, report = optimize_bytes(data, strip_layouts=False)
+    assert report["layouts_removed"] == 0
+    assert len(Presentation(io.BytesIO(optimized)).slide_layouts) == len(Presentation(io.BytesIO(data)).slide_layouts)
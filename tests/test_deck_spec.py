@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from deck_spec import SpecError, load_spec, validate_spec
+
+
+def test_valid_spec(branded_spec):
+    validate_spec(branded_spec)
+
+
+@pytest.mark.parametrize("spec, message", [
+    ([{"type": "title"}], "top level must be a mapping"),
+    ({"slides": []}, "'slides' must be a non-empty list"),
+    ({"slides": [5]}, "must be a mapping"),
+    ({"slides": [{"type": "nope"}]}, "unknown slide type"),
+    ({"slides": [{"type": "content", "title": "x"}]}, "missing 'items'"),
+    ({"slides": [{"type": "content", "title": "x", "items": 5}]}, "'items' must be a list of strings"),
+    ({"slides": [{"type": "content", "title": "x", "items": "abc"}]}, "'items' must be a list of strings"),
+    ({"slides": [{"type": "content", "title": "x", "items": [], "font_size": "big"}]}, "'font_size'"),
+    ({"renderer": "nope", "slides": [{"type": "qa"}]}, "unknown renderer"),
+    ({"slides": [{"type": "chart", "title": "x", "metrics": ["a"], "chart": "pie"}]}, "unknown chart"),
+    ({"slides": [{"type": "kpi", "title": "x", "tiles": [{"label": "a", "metric": "m"}]}]}, "need a 'source'"),
+    ({"slides": [{"type": "table", "title": "x", "columns": ["a"], "rows": [["1", "2"]]}]}, "row 1"),
+    ({"slides": [{"type": "table", "title": "x", "source": "t.csv", "column_weights": "wide"}]},
+     "'column_weights' must be a list of numbers"),
+    ({"slides": [{"type": "table", "title": "x", "columns": ["a", "b"], "rows": [], "column_weights": [1]}]},
+     "one number per column"),
+    ({"slides": [{"type": "image", "title": "x", "image": "a.png", "dpi": 0}]}, "'dpi'"),
+])
+def test_invalid_specs(spec, message):
+    with pytest.raises(SpecError, match=message):
+        validate_spec(spec)
+
+
+def test_load_spec_rejects_non_mapping_yaml(tmp_path):
+    path = tmp_path / "deck.yaml"
+    path.write_text("- a\n- b\n")
+    with pytest.raises(SpecError, match="top level must be a mapping"):
+        load_spec(str(path))
+
+
+def test_load_spec_resolves_paths_against_the_spec(tmp_path):
+    path = tmp_path / "deck.json"
+    path.write_text(json.dumps({"data": "data/metrics.csv", "slides": [
+        {"type": "table", "title": "t", "source": "data/rows.csv"},
+        {"type": "image", "title": "i", "image": "shots/dash.png"},
+    ]}))
+    spec = load_spec(str(path))
+    assert spec["name"] == "deck"
+    assert spec["data"] == str(tmp_path / "data" / "metrics.csv")
+    assert spec["slides"][0]["source"] == str(tmp_path / "data" / "rows.csv")
+    assert spec["slides"][1]["image"] == str(tmp_path / "shots" / "dash.png")
+
+
+
+@pytest.mark.parametrize("module", [
+    "deck_spec", "artifact_cache", "render_batch", "template_manifest", "analyze_template", "layout_check",
+])
+def test_entry_points_import_without_heavy_modules(module):
+    code = (f"import sys, {module}; "
+            "print(sorted(m for m in ('pptx', 'lxml', 'tracemalloc', 'concurrent.futures') if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,51 @@
+import copy
+import os
+import pytest
+import incremental_build
+from incremental_build import build_incremental, load_fragment, slide_key
+from slide_parts import fragment_bytes, parse_fragment
+
+
+def test_rebuild_reuses_unchanged_slides(branded_spec, tmp_path):
+    first, second = str(tmp_path / "first.pptx"), str(tmp_path / "second.pptx")
+    stats = build_incremental(copy.deepcopy(branded_spec), first)
+    assert stats["rendered"] == len(branded_spec["slides"])
+
+    # Same spec: every slide comes from the cache and the bytes match
+    stats = build_incremental(copy.deepcopy(branded_spec), second)
+    assert (stats["rendered"], stats["reused"]) == (0, len(branded_spec["slides"]))
+    with open(first, "rb") as a, open(second, "rb") as b:
+        assert a.read() == b.read()
+
+    branded_spec["slides"][1]["items"].append("Three")
+    assert build_incremental(copy.deepcopy(branded_spec), second)["rendered"] == 1
+
+
+def test_fragments_round_trip_without_pickle(branded_spec, tmp_path):
+    spec = copy.deepcopy(branded_spec)
+    build_incremental(spec, str(tmp_path / "deck.pptx"))
+    # The chart slide has private parts (chart, workbook) with nested relationships
+    fragment = load_fragment(slide_key(spec, spec["slides"][4]))
+    assert fragment.parts
+    data = fragment_bytes(fragment)
+    assert data[:2] == b"PK"
+    assert parse_fragment(data) == fragment
+
+
+def test_unreadable_fragment_is_a_miss(branded_spec, tmp_path):
+    spec = copy.deepcopy(branded_spec)
+    build_incremental(spec, str(tmp_path / "deck.pptx"))
+    key = slide_key(spec, spec["slides"][0])
+    with open(incremental_build._fragment_path(key), "wb") as f:
+        f.write(b"\x80\x04garbage")
+    assert load_fragment(key) is None
+    assert build_incremental(copy.deepcopy(branded_spec), str(tmp_path / "again.pptx"))["rendered"] == 1
+
+
+def test_failed_build_leaves_no_temporary_file(branded_spec, tmp_path, monkeypatch):
+    def fail(self, fragment):
+        raise RuntimeError("disk full")
+    monkeypatch.setattr(incremental_build.PackageWriter, "add_slide", fail)
+    with pytest.raises(RuntimeError):
+        build_incremental(copy.deepcopy(branded_spec), str(tmp_path / "deck.pptx"))
+    assert os.listdir(tmp_path) == []
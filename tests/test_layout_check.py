@@ -0,0 +1,48 @@
+import random
+from itertools import combinations
+from layout_check import TOLERANCE, Box, GridIndex, _overlap, check_boxes, check_file
+
+W, H = 9144000, 6858000
+INCH = 914400
+
+
+def _box(name, left, top, width, height, placeholder=False):
+    return Box(0, name, placeholder, left, top, left + width, top + height)
+
+
+def test_issues():
+    boxes = [
+        _box("Background", 0, 0, W, H),
+        _box("Title", 0, 0, W, INCH, placeholder=True),
+        _box("Body", INCH, INCH // 2, 4 * INCH, 4 * INCH),
+        _box("Caption", INCH, 5 * INCH, 4 * INCH, INCH),
+        _box("Touching", INCH, 6 * INCH - TOLERANCE // 2, INCH, INCH // 2),
+        _box("Logo", W - INCH // 2, 6 * INCH, INCH, INCH // 2),
+    ]
+    issues = {(issue.kind, issue.shapes) for issue in check_boxes(boxes, W, H, 3)}
+    assert issues == {
+        ("placeholder_collision", ("Title", "Body")),
+        ("off_canvas", ("Logo",)),
+    }
+    off_canvas, = [issue for issue in check_boxes(boxes, W, H, 3) if issue.kind == "off_canvas"]
+    assert (off_canvas.slide, off_canvas.detail) == (3, "extends 0.50in past the slide edge")
+
+
+def test_far_off_canvas_shape_stays_in_the_grid():
+    index = GridIndex(W, H)
+    index.insert(0, _box("Far", 1000 * W, 1000 * H, INCH, INCH))
+    assert list(index.cells) == [(16, 16)]
+
+
+def test_grid_finds_every_overlap_brute_force_finds():
+    rng = random.Random(7)
+    boxes = [_box(str(n), rng.randrange(-INCH, W), rng.randrange(-INCH, H), rng.randrange(1, 3 * INCH),
+                  rng.randrange(1, 3 * INCH)) for n in range(150)]
+    expected = {(a.name, b.name) for a, b in combinations(boxes, 2) if _overlap(a, b)}
+    assert len(expected) > 50
+    found = {issue.shapes for issue in check_boxes(boxes, W, H) if issue.kind == "overlap"}
+    assert found == expected
+
+
+def test_rendered_deck_is_clean(branded_spec, render_deck):
+    assert check_file(render_deck(branded_spec, "deck")) == []
@@ -0,0 +1,79 @@
+import pytest
+from deck_spec import SpecError, validate_spec
+from metric_slides import change_text, format_value
+from metrics import bind_slide, latest, needs_data, series
+
+ROWS = [
+    ("2025-01-05", "rules", 10), ("2025-01-20", "rules", 12),
+    ("2025-02-03", "rules", 15), ("2025-02-25", "rules", 14),
+    ("2025-03-10", "rules", 20),
+    ("2025-01-15", "alerts", 4), ("2025-03-15", "alerts", 6),
+    ("2025-02-01", "only", 1),
+]
+
+
+@pytest.fixture
+def metrics_file(tmp_path):
+    path = tmp_path / "metrics.csv"
+    path.write_text("date,metric,value\n" + "".join(f"{d},{m},{v}\n" for d, m, v in ROWS))
+    return str(path)
+
+
+def test_series_aggregates_per_period(metrics_file):
+    labels, values = series(metrics_file, ["rules", "alerts"])
+    assert labels == ["Jan 2025", "Feb 2025", "Mar 2025"]
+    assert values == {"rules": [12.0, 14.0, 20.0], "alerts": [4.0, None, 6.0]}
+
+    labels, values = series(metrics_file, ["rules"], agg="sum", periods=2)
+    assert labels == ["Feb 2025", "Mar 2025"]
+    assert values == {"rules": [29.0, 20.0]}
+
+
+def test_latest_and_unknown_metrics(metrics_file):
+    assert latest(metrics_file, "rules") == (20.0, 14.0, "Feb 2025")
+    assert latest(metrics_file, "only") == (1.0, None, None)
+    with pytest.raises(KeyError, match="no metric 'missing'"):
+        latest(metrics_file, "missing")
+
+
+def test_bind_slide_fills_charts_and_tiles(metrics_file):
+    chart = {"type": "chart", "title": "T", "metrics": ["rules"], "labels": {"rules": "Rules"}, "periods": 2}
+    assert needs_data(chart)
+    bind_slide(chart, metrics_file)
+    assert chart["categories"] == ["Feb 2025", "Mar 2025"]
+    assert chart["series"] == [{"name": "Rules", "values": [14.0, 20.0]}]
+    assert not needs_data(chart)
+
+    # Tiles inherit the slide's agg unless they set their own; typed values are kept
+    kpi = {"type": "kpi", "title": "K", "agg": "max", "tiles": [
+        {"label": "Max", "metric": "rules"},
+        {"label": "Min", "metric": "rules", "agg": "min"},
+        {"label": "Typed", "metric": "rules", "value": 99},
+    ]}
+    bind_slide(kpi, metrics_file)
+    assert [tile["value"] for tile in kpi["tiles"]] == [20.0, 20.0, 99]
+    assert [tile.get("previous") for tile in kpi["tiles"]] == [15.0, 14.0, None]
+
+
+def test_tile_text():
+    assert format_value(1234) == "1,234"
+    assert format_value(12.34) == "12.3"
+    assert format_value(0.25, "{:.0%}") == "25%"
+    assert format_value("n/a") == "n/a"
+    assert change_text({"value": 110, "previous": 100, "previous_period": "Sep 2025"}) == "▲ 10.0% vs Sep 2025"
+    assert change_text({"value": 90, "previous": 100, "change": "abs"}) == "▼ 10"
+    assert change_text({"value": 0, "previous": 0}) == ""
+    assert change_text({"value": 5, "previous": 4, "change": "none"}) == ""
+
+
+@pytest.mark.parametrize("slide, message", [
+    ({"series": [{"name": "a", "values": [1]}]}, "need a non-empty 'categories'"),
+    ({"categories": ["Jan", "Feb"], "series": [{"name": "a", "values": [1]}]}, "1 values for 2 categories"),
+    ({"categories": ["Jan"], "series": []}, "'series' must be a non-empty list"),
+    ({"categories": ["Jan"], "series": [{"values": [1]}]}, "'name' and a 'values' list"),
+    ({"categories": ["Jan"], "series": [{"name": "a", "values": ["x"]}]}, "numbers or null"),
+])
+def test_inline_series_validation(slide, message):
+    chart = dict({"type": "chart", "title": "T", "metrics": ["a"]}, **slide)
+    with pytest.raises(SpecError, match=message):
+        validate_spec({"slides": [chart]})
@@ -0,0 +1,42 @@
+import pickle
+import pytest
+from pptx import Presentation
+from placeholder_index import (PlaceholderNotFoundError, add_slide, layout_placeholder, placeholder,
+                               remove_placeholder, slide_placeholders)
+
+
+def test_lookup_by_idx():
+    prs = Presentation()
+    slide = add_slide(prs, 1)  # "Title and Content"
+    assert placeholder(slide, 0)._element is slide.shapes.title._element
+    assert placeholder(slide, 1).name.startswith("Content Placeholder")
+    name, _ = layout_placeholder(prs.slide_layouts[1], 1)
+    assert name.startswith("Content Placeholder")
+    # The map is built once and handed back on later lookups
+    assert slide_placeholders(slide) is slide_placeholders(slide)
+
+
+def test_missing_idx_names_the_layout_and_what_exists():
+    prs = Presentation()
+    slide = add_slide(prs, 1)
+    with pytest.raises(PlaceholderNotFoundError, match="layout 'Title and Content' has no placeholder idx 7 "
+                                                       r"\(available: 0, 1\)"):
+        placeholder(slide, 7)
+    with pytest.raises(KeyError):
+        layout_placeholder(prs.slide_layouts[6], 0)
+
+
+def test_error_survives_pickling():
+    error = PlaceholderNotFoundError("layout 'Blank'", 3, {1: None, 0: None})
+    assert str(pickle.loads(pickle.dumps(error))) == str(error)
+
+
+def test_remove_placeholder():
+    prs = Presentation()
+    slide = add_slide(prs, 1)
+    removed = remove_placeholder(slide, 1)
+    assert removed._element.getparent() is None
+    assert list(slide_placeholders(slide)) == [0]
+    assert [ph.placeholder_format.idx for ph in slide.placeholders] == [0]
+    with pytest.raises(PlaceholderNotFoundError):
+        placeholder(slide, 1)
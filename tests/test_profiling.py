@@ -0,0 +1,50 @@
+import tracemalloc
+import pytest
+import profiling
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(profiling, "ENABLED", False)
+    was_tracing = tracemalloc.is_tracing()
+    profiling.enable()
+    profiling.reset()
+    yield
+    profiling.reset()
+    if not was_tracing:
+        tracemalloc.stop()
+
+
+def test_disabled_is_a_no_op(monkeypatch):
+    monkeypatch.setattr(profiling, "ENABLED", False)
+    assert profiling.phase("x") is profiling.phase("y")
+
+    def fn():
+        pass
+    assert profiling.profiled("fn")(fn) is fn
+
+
+def test_nested_phases_record_peak_and_net_blocks(enabled):
+    with profiling.phase("outer"):
+        with profiling.phase("inner", slide=1):
+            kept = [bytearray(1024) for _ in range(1000)]
+        del kept
+    inner, outer = profiling.records()
+    assert (inner["phase"], inner["slide"], outer["phase"]) == ("inner", 1, "outer")
+    assert inner["peak_bytes"] >= 1000 * 1024
+    # The inner phase reset the peak, but its high-water mark still counts for the outer one
+    assert outer["peak_bytes"] >= inner["peak_bytes"]
+    assert inner["net_blocks"] >= 1000
+    assert outer["net_blocks"] < inner["net_blocks"]
+
+
+def test_reports(enabled):
+    @profiling.profiled("work")
+    def work():
+        return 42
+    assert work() == 42 and work() == 42
+    entry = profiling.summary()["work"]
+    assert entry["calls"] == 2 and set(entry) == {"calls", "wall_s", "max_wall_s", "net_blocks", "peak_bytes"}
+    text = profiling.to_prometheus()
+    assert "# TYPE hrd_pptx_phase_net_blocks gauge" in text
+    assert 'hrd_pptx_phase_calls_total{phase="work"} 2' in text
@@ -0,0 +1,105 @@
+import http.client
+import json
+import threading
+from http.server import ThreadingHTTPServer
+import pytest
+from pptx import Presentation
+from deck_spec import SpecError
+from render_service import RenderHandler, RenderService, confine_paths, download_name
+
+
+@pytest.fixture(scope="module")
+def root(tmp_path_factory):
+    root = tmp_path_factory.mktemp("service_root")
+    Presentation().save(str(root / "template.pptx"))
+    (root / "broken.pptx").write_bytes(b"not a zip")
+    (root / "metrics.csv").write_text("date,metric,value\n2025-01-01,rules,1\n2025-02-01,rules,2\n")
+    return root
+
+
+@pytest.fixture(scope="module")
+def post(root):
+    """Return a function POSTing a body to a running service, returning (status, headers, body)"""
+    service = RenderService(workers=1, queue=1, templates=(), root=str(root))
+    RenderHandler.service = service
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RenderHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def send(body, headers=None, path="/render?cache=0"):
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=60)
+        if isinstance(body, dict):
+            body = json.dumps(body).encode("utf-8")
+        connection.putrequest("POST", path)
+        for name, value in (headers or {"Content-Length": str(len(body))}).items():
+            connection.putheader(name, value)
+        connection.endheaders(body)
+        response = connection.getresponse()
+        result = response.status, dict(response.getheaders()), response.read()
+        connection.close()
+        return result
+    send.service = service
+    yield send
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def _error(response):
+    status, _, body = response
+    return status, json.loads(body)["error"]
+
+
+def test_renders_a_spec(post, branded_spec):
+    status, headers, body = post(dict(branded_spec, name="Q3 / review"))
+    assert status == 200
+    assert body[:2] == b"PK"
+    assert headers["X-Slide-Count"] == "7"
+    assert headers["Content-Disposition"] == 'attachment; filename="Q3 _ review.pptx"'
+    assert post.service.in_flight == 0
+
+
+@pytest.mark.parametrize("spec, message", [
+    ({"slides": []}, "'slides' must be a non-empty list"),
+    ({"template": "/etc/passwd", "slides": [{"type": "qa"}]}, "outside the service root"),
+    ({"template": "../template.pptx", "slides": [{"type": "qa"}]}, "outside the service root"),
+    ({"renderer": "branded", "data": "/etc/hosts", "slides": [{"type": "qa"}]}, "outside the service root"),
+    ({"template": 5, "slides": [{"type": "qa"}]}, "'template' must be a file path"),
+    # Failures inside the render
+    ({"template": "broken.pptx", "slides": [{"type": "qa"}]}, "BadZipFile"),
+    ({"template": "template.pptx", "slides": [{"type": "title", "title": "T", "layout": "Nope"}]},
+     "no layout named 'Nope'"),
+    ({"renderer": "branded", "data": "metrics.csv", "slides": [
+        {"type": "kpi", "title": "K", "tiles": [{"label": "L", "metric": "missing"}]}]}, "no metric 'missing'"),
+    ({"renderer": "branded", "data": "absent.csv", "slides": [
+        {"type": "kpi", "title": "K", "tiles": [{"label": "L", "metric": "rules"}]}]}, "FileNotFoundError"),
+])
+def test_bad_specs_are_client_errors(post, spec, message):
+    status, error = _error(post(spec))
+    assert status == 400
+    assert message in error
+    assert post.service.in_flight == 0
+
+
+@pytest.mark.parametrize("length", ["-1", "abc"])
+def test_bad_content_length(post, length):
+    assert _error(post(b"{}", {"Content-Length": length})) == (400, "Content-Length must be a non-negative integer")
+
+
+def test_confine_paths_resolves_against_root(root):
+    spec = {"data": "metrics.csv", "slides": [{"type": "image", "title": "I", "image": str(root / "a.png")}]}
+    confine_paths(spec, str(root))
+    assert spec["data"] == str(root / "metrics.csv")
+    assert spec["slides"][0]["image"] == str(root / "a.png")
+
+    (root / "escape").symlink_to("/etc")
+    with pytest.raises(SpecError, match="outside the service root"):
+        confine_paths({"data": "escape/hosts", "slides": []}, str(root))
+    # Templates the service keeps warm may live anywhere
+    confine_paths({"template": "/etc/hosts", "slides": []}, str(root), allowed=["/etc/hosts"])
+
+
+def test_download_name():
+    assert "/" not in download_name("../../etc/passwd")
+    assert download_name('a"\r\nb') == "a_b.pptx"
+    assert download_name("") == "deck.pptx"
+    assert len(download_name("x" * 500)) == 105
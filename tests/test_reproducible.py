@@ -0,0 +1,30 @@
+import io
+import zipfile
+import pytest
+from deck_spec import render_bytes
+from reproducible import normalize_package
+
+
+def test_render_is_byte_identical(branded_spec):
+    first, slides, _ = render_bytes(branded_spec, use_cache=False)
+    second, _, _ = render_bytes(dict(branded_spec, slides=[dict(s) for s in branded_spec["slides"]]), use_cache=False)
+    assert first == second
+    assert slides == len(branded_spec["slides"])
+
+
+def test_normalize_package_is_idempotent(branded_spec):
+    data, _, _ = render_bytes(branded_spec, use_cache=False)
+    assert normalize_package(data) == data
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert {info.date_time for info in zf.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+
+
+def test_render_spec_needs_an_output(branded_spec, tmp_path, monkeypatch):
+    from deck_spec import SpecError, render_spec
+    with pytest.raises(SpecError, match="no 'output'"):
+        render_spec(branded_spec, use_cache=False)
+
+    # A bare file name is written to the working directory
+    monkeypatch.chdir(tmp_path)
+    assert render_spec(dict(branded_spec, output="deck.pptx"), use_cache=False) == ("deck.pptx", 7)
+    assert (tmp_path / "deck.pptx").exists()
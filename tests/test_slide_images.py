@@ -0,0 +1,78 @@
+import io
+import os
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+from placeholder_index import add_slide, placeholder
+from slide_images import ImageRequest, evict_images, image_path, insert_image, prepare_images
+
+
+def _screenshot(path, size=(3000, 1500), mode="RGB"):
+    image = Image.new("RGB", size, "white")
+    for x in range(0, size[0], 100):
+        image.paste((x % 255, 90, 200), (x, 100, x + 60, size[1] - 100))
+    image = image.quantize(16) if mode == "P" else image.convert(mode)
+    image.save(path)
+    return str(path)
+
+
+def test_downscales_to_box_at_dpi_and_shares_renditions(tmp_path):
+    source = _screenshot(tmp_path / "dash.png")
+    copy = tmp_path / "copy.png"
+    copy.write_bytes(open(source, "rb").read())
+    small, large = ImageRequest(source, Inches(4), Inches(4), 100), ImageRequest(str(copy), Inches(9), Inches(9), 100)
+    names = prepare_images([small, large])
+    # Same contents: one rendition, sized for the larger box (900px wide at 100 DPI)
+    assert names[0] == names[1]
+    with Image.open(image_path(names[0])) as image:
+        assert image.size == (900, 450)
+
+
+def test_shared_rendition_covers_both_dimensions(tmp_path):
+    # A tall strip: both boxes round to 1px wide, only the second needs 90px of height
+    source = _screenshot(tmp_path / "strip.png", size=(30, 3000))
+    names = prepare_images([ImageRequest(source, Inches(1), Inches(0.4), 100),
+                            ImageRequest(source, Inches(1), Inches(0.9), 100)])
+    assert names[0] == names[1]
+    with Image.open(image_path(names[0])) as image:
+        assert image.size == (1, 90)
+
+
+def test_evicts_least_recently_used_renditions(tmp_path):
+    evict_images(0)
+    old, new = (prepare_images([ImageRequest(_screenshot(tmp_path / f"{n}.png", size=(400 + n, 200)),
+                                             Inches(9), Inches(9))])[0] for n in (1, 2))
+    for name in (old, new):
+        os.utime(image_path(name), (1000, 1000))
+    # Asking for a cached rendition again marks it as used
+    assert prepare_images([ImageRequest(str(tmp_path / "1.png"), Inches(9), Inches(9))]) == [old]
+    freed = os.path.getsize(image_path(new))
+    assert evict_images(os.path.getsize(image_path(old))) == freed
+    assert os.path.exists(image_path(old)) and not os.path.exists(image_path(new))
+
+
+def test_never_upscales(tmp_path):
+    source = _screenshot(tmp_path / "small.png", size=(200, 100))
+    name, = prepare_images([ImageRequest(source, Inches(9), Inches(9))])
+    with Image.open(image_path(name)) as image:
+        assert image.size == (200, 100)
+
+
+def test_palette_images_are_smoothed_and_stay_palette(tmp_path):
+    source = _screenshot(tmp_path / "palette.png", mode="P")
+    name, = prepare_images([ImageRequest(source, Inches(5), Inches(5), 100)])
+    with Image.open(image_path(name)) as image:
+        assert image.mode == "P"
+        # LANCZOS blends stripe edges into colors a NEAREST resize of 16 colors would not have
+        assert len(image.getcolors(256) or ()) > 16
+
+
+def test_insert_image_refreshes_placeholder_map(tmp_path):
+    source = _screenshot(tmp_path / "dash.png")
+    prs = Presentation()
+    slide = add_slide(prs, 8)  # "Picture with Caption"
+    picture = insert_image(slide, 1, source, description="Dashboard")
+    assert placeholder(slide, 1) is picture
+    assert placeholder(slide, 1).width > 0
+    out = io.BytesIO()
+    prs.save(out)
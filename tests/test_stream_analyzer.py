@@ -0,0 +1,40 @@
+from pptx import Presentation
+from brand import VIOLET_1
+from stream_analyzer import analyze_archive, analyze_archives
+
+
+def test_matches_python_pptx(branded_spec, render_deck):
+    path = render_deck(branded_spec, "deck")
+    facts = analyze_archive(path)
+    prs = Presentation(path)
+
+    assert facts["slide_size"] == [prs.slide_width, prs.slide_height]
+    assert [layout["name"] for layout in facts["layouts"]] == [layout.name for layout in prs.slide_layouts]
+    assert len(facts["slides"]) == len(prs.slides)
+    for slide_facts, slide in zip(facts["slides"], prs.slides):
+        assert [shape["name"] for shape in slide_facts["shapes"]] == [shape.name for shape in slide.shapes]
+        assert [shape.get("geometry") for shape in slide_facts["shapes"]] == [
+            [shape.left, shape.top, shape.width, shape.height] for shape in slide.shapes]
+        assert slide_facts["layout"]["name"] == slide.slide_layout.name
+
+
+def test_styles_and_placeholders(branded_spec, render_deck):
+    facts = analyze_archive(render_deck(branded_spec, "deck"))
+    title, content = facts["slides"][:2]
+    assert title["background"] == str(VIOLET_1)
+    assert title["sizes"] == {"24.0": 1, "54.0": 1}
+    # The content slide's title bar: filled violet, title text at 32pt
+    bar = content["shapes"][0]
+    assert (bar["fill"], bar["text"]) == (str(VIOLET_1), "Highlights")
+    assert "32.0" in content["sizes"]
+
+    layout = facts["layouts"][1]
+    assert [shape["placeholder"] for shape in layout["shapes"][:2]] == [
+        {"idx": 0, "type": "title"}, {"idx": 1, "type": "obj"}]
+
+
+def test_many_archives_in_input_order(branded_spec, render_deck):
+    short = render_deck(dict(branded_spec, slides=branded_spec["slides"][:2]), "short")
+    full = render_deck(branded_spec, "full")
+    results = list(analyze_archives([full, short, full], workers=2))
+    assert [len(result["slides"]) for result in results] == [7, 2, 7]
@@ -0,0 +1,50 @@
+import copy
+import os
+import pytest
+from pptx import Presentation
+import stream_build
+from incremental_build import build_incremental
+from stream_build import build_streaming
+
+
+def _large_spec(branded_spec, count):
+    slides = [{"type": "content", "title": f"Slide {n}", "items": [f"Point {n}.{i}" for i in range(5)]}
+              for n in range(count)]
+    return dict(branded_spec, slides=slides + branded_spec["slides"])
+
+
+def test_matches_the_incremental_build(branded_spec, tmp_path):
+    incremental, streamed = str(tmp_path / "inc.pptx"), str(tmp_path / "stream.pptx")
+    build_incremental(copy.deepcopy(branded_spec), incremental)
+    stats = build_streaming(copy.deepcopy(branded_spec), streamed)
+    assert (stats["output"], stats["slides"], stats["workers"]) == (streamed, len(branded_spec["slides"]), 1)
+    with open(incremental, "rb") as a, open(streamed, "rb") as b:
+        assert a.read() == b.read()
+
+
+def test_large_deck_opens_in_order(branded_spec, tmp_path):
+    output = str(tmp_path / "large.pptx")
+    build_streaming(_large_spec(branded_spec, 60), output)
+    prs = Presentation(output)
+    assert len(prs.slides) == 60 + len(branded_spec["slides"])
+    assert [prs.slides[n].shapes[0].text_frame.text for n in (0, 59)] == ["Slide 0", "Slide 59"]
+
+
+def test_failed_build_leaves_no_temporary_file(branded_spec, tmp_path, monkeypatch):
+    def fail(self, fragment):
+        raise RuntimeError("disk full")
+    monkeypatch.setattr(stream_build.PackageWriter, "add_slide", fail)
+    with pytest.raises(RuntimeError):
+        build_streaming(copy.deepcopy(branded_spec), str(tmp_path / "deck.pptx"))
+    assert os.listdir(tmp_path) == []
+
+
+def test_parallel_build_matches_serial(branded_spec, tmp_path, monkeypatch):
+    # Small chunks, so the writer interleaves several workers' results
+    monkeypatch.setattr(stream_build, "MAX_CHUNK", 4)
+    spec = _large_spec(branded_spec, 30)
+    serial, parallel = str(tmp_path / "serial.pptx"), str(tmp_path / "parallel.pptx")
+    build_streaming(copy.deepcopy(spec), serial)
+    assert build_streaming(copy.deepcopy(spec), parallel, workers=2)["workers"] == 2
+    with open(serial, "rb") as a, open(parallel, "rb") as b:
+        assert a.read() == b.read()
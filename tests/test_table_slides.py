@@ -0,0 +1,56 @@
+import io
+import pytest
+from pptx import Presentation
+from deck_spec import SpecError, validate_spec
+from table_slides import add_table, page_breaks, paginate
+
+AREA = (457200, 1371600, 8229600, 5029200)
+
+
+def test_page_breaks():
+    assert page_breaks([1, 1, 1, 1, 1], 2) == [2, 4, 5]
+    # A row taller than a page gets a page of its own
+    assert page_breaks([1, 5, 1], 2) == [1, 2, 3]
+    assert page_breaks([], 2) == [0]
+
+
+def test_paginate_splits_rows_across_pages():
+    rows = [[f"name {n}", n, "a longer description " * (n % 4)] for n in range(80)]
+    table = {"type": "table", "title": "Findings", "columns": ["Name", "Count", "Notes"], "rows": rows}
+    pages = paginate(table, AREA)
+    assert len(pages) > 1
+    assert [page["title"] for page in pages] == [f"Findings ({n}/{len(pages)})" for n in range(1, len(pages) + 1)]
+    assert [row for page in pages for row in page["rows"]] == [[str(cell) for cell in row] for row in rows]
+    for page in pages:
+        assert sum(page["column_widths"]) == AREA[2]
+        assert sum(page["row_heights"]) <= AREA[3]
+        assert len(page["row_heights"]) == len(page["rows"]) + 1
+    # The notes column gets the most room; weights override the measured split
+    widths = pages[0]["column_widths"]
+    assert widths[2] == max(widths)
+    weighted = paginate(dict(table, column_weights=[1, 1, 2]), AREA)[0]["column_widths"]
+    assert weighted[:2] == [AREA[2] // 4] * 2
+
+
+def test_source_table_weights_checked_against_loaded_columns(tmp_path):
+    source = tmp_path / "rows.csv"
+    source.write_text("a,b,c\n1,2,3\n")
+    table = {"type": "table", "title": "T", "source": str(source), "column_weights": [1, 2]}
+    validate_spec({"slides": [table]})
+    with pytest.raises(SpecError, match="2 numbers for 3 columns"):
+        paginate(table, AREA, "Calibri")
+
+
+def test_source_columns_are_selected_and_cells_escaped(tmp_path):
+    source = tmp_path / "rows.csv"
+    source.write_text('a,b,c\n"x & <y>",2,"page\x0cbreak"\n')
+    page, = paginate({"type": "table", "title": "T", "source": str(source), "columns": ["c", "a"]}, AREA)
+    assert (page["columns"], page["rows"]) == (["c", "a"], [["page\x0cbreak", "x & <y>"]])
+
+    prs = Presentation()
+    frame = add_table(prs.slides.add_slide(prs.slide_layouts[6]), page, AREA[0], AREA[1])
+    out = io.BytesIO()
+    prs.save(out)
+    cells = [cell.text for cell in Presentation(out).slides[0].shapes[0].table.rows[1].cells]
+    assert cells == ["page_x000C_break", "x & <y>"]
+    assert frame.name == "Table T"
@@ -0,0 +1,73 @@
+import io
+import zipfile
+from lxml import etree
+from pptx import Presentation
+import opc_zip
+from template_cache import load_template, write_atomic
+
+NS_P14 = "http://schemas.microsoft.com/office/powerpoint/2010/main"
+
+
+def _template_with_section(path):
+    """Save a two-slide template whose slides sit in an "Intro" section"""
+    prs = Presentation()
+    for _ in range(2):
+        prs.slides.add_slide(prs.slide_layouts[1])
+    ids = [sld_id.id for sld_id in prs.slides._sldIdLst]
+    ext_lst = etree.SubElement(prs.part._element, f"{{{opc_zip.NS_P}}}extLst")
+    ext = etree.SubElement(ext_lst, f"{{{opc_zip.NS_P}}}ext", uri=opc_zip.SECTIONS_EXT_URI)
+    section_lst = etree.SubElement(ext, f"{{{NS_P14}}}sectionLst", nsmap={"p14": NS_P14})
+    section = etree.SubElement(section_lst, f"{{{NS_P14}}}section", name="Intro",
+                               id="{00000000-0000-0000-0000-000000000001}")
+    slide_ids = etree.SubElement(section, f"{{{NS_P14}}}sldIdLst")
+    for slide_id in ids:
+        etree.SubElement(slide_ids, f"{{{NS_P14}}}sldId", id=str(slide_id))
+    prs.save(path)
+
+
+def test_empty_template_drops_slides_and_sections(tmp_path):
+    path = str(tmp_path / "template.pptx")
+    _template_with_section(path)
+    assert len(load_template(path).slides) == 2
+
+    prs = load_template(path, empty=True)
+    assert len(prs.slides) == 0
+    prs.slides.add_slide(prs.slide_layouts[1])
+    out = io.BytesIO()
+    prs.save(out)
+    with zipfile.ZipFile(out) as zf:
+        presentation = zf.read(opc_zip.PRESENTATION)
+        assert not any(name.startswith("ppt/slides/slide2") for name in zf.namelist())
+    assert b"sectionLst" not in presentation and b"custShowLst" not in presentation
+
+
+def test_loads_are_independent_copies(tmp_path):
+    path = str(tmp_path / "template.pptx")
+    _template_with_section(path)
+    first = load_template(path, empty=True)
+    first.slides.add_slide(first.slide_layouts[0])
+    assert len(load_template(path, empty=True).slides) == 0
+
+
+def test_write_atomic_bare_file_name(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_atomic("out.bin", b"data")
+    assert (tmp_path / "out.bin").read_bytes() == b"data"
+    assert [path.name for path in tmp_path.iterdir()] == ["out.bin"]
+
+
+def test_memo_keeps_only_the_latest_revision(tmp_path):
+    import os
+    import template_cache
+    path = str(tmp_path / "template.pptx")
+    _template_with_section(path)
+    assert len(load_template(path).slides) == 2
+
+    prs = Presentation(path)
+    prs.slides.add_slide(prs.slide_layouts[1])
+    prs.save(path)
+    os.utime(path, ns=(1, 1))
+    assert len(load_template(path).slides) == 3
+    entries = [key for key in template_cache._parsed_memo if key[0] == os.path.abspath(path)]
+    assert entries == [(os.path.abspath(path), "full")]
+    assert len([key for key in template_cache._snapshot_memo if key[0] == os.path.abspath(path)]) == 1
@@ -0,0 +1,44 @@
+import json
+import os
+import pickle
+import pytest
+from pptx import Presentation
+import template_manifest
+from template_manifest import LayoutNotFoundError, layout_index, load_manifest, manifest_path
+
+
+@pytest.fixture
+def template(tmp_path):
+    path = str(tmp_path / "template.pptx")
+    Presentation().save(path)
+    return path
+
+
+def test_manifest_describes_the_template(template):
+    manifest = load_manifest(template)
+    prs = Presentation(template)
+    assert manifest["template"] == os.path.abspath(template)
+    assert (manifest["slide_width"], manifest["slide_height"]) == (prs.slide_width, prs.slide_height)
+    assert [layout["name"] for layout in manifest["layouts"]] == [layout.name for layout in prs.slide_layouts]
+    title = manifest["layouts"][0]["placeholders"][0]
+    assert (title["idx"], title["type"]) == (0, "CENTER_TITLE")
+    assert manifest["theme"]["fonts"] == {"major": "Calibri", "minor": "Calibri"}
+
+
+def test_manifest_is_cached_on_disk(template, monkeypatch):
+    manifest = load_manifest(template)
+    with open(manifest_path(manifest["sha256"]), encoding="utf-8") as f:
+        assert json.load(f) == manifest
+    # A new process reads the file instead of opening the template
+    template_manifest._manifest_memo.clear()
+    monkeypatch.setattr(template_manifest, "build_manifest", None)
+    assert load_manifest(template) == manifest
+
+
+def test_layout_index(template):
+    assert layout_index("title and content", template) == 1
+    assert layout_index("  Blank ", template) == 6
+    with pytest.raises(LayoutNotFoundError, match="no layout named 'Nope'") as raised:
+        layout_index("Nope", template)
+    assert "Title Slide" in raised.value.available
+    assert str(pickle.loads(pickle.dumps(raised.value))) == str(raised.value)
@@ -0,0 +1,47 @@
+import io
+from pptx import Presentation
+from pptx.util import Inches
+from brand import bullet_style
+from text_body import fill_bullets, fill_paragraphs, set_styled_text
+
+
+def _text_frame():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    return prs, slide.shapes.add_textbox(0, 0, Inches(4), Inches(2)).text_frame
+
+
+def _reopened(prs):
+    out = io.BytesIO()
+    prs.save(out)
+    out.seek(0)
+    return Presentation(out).slides[0].shapes[0].text_frame
+
+
+def test_bullets_levels_and_line_breaks():
+    prs, frame = _text_frame()
+    fill_bullets(frame, ["One & <two>", "   • Sub", "First\nSecond"], bullet_style(18), sub_prefix="   •")
+    paragraphs = _reopened(prs).paragraphs[1:]
+    assert [p.level for p in paragraphs] == [0, 1, 0]
+    assert paragraphs[0].text == "One & <two>"
+    assert paragraphs[2].text == "First\vSecond"
+    assert frame._txBody.find("{*}lstStyle/{*}lvl2pPr/{*}defRPr").get("sz") == "1600"
+
+
+def test_control_characters_are_escaped_like_python_pptx():
+    text = "Tab\there\x0bvtab\x0cform\x01bell"
+    prs, frame = _text_frame()
+    fill_paragraphs(frame, [(0, text), (1, "")], bullet_style(18))
+    run = _reopened(prs).paragraphs[0].runs[0]
+
+    _, expected = _text_frame()
+    expected.paragraphs[0].add_run().text = text
+    assert run.text == expected.paragraphs[0].runs[0].text
+    assert "_x000C_" in frame._txBody.xml
+
+
+def test_styled_text_splits_paragraphs():
+    _, frame = _text_frame()
+    set_styled_text(frame, "Line one\nLine two", bullet_style(20))
+    assert [p.text for p in frame.paragraphs] == ["Line one", "Line two"]
+    assert frame._txBody.find("{*}lstStyle/{*}lvl1pPr/{*}defRPr").get("sz") == "2000"
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import text_fit
+from text_fit import TextFrame, fit_font_sizes, fit_slides, text_widths, wrapped_lines
+
+INCH = 914400
+TABLE = text_fit.glyph_advances()
+
+
+def test_text_widths():
+    widths = text_widths(["AB", "", "a\u200bb", "\U0001f512", "x\ufe0f"], TABLE)
+    assert widths.tolist() == pytest.approx([1.334, 0.0, 1.112, 1.0, 0.5])
+
+
+def test_wrapped_lines():
+    long = "word " * 40
+    lines = wrapped_lines(["short", "one\ntwo\nthree", long, long], [4 * INCH] * 3 + [8 * INCH], 18)
+    assert lines[:2].tolist() == [1, 3]
+    assert lines[2] > lines[3] > 1
+
+
+def test_fit_font_sizes():
+    few = TextFrame(["One", "Two"], 9 * INCH, 5 * INCH)
+    many = TextFrame([f"Bullet {n} with a fair amount of text to wrap" for n in range(14)], 9 * INCH, 5 * INCH)
+    too_many = TextFrame(["x " * 200] * 30, 4 * INCH, 2 * INCH)
+    sizes = fit_font_sizes([few, many, too_many])
+    assert sizes[0] == text_fit.MAX_FONT_SIZE
+    assert text_fit.MIN_FONT_SIZE < sizes[1] < text_fit.MAX_FONT_SIZE
+    assert sizes[2] == text_fit.MIN_FONT_SIZE
+    assert fit_font_sizes([few], max_sizes=[18]).tolist() == [18]
+    # Sub-bullets are drawn smaller, so the same text fits at a larger size
+    sub = many._replace(items=["   • " + item for item in many.items], sub_prefix="   •")
+    assert fit_font_sizes([sub])[0] >= sizes[1]
+
+
+def test_fit_slides_shares_one_size_per_slide():
+    roomy = TextFrame(["One"], 4 * INCH, 5 * INCH)
+    crowded = TextFrame([f"Point {n} that needs a line of its own" for n in range(12)], 4 * INCH, 5 * INCH)
+    slides = [{"frames": [roomy, crowded]}, {"frames": [roomy], "max_font_size": 20}, {"frames": [], "font_size": "auto"}]
+    fit_slides(slides, lambda slide: slide["frames"])
+    assert slides[0]["font_size"] == fit_font_sizes([crowded])[0]
+    assert slides[1]["font_size"] == 20
+    assert "font_size" not in slides[2]
+
+
+def test_font_lookup_and_unreadable_font(tmp_path, monkeypatch):
+    for name in ("Brand Sans.ttf", "BrandSans-Bold.ttf"):
+        (tmp_path / name).write_bytes(b"not a font")
+    monkeypatch.setattr(text_fit, "FONT_DIRS", [str(tmp_path)])
+    text_fit._font_files.cache_clear()
+    text_fit.glyph_advances.cache_clear()
+    try:
+        assert text_fit.find_font_file("Brand Sans") == str(tmp_path / "Brand Sans.ttf")
+        assert text_fit.find_font_file("brand_sans", bold=True) == str(tmp_path / "BrandSans-Bold.ttf")
+        assert text_fit.find_font_file("Other") is None
+        # A file Pillow cannot read falls back to the built-in Helvetica widths
+        assert np.array_equal(text_fit.glyph_advances("Brand Sans"), TABLE)
+    finally:
+        text_fit._font_files.cache_clear()
+        text_fit.glyph_advances.cache_clear()
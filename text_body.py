@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Fast text-body construction
+Builds every paragraph of a bullet list as one XML fragment instead of one proxy call per attribute
+"""
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from functools import lru_cache
+from xml.sax.saxutils import escape
+import re
+from profiling import profiled
+
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+# Control characters XML cannot hold (tab and newline can), written as _xHHHH_ like python-pptx's run.text does
+_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+
+def _level_xml(level, style):
+    """Return the <a:lvlNpPr> markup for one list-style level"""
+    align = f' algn="{style.align}"' if style.align else ""
+    spacing = f'<a:spcBef><a:spcPts val="{int(style.space_before * 100)}"/></a:spcBef>' if style.space_before is not None else ""
+    size = f' sz="{int(style.size * 100)}"' if style.size is not None else ""
+    bold = f' b="{int(style.bold)}"' if style.bold is not None else ""
+    fill = f'<a:solidFill><a:srgbClr val="{style.color}"/></a:solidFill>' if style.color is not None else ""
+    default_run = f"<a:defRPr{size}{bold}>{fill}</a:defRPr>" if fill else f"<a:defRPr{size}{bold}/>"
+    tag = f"a:lvl{level + 1}pPr"
+    return f"<{tag}{align}>{spacing}{default_run}</{tag}>"
+
+
+@lru_cache(maxsize=None)
+def _list_style_xml(levels):
+    """Return <a:lstStyle> markup for a tuple of (level, TextStyle) pairs"""
+    body = "".join(_level_xml(level, style) for level, style in levels)
+    return f'<a:lstStyle xmlns:a="{NS_A}">{body}</a:lstStyle>'
+
+
+def apply_style(text_frame, style):
+    """Register a {level: TextStyle} style on a text body so its paragraphs inherit it"""
+    txBody = text_frame._txBody
+    lst_style = parse_xml(_list_style_xml(tuple(sorted(style.items()))))
+    existing = txBody.find(qn("a:lstStyle"))
+    if existing is not None:
+        txBody.replace(existing, lst_style)
+    else:
+        txBody.find(qn("a:bodyPr")).addnext(lst_style)
+    return text_frame
+
+
+@profiled("text_style")
+def set_styled_text(text_frame, text, style):
+    """Set a text frame's text and style it through its list style only"""
+    text_frame.text = text
+    return apply_style(text_frame, style)
+
+
+def escape_text(text):
+    """Escape text for an <a:t> element, control characters included"""
+    return escape(_CONTROL_CHARS.sub(lambda match: f"_x{ord(match.group()):04X}_", text))
+
+
+def _runs_xml(text):
+    """Return run markup for text, turning newlines into line breaks"""
+    if not text:
+        return ""
+    return "<a:br/>".join(f"<a:r><a:t>{escape_text(line)}</a:t></a:r>" if line else "" for line in text.split("\n"))
+
+
+def bullets_xml(items, sub_prefix=None):
+    """Return the <a:p> markup for a bullet list
+
+    Items starting with sub_prefix become level-1 paragraphs; all formatting
+    comes from the text body's list style.
+    """
+    parts = []
+    for item in items:
+        ppr = '<a:pPr lvl="1"/>' if sub_prefix and item.startswith(sub_prefix) else ""
+        parts.append(f"<a:p>{ppr}{_runs_xml(item)}</a:p>")
+    return "".join(parts)
+
+
+def paragraphs_xml(paragraphs):
+    """Return the <a:p> markup for (level, text) pairs"""
+    return "".join(f'<a:p><a:pPr lvl="{level}"/>{_runs_xml(text)}</a:p>' if level else f"<a:p>{_runs_xml(text)}</a:p>"
+                   for level, text in paragraphs)
+
+
+@profiled("text_style")
+def fill_bullets(text_frame, items, style=None, sub_prefix=None):
+    """Clear a text frame and append all bullet paragraphs in a single parse"""
+    text_frame.clear()
+    if style is not None:
+        apply_style(text_frame, style)
+    fragment = parse_xml(f'<a:txBody xmlns:a="{NS_A}">{bullets_xml(items, sub_prefix)}</a:txBody>')
+    text_frame._txBody.extend(list(fragment))
+    return text_frame
+
+
+@profiled("text_style")
+def fill_paragraphs(text_frame, paragraphs, style):
+    """Replace a text frame's paragraphs with (level, text) pairs styled per level"""
+    txBody = text_frame._txBody
+    for p in txBody.p_lst:
+        txBody.remove(p)
+    apply_style(text_frame, style)
+    fragment = parse_xml(f'<a:txBody xmlns:a="{NS_A}">{paragraphs_xml(paragraphs)}</a:txBody>')
+    txBody.extend(list(fragment))
+    return text_frame
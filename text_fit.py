@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Automatic text fitting from cached glyph-advance tables
+Picks the largest font size whose bullets fit their frame, measured for every frame of a deck at once
+
+Usage: python text_fit.py SPEC
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+import argparse
+import io
+import os
+import re
+import numpy as np
+from template_cache import CACHE_DIR, file_sha256, write_atomic
+
+METRICS_DIR = os.path.join(CACHE_DIR, "metrics")
+METRICS_VERSION = 1
+
+# Directories searched for brand font files; HRD_PPTX_FONT_DIRS (os.pathsep-separated) comes first
+FONT_DIRS = [
+    *filter(None, os.environ.get("HRD_PPTX_FONT_DIRS", "").split(os.pathsep)),
+    os.path.expanduser("~/.fonts"),
+    os.path.expanduser("~/.local/share/fonts"),
+    os.path.expanduser("~/Library/Fonts"),
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+]
+FONT_EXTENSIONS = (".ttf", ".otf", ".ttc")
+
+# Code points covered by a table: Latin, Greek, Cyrillic, general punctuation, arrows, math symbols
+TABLE_SIZE = 0x2400
+# Anything past the table (emoji, CJK) is measured as a full em, which errs toward smaller text
+FALLBACK_ADVANCE = 1000
+# Zero-width spaces and joiners draw nothing (as do variation selectors U+FE00..U+FE0F, past the table)
+ZERO_WIDTH = (0x200B, 0x200C, 0x200D, 0x2060)
+VARIATION_SELECTORS = (0xFE00, 0xFE10)
+
+# Helvetica advance widths (1/1000 em) for U+0020..U+007E from the Adobe AFM; used without a font file
+HELVETICA_ASCII = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+HELVETICA_DEFAULT = 556
+
+# Layout model: line box height per point of font size, and the frame's default insets (pt)
+LINE_SPACING = 1.2
+INSET_X = 14.4
+INSET_Y = 7.2
+# Greedy word wrap leaves a ragged right edge, so lines hold a little less than their width
+WRAP_SLACK = 1.08
+EMU_PER_PT = 12700
+
+MAX_FONT_SIZE = 24
+MIN_FONT_SIZE = 10
+
+# items: paragraph strings; width/height: frame size in EMU; sub_prefix: items starting with it are
+# level-1 paragraphs drawn sub_delta points smaller; space_before: points above each paragraph
+TextFrame = namedtuple("TextFrame", "items width height sub_prefix sub_delta space_before",
+                       defaults=(None, 2, 6))
+
+
+@lru_cache(maxsize=None)
+def _font_files():
+    """Return {normalized stem: path} for every font file under FONT_DIRS"""
+    found = {}
+    for root_dir in FONT_DIRS:
+        for root, _, files in os.walk(root_dir):
+            for name in files:
+                stem, ext = os.path.splitext(name)
+                if ext.lower() in FONT_EXTENSIONS:
+                    found.setdefault(re.sub(r"[\s_-]", "", stem).lower(), os.path.join(root, name))
+    return found
+
+
+def find_font_file(family, bold=False):
+    """Return the path of a font file for a family name, or None"""
+    files = _font_files()
+    key = re.sub(r"[\s_-]", "", family).lower()
+    suffixes = ("bold", "bd", "b") if bold else ("", "regular", "r")
+    for suffix in suffixes:
+        if key + suffix in files:
+            return files[key + suffix]
+    return None
+
+
+def helvetica_advances():
+    """Return the built-in Helvetica advance table"""
+    table = np.full(TABLE_SIZE, HELVETICA_DEFAULT, dtype=np.float32)
+    table[0x20:0x7F] = HELVETICA_ASCII
+    table[:0x20] = 0
+    table[0xA0] = table[0x20]
+    return table
+
+
+def _zero_width(table):
+    table[list(ZERO_WIDTH)] = 0
+    return table
+
+
+def _measure_font(path):
+    """Build an advance table from a font file with Pillow (at 1000 px per em)"""
+    from PIL import ImageFont
+    font = ImageFont.truetype(path, 1000)
+    table = np.zeros(TABLE_SIZE, dtype=np.float32)
+    for code in range(0x20, TABLE_SIZE):
+        if not 0xD800 <= code <= 0xDFFF:
+            table[code] = font.getlength(chr(code))
+    return table
+
+
+@lru_cache(maxsize=None)
+def glyph_advances(family=None, bold=False):
+    """Return a float32 array of advance widths (1/1000 em) indexed by code point
+
+    Tables measured from font files are cached on disk by the font file's hash; without the
+    font (or without Pillow) the Helvetica table stands in, which is close to Arial/Calibri widths.
+    """
+    path = find_font_file(family, bold) if family else None
+    if path is None:
+        return _zero_width(helvetica_advances())
+    cached = os.path.join(METRICS_DIR, f"{file_sha256(path)}.v{METRICS_VERSION}.npy")
+    if os.path.exists(cached):
+        return np.load(cached)
+    try:
+        table = _measure_font(path)
+    except (ImportError, OSError):
+        return _zero_width(helvetica_advances())
+    _zero_width(table)
+    out = io.BytesIO()
+    np.save(out, table)
+    write_atomic(cached, out.getvalue())
+    return table
+
+
+def text_widths(texts, table):
+    """Return the advance width of each string in em, measured in one pass over all of them"""
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    codes = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32)
+    advances = np.where(codes < TABLE_SIZE, table[np.minimum(codes, TABLE_SIZE - 1)], FALLBACK_ADVANCE)
+    advances[(codes >= VARIATION_SELECTORS[0]) & (codes < VARIATION_SELECTORS[1])] = 0
+    totals = np.concatenate(([0.0], np.cumsum(advances, dtype=np.float64)))
+    ends = np.cumsum(lengths)
+    return (totals[ends] - totals[ends - lengths]) / 1000
+
+
+def wrapped_lines(texts, widths, size, family=None):
+    """Return how many lines each text wraps to at one point size, given each frame's inner width in EMU
+
+    Newlines in a text start new lines; all texts are measured in one pass.
+    """
+    segments, owner = [], []
+    for number, text in enumerate(texts):
+        for segment in text.split("\n"):
+            segments.append(segment)
+            owner.append(number)
+    owner = np.asarray(owner, dtype=np.int64)
+    widths = np.maximum(np.asarray(widths, dtype=np.float64) / EMU_PER_PT, 1)
+    ems = text_widths(segments, glyph_advances(family)) * size * WRAP_SLACK
+    lines = np.zeros(len(texts))
+    np.add.at(lines, owner, np.maximum(np.ceil(ems / widths[owner]), 1))
+    return lines.astype(np.int64)
+
+
+def fit_font_sizes(frames, family=None, max_size=MAX_FONT_SIZE, min_size=MIN_FONT_SIZE, max_sizes=None):
+    """Return, per frame, the largest whole point size from max_size down to min_size that fits
+
+    Frames whose text does not fit even at min_size get min_size. max_sizes optionally caps
+    each frame individually.
+    """
+    if not frames:
+        return np.zeros(0, dtype=np.int64)
+    table = glyph_advances(family)
+    texts, owner, delta = [], [], []
+    for number, frame in enumerate(frames):
+        for item in frame.items:
+            sub = bool(frame.sub_prefix) and item.startswith(frame.sub_prefix)
+            texts.append(item)
+            owner.append(number)
+            delta.append(frame.sub_delta if sub else 0)
+    owner = np.asarray(owner, dtype=np.int64)
+
+    sizes = np.arange(max_size, min_size - 1, -1, dtype=np.float64)                 # (S,)
+    point_sizes = np.maximum(sizes[None, :] - np.asarray(delta, dtype=np.float64)[:, None], 1)  # (P, S)
+    widths = np.array([frame.width for frame in frames], dtype=np.float64) / EMU_PER_PT - INSET_X
+    heights = np.array([frame.height for frame in frames], dtype=np.float64) / EMU_PER_PT - INSET_Y
+    space = np.array([frame.space_before for frame in frames], dtype=np.float64)
+
+    ems = text_widths(texts, table)[:, None] * point_sizes * WRAP_SLACK
+    lines = np.maximum(np.ceil(ems / np.maximum(widths[owner], 1)[:, None]), 1)
+    paragraph_heights = lines * point_sizes * LINE_SPACING + space[owner][:, None]
+
+    totals = np.zeros((len(frames), len(sizes)))
+    np.add.at(totals, owner, paragraph_heights)
+    fits = totals <= heights[:, None]
+    if max_sizes is not None:
+        fits &= sizes[None, :] <= np.asarray(max_sizes, dtype=np.float64)[:, None]
+    # Sizes run largest first, so the first fitting column is the answer
+    first = np.where(fits.any(axis=1), fits.argmax(axis=1), len(sizes) - 1)
+    return sizes[first].astype(np.int64)
+
+
+def fit_slides(slides, frames_for, family=None):
+    """Set font_size on each slide spec to the largest size at which all its body frames fit
+
+    frames_for(slide_spec) returns the slide's TextFrames; every frame on a slide shares one size.
+    A slide may cap its size with max_font_size. Slides without measurable frames lose their
+    font_size so the renderer's default applies.
+    """
+    frames, owners, caps = [], [], []
+    for number, slide in enumerate(slides):
+        for frame in frames_for(slide):
+            frames.append(frame)
+            owners.append(number)
+            caps.append(slide.get("max_font_size", MAX_FONT_SIZE))
+    sizes = fit_font_sizes(frames, family, max_size=max(caps, default=MAX_FONT_SIZE), max_sizes=caps)
+    best = np.full(len(slides), max(caps, default=MAX_FONT_SIZE), dtype=np.int64)
+    np.minimum.at(best, np.asarray(owners, dtype=np.int64), sizes)
+    fitted = set(owners)
+    for number, (slide, size) in enumerate(zip(slides, best)):
+        if number in fitted:
+            slide["font_size"] = int(size)
+        else:
+            slide.pop("font_size", None)
+    return slides
+
+
+def main():
+    import deck_spec
+    parser = argparse.ArgumentParser(description="Show the auto-fitted body font size of every slide in a spec")
+    parser.add_argument("spec")
+    args = parser.parse_args()
+
+    spec = deck_spec.load_spec(args.spec)
+    original = [slide.get("font_size") for slide in spec["slides"]]
+    for slide in spec["slides"]:
+        if slide["type"] in ("content", "two_column"):
+            slide["font_size"] = deck_spec.AUTO_SIZE
+    deck_spec.resolve_font_sizes(spec)
+    for number, (slide, before) in enumerate(zip(spec["slides"], original), 1):
+        if slide["type"] in ("content", "two_column"):
+            print(f"🔤 slide {number:>3} {slide['title'][:40]:<40} {before or '-':>4} -> {slide['font_size']}pt")
+
+
+if __name__ == "__main__":
+    main()